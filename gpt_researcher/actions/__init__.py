@@ -1,4 +1,4 @@
-from .retriever import get_retriever, get_retrievers
+from .retriever import fuse_results, get_retriever, get_retrievers, hedged_search, search_all, search_query, search_with
 from .query_processing import plan_research_outline, get_search_results
 from .agent_creator import extract_json_with_regex, choose_agent
 from .web_scraping import scrape_urls
@@ -7,8 +7,13 @@ from .markdown_processing import extract_headers, extract_sections, table_of_con
 from .utils import stream_output
 
 __all__ = [
+    "fuse_results",
     "get_retriever",
     "get_retrievers",
+    "hedged_search",
+    "search_all",
+    "search_query",
+    "search_with",
     "get_search_results",
     "plan_research_outline",
     "extract_json_with_regex",
@@ -5,23 +5,43 @@ from ..utils.llm import create_chat_completion
 from ..prompts import generate_search_queries_prompt
 from typing import Any, List, Dict
 from ..config import Config
+from .retriever import search_query
+from ..retrievers.cache import SearchCache
+from ..utils.http_client import HTTPClient
 import logging
 
 logger = logging.getLogger(__name__)
 
-async def get_search_results(query: str, retriever: Any, query_domains: List[str] = None) -> List[Dict[str, Any]]:
+async def get_search_results(
+    query: str,
+    retriever: Any,
+    query_domains: List[str] = None,
+    search_cache: SearchCache = None,
+    http_client: HTTPClient = None,
+    retriever_kwargs: Dict[str, Any] = None,
+) -> List[Dict[str, Any]]:
     """
     Get web search results for a given query.
 
     Args:
         query: The search query
         retriever: The retriever instance
+        query_domains: Domains to restrict the search to
+        search_cache: Persistent cache of search results (optional)
+        http_client: Shared pooled client for retrievers that search asynchronously (optional)
+        retriever_kwargs: Extra arguments the retriever is created with (optional)
 
     Returns:
         A list of search results
     """
-    search_retriever = retriever(query, query_domains=query_domains)
-    return search_retriever.search()
+    return await search_query(
+        retriever,
+        query,
+        query_domains,
+        http_client=http_client,
+        search_cache=search_cache,
+        retriever_kwargs=retriever_kwargs,
+    )
 
 async def generate_sub_queries(
     query: str,
@@ -1,4 +1,16 @@
+import asyncio
+import bisect
+import functools
+import logging
+import time
+
 from ..config.config import Config
+from ..retrievers.cache import SearchCache
+from ..retrievers.utils import get_all_retriever_names
+from ..utils.http_client import HTTPClient
+from ..utils.urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
 
 def get_retriever(retriever: str):
     """
@@ -59,6 +71,10 @@ def get_retriever(retriever: str):
             from gpt_researcher.retrievers import PubMedCentralSearch
 
             return PubMedCentralSearch
+        case "local_bm25":
+            from gpt_researcher.retrievers import LocalBM25Search
+
+            return LocalBM25Search
         case "custom":
             from gpt_researcher.retrievers import CustomRetriever
 
@@ -100,7 +116,360 @@ def get_retrievers(headers: dict[str, str], cfg: Config):
     return [get_retriever(r) or get_default_retriever() for r in retrievers]
 
 
+@functools.cache
+def get_retriever_name(retriever_class) -> str:
+    """
+    Gets the configuration name of a retriever class (e.g. "tavily"), or its class name for
+    retrievers that are not built in
+    """
+    for name in get_all_retriever_names():
+        if get_retriever(name) is retriever_class:
+            return name
+    return retriever_class.__name__
+
+
 def get_default_retriever():
     from gpt_researcher.retrievers import TavilySearch
 
-    return TavilySearch
\ No newline at end of file
+    return TavilySearch
+
+
+def fuse_results(
+    result_lists: list[list[dict]], weights: list[float] | None = None, k: int = 60
+) -> list[str]:
+    """
+    Merges the results of several retrievers with weighted reciprocal rank fusion.
+
+    A URL scores the sum of `weight / (k + rank)` over the retrievers that returned it, ranks
+    starting at 1, so URLs ranked first by one retriever or returned by several come first.
+    URLs are compared on their canonical form.
+
+    Args:
+        result_lists (list): The results of each retriever, best first
+        weights (list, optional): The weight of each retriever, 1 for all if None
+        k (int): Damping constant; larger values flatten the advantage of top ranks
+
+    Returns:
+        list: The URLs by decreasing score, ties in retriever then rank order
+    """
+    scores: dict[str, float] = {}
+    urls: dict[str, str] = {}
+    for index, results in enumerate(result_lists):
+        weight = weights[index] if weights else 1.0
+        seen = set()
+        for rank, result in enumerate(results, start=1):
+            url = result.get("href")
+            if not url:
+                continue
+            key = canonicalize_url(url)
+            # A retriever returning a page twice only counts its best rank
+            if key in seen:
+                continue
+            seen.add(key)
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank)
+            urls.setdefault(key, url)
+    return [urls[key] for key in sorted(scores, key=scores.get, reverse=True)]
+
+
+class LatencyHistogram:
+    """
+    Histogram of search latencies over log-spaced buckets, from 50ms to about two minutes.
+
+    Counts are halved once they reach `max_samples`, so the histogram follows the recent
+    behaviour of a search API rather than its whole history.
+    """
+
+    BOUNDS = [0.05 * 1.25 ** i for i in range(36)]
+
+    def __init__(self, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.total = 0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+        self.total += 1
+        if self.total >= self.max_samples:
+            self.counts = [count // 2 for count in self.counts]
+            self.total = sum(self.counts)
+
+    def quantile(self, q: float) -> float | None:
+        """Returns the upper bound of the bucket holding the `q` quantile, or None if empty."""
+        if not self.total:
+            return None
+        threshold = q * self.total
+        cumulative = 0
+        for bound, count in zip(self.BOUNDS, self.counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return bound
+        return self.BOUNDS[-1]
+
+
+class LatencyTracker:
+    """Latency histograms of the retrievers, by retriever name, which set the delay of hedged searches."""
+
+    def __init__(self, min_samples: int = 5, default_delay: float = 2.0):
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.histograms: dict[str, LatencyHistogram] = {}
+
+    def record(self, retriever: str, seconds: float) -> None:
+        self.histograms.setdefault(retriever, LatencyHistogram()).record(seconds)
+
+    def hedge_delay(self, retriever: str, quantile: float = 0.9) -> float:
+        """
+        Returns how long to wait for the retriever before hedging: the `quantile` of its
+        latencies, or `default_delay` until it has `min_samples` samples.
+        """
+        histogram = self.histograms.get(retriever)
+        if histogram is None or histogram.total < self.min_samples:
+            return self.default_delay
+        return histogram.quantile(quantile)
+
+
+# Shared by all researches of the process, so that the histograms fill up across researches
+retriever_latencies = LatencyTracker()
+
+
+class PlanningSearch:
+    """
+    The results of the search made to plan a research, carried into the research phase so that
+    searching the research query itself reuses them instead of sending the query again.
+    """
+
+    def __init__(self, retriever_class, query: str, query_domains: list[str] | None, results: list[dict]):
+        self.retriever_class = retriever_class
+        self.query = query
+        self.query_domains = sorted(query_domains or [])
+        self.results = results
+
+    def results_for(
+        self,
+        retriever_class,
+        query: str,
+        query_domains: list[str] | None = None,
+        max_results: int | None = None,
+    ) -> list[dict] | None:
+        """
+        Returns the top `max_results` planning results if they answer the same search, or None
+        if the search has to be made (including when the planning search found nothing).
+        """
+        if (
+            not self.results
+            or retriever_class is not self.retriever_class
+            or query != self.query
+            or sorted(query_domains or []) != self.query_domains
+        ):
+            return None
+        return self.results[:max_results] if max_results else self.results
+
+
+async def search_with(retriever, max_results: int | None = None, http_client: HTTPClient | None = None) -> list[dict]:
+    """
+    Runs a search with a retriever instance, natively when it has an `asearch` method and in a
+    worker thread otherwise.
+
+    Args:
+        retriever: The retriever instance
+        max_results (int, optional): Maximum number of results, the retriever's default if None
+        http_client (HTTPClient, optional): Shared pooled client for retrievers with `asearch`
+
+    Returns:
+        list: The search results
+    """
+    kwargs = {"max_results": max_results} if max_results is not None else {}
+    if hasattr(retriever, "asearch"):
+        results = await retriever.asearch(http_client=http_client, **kwargs)
+    else:
+        results = await asyncio.to_thread(retriever.search, **kwargs)
+    # Some retrievers return None when the search fails
+    return results or []
+
+
+async def search_query(
+    retriever_class,
+    query: str,
+    query_domains: list[str] | None = None,
+    max_results: int | None = None,
+    http_client: HTTPClient | None = None,
+    search_cache: SearchCache | None = None,
+    retriever_kwargs: dict | None = None,
+) -> list[dict]:
+    """
+    Searches the query with a retriever class, serving repeated searches from the cache.
+
+    Args:
+        retriever_class: The retriever class to search with
+        query (str): The search query
+        query_domains (list, optional): Domains to restrict the search to
+        max_results (int, optional): Maximum number of results, the retriever's default if None
+        http_client (HTTPClient, optional): Shared pooled client for retrievers with `asearch`
+        search_cache (SearchCache, optional): Persistent cache of search results
+        retriever_kwargs (dict, optional): Extra arguments the retriever is created with
+
+    Returns:
+        list: The search results
+    """
+    name = get_retriever_name(retriever_class)
+    if not getattr(retriever_class, "cacheable", True):
+        search_cache = None
+    if search_cache:
+        cached = await asyncio.to_thread(search_cache.get, name, query, query_domains, max_results)
+        if cached is not None:
+            logger.info(f"Search cache hit for {name}: {query}")
+            return cached
+
+    retriever = retriever_class(query, query_domains=query_domains, **(retriever_kwargs or {}))
+    started = time.monotonic()
+    try:
+        results = await search_with(retriever, max_results, http_client)
+    except asyncio.CancelledError:
+        # A search cancelled by a hedge took at least this long; leaving it out would hide slow searches
+        retriever_latencies.record(name, time.monotonic() - started)
+        raise
+    retriever_latencies.record(name, time.monotonic() - started)
+    # Empty results are usually failed searches, which should be retried
+    if search_cache and results:
+        await asyncio.to_thread(search_cache.put, name, query, results, query_domains, max_results)
+    return results
+
+
+async def search_all(
+    retrievers: list,
+    query: str,
+    query_domains: list[str] | None = None,
+    max_results: int | None = None,
+    http_client: HTTPClient | None = None,
+    timeout: float | None = None,
+    search_cache: SearchCache | None = None,
+) -> list[list[dict]]:
+    """
+    Searches the query with every retriever concurrently.
+
+    Args:
+        retrievers (list): The retriever classes to search with
+        query (str): The search query
+        query_domains (list, optional): Domains to restrict the search to
+        max_results (int, optional): Maximum number of results per retriever
+        http_client (HTTPClient, optional): Shared pooled client for retrievers with `asearch`
+        timeout (float, optional): Seconds after which a retriever is given up on
+        search_cache (SearchCache, optional): Persistent cache of search results
+
+    Returns:
+        list: The results of each retriever, in the order of `retrievers`. A retriever that fails
+        or times out contributes an empty list.
+    """
+    async def search(retriever_class) -> list[dict]:
+        try:
+            return await asyncio.wait_for(
+                search_query(
+                    retriever_class, query, query_domains, max_results, http_client, search_cache
+                ),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            # A retriever without `asearch` keeps running in its thread, but is no longer awaited
+            logger.warning(f"{retriever_class.__name__} timed out after {timeout}s")
+        except Exception as e:
+            logger.error(f"{retriever_class.__name__} failed: {e}")
+        return []
+
+    return list(await asyncio.gather(*(search(retriever_class) for retriever_class in retrievers)))
+
+
+async def hedged_search(
+    retrievers: list,
+    query: str,
+    query_domains: list[str] | None = None,
+    max_results: int | None = None,
+    http_client: HTTPClient | None = None,
+    timeout: float | None = None,
+    search_cache: SearchCache | None = None,
+    hedge_delay: float | None = None,
+    quantile: float = 0.9,
+) -> list[list[dict]]:
+    """
+    Searches the query with the first retriever, hedging with the next ones.
+
+    When a retriever has not answered within the hedge delay, or fails, the query is also sent
+    to the next retriever. The first non-empty results are kept and the searches still running
+    are cancelled, so a slow search API delays a query by about the hedge delay at most.
+    Args:
+        retrievers (list): The retriever classes, primary first
+        query (str): The search query
+        query_domains (list, optional): Domains to restrict the search to
+        max_results (int, optional): Maximum number of results per retriever
+        http_client (HTTPClient, optional): Shared pooled client for retrievers with `asearch`
+        timeout (float, optional): Seconds after which the search is given up on
+        search_cache (SearchCache, optional): Persistent cache of search results
+        hedge_delay (float, optional): Seconds to wait before hedging; if None, the `quantile`
+            of the latencies of the retriever waited on (see `LatencyTracker`)
+        quantile (float): Latency quantile used as hedge delay
+    Returns:
+        list: The results of each retriever, in the order of `retrievers`, empty for all but the
+        retriever that answered first
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout else None
+    results = [[] for _ in retrievers]
+    pending: dict[asyncio.Task, int] = {}
+
+    def start(index: int) -> None:
+        task = asyncio.create_task(
+            search_query(retrievers[index], query, query_domains, max_results, http_client, search_cache)
+        )
+        pending[task] = index
+
+    next_index = 0
+    try:
+        while pending or next_index < len(retrievers):
+            if not pending:
+                start(next_index)
+                next_index += 1
+
+            wait = None
+            if next_index < len(retrievers):
+                last_started = get_retriever_name(retrievers[next_index - 1])
+                wait = hedge_delay if hedge_delay is not None else retriever_latencies.hedge_delay(
+                    last_started, quantile
+                )
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    logger.warning(f"Search timed out after {timeout}s: {query}")
+                    break
+                wait = remaining if wait is None else min(wait, remaining)
+
+            done, _ = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                if deadline is not None and loop.time() >= deadline:
+                    logger.warning(f"Search timed out after {timeout}s: {query}")
+                    break
+                if next_index >= len(retrievers):
+                    # Woken just before the deadline with every retriever started: keep waiting
+                    continue
+                logger.info(f"Hedging the search with {retrievers[next_index].__name__}: {query}")
+                start(next_index)
+                next_index += 1
+                continue
+
+            for task in done:
+                index = pending.pop(task)
+                try:
+                    task_results = task.result()
+                except Exception as e:
+                    logger.error(f"{retrievers[index].__name__} failed: {e}")
+                    continue
+                if task_results:
+                    results[index] = task_results
+                    return results
+            # The searches that finished found nothing, so the next retriever is tried right away
+            if next_index < len(retrievers):
+                start(next_index)
+                next_index += 1
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return results
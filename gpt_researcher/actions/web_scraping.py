@@ -1,8 +1,12 @@
-from typing import Any
+from typing import Any, AsyncIterator
 from colorama import Fore, Style
 
 from gpt_researcher.utils.workers import WorkerPool
+from gpt_researcher.utils.http_client import HTTPClient
 from ..scraper import Scraper
+from ..scraper.cache import PageCache
+from ..scraper.failures import FailureTracker
+from ..scraper.scheduler import DomainScheduler
 from ..config.config import Config
 from ..utils.logger import get_formatted_logger
 
@@ -10,13 +14,24 @@ logger = get_formatted_logger()
 
 
 async def scrape_urls(
-    urls, cfg: Config, worker_pool: WorkerPool
+    urls,
+    cfg: Config,
+    worker_pool: WorkerPool,
+    http_client: HTTPClient | None = None,
+    page_cache: PageCache | None = None,
+    scheduler: DomainScheduler | None = None,
+    failure_tracker: FailureTracker | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Scrapes the urls
     Args:
         urls: List of urls
         cfg: Config (optional)
+        worker_pool: WorkerPool used for throttling and CPU-bound parsing
+        http_client: Pooled async HTTP client shared across calls (optional)
+        page_cache: Persistent cache of scraped pages (optional)
+        scheduler: Per-domain politeness scheduler (optional)
+        failure_tracker: Shared tracker of failing hosts and URLs (optional)
 
     Returns:
         tuple[list[dict[str, Any]], list[dict[str, Any]]]: tuple containing scraped content and images
@@ -24,14 +39,11 @@ async def scrape_urls(
     """
     scraped_data = []
     images = []
-    user_agent = (
-        cfg.user_agent
-        if cfg
-        else "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"
-    )
 
     try:
-        scraper = Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool)
+        scraper = _create_scraper(
+            urls, cfg, worker_pool, http_client, page_cache, scheduler, failure_tracker
+        )
         scraped_data = await scraper.run()
         for item in scraped_data:
             if 'image_urls' in item:
@@ -42,6 +54,63 @@ async def scrape_urls(
     return scraped_data, images
 
 
+async def scrape_urls_stream(
+    urls,
+    cfg: Config,
+    worker_pool: WorkerPool,
+    http_client: HTTPClient | None = None,
+    page_cache: PageCache | None = None,
+    scheduler: DomainScheduler | None = None,
+    failure_tracker: FailureTracker | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Scrapes the urls, yielding each scraped page as soon as it is available.
+    Takes the same arguments as `scrape_urls`.
+
+    Yields:
+        dict[str, Any]: scraped content of a single page
+    """
+    scraper = _create_scraper(
+        urls, cfg, worker_pool, http_client, page_cache, scheduler, failure_tracker
+    )
+    pages = scraper.stream()
+    try:
+        async for page in pages:
+            yield page
+    except Exception as e:
+        print(f"{Fore.RED}Error in scrape_urls_stream: {e}{Style.RESET_ALL}")
+    finally:
+        await pages.aclose()
+
+
+def _create_scraper(
+    urls, cfg, worker_pool, http_client, page_cache, scheduler, failure_tracker
+) -> Scraper:
+    user_agent = (
+        cfg.user_agent
+        if cfg
+        else "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"
+    )
+    return Scraper(
+        urls,
+        user_agent,
+        cfg.scraper,
+        worker_pool=worker_pool,
+        http_client=http_client,
+        page_cache=page_cache,
+        scheduler=scheduler,
+        max_download_size=cfg.scraper_max_download_size_mb * 1024 * 1024 or None,
+        pdf_max_pages=cfg.scraper_pdf_max_pages,
+        pdf_max_chars=cfg.scraper_pdf_max_chars,
+        fallback_scraper=cfg.scraper_fallback,
+        hedge_delay=cfg.scraper_hedge_delay,
+        failure_tracker=failure_tracker,
+        browser_pool_size=cfg.browser_pool_size,
+        browser_max_pages_per_driver=cfg.browser_max_pages_per_driver,
+        nodriver_adaptive_scroll=cfg.nodriver_adaptive_scroll,
+    )
+
+
 async def filter_urls(urls: list[str], config: Config) -> list[str]:
     """
     Filter URLs based on configuration settings.
@@ -1,9 +1,11 @@
 from typing import Any, Optional
 import json
+import os
 
 from .config import Config
-from .memory import Memory
+from .memory import Memory, get_embedding_store
 from .utils.enum import ReportSource, ReportType, Tone
+from .utils.urls import VisitedURLs
 from .llm_provider import GenericLLMProvider
 from .vector_store import VectorStoreWrapper
 
@@ -78,14 +80,26 @@ class GPTResearcher:
         self.role = role
         self.parent_query = parent_query
         self.subtopics = subtopics or []
-        self.visited_urls = visited_urls or set()
+        # A VisitedURLs handed down by a parent researcher is shared, so nested researchers
+        # skip the pages their siblings already scraped
+        self.shares_visited_urls = isinstance(visited_urls, VisitedURLs)
+        self.visited_urls = visited_urls if self.shares_visited_urls else VisitedURLs(visited_urls or ())
         self.verbose = verbose
         self.context = context or []
         self.headers = headers or {}
         self.research_costs = 0.0
         self.retrievers = get_retrievers(self.headers, self.cfg)
+        embedding_cache = None
+        if self.cfg.cache_dir:
+            embedding_cache = get_embedding_store(
+                os.path.join(self.cfg.cache_dir, "embeddings.sqlite"),
+                max_bytes=self.cfg.embedding_cache_max_bytes,
+            )
         self.memory = Memory(
-            self.cfg.embedding_provider, self.cfg.embedding_model, **self.cfg.embedding_kwargs
+            self.cfg.embedding_provider,
+            self.cfg.embedding_model,
+            cache=embedding_cache,
+            **self.cfg.embedding_kwargs,
         )
         self.log_handler = log_handler
 
@@ -120,6 +134,14 @@ class GPTResearcher:
                 logging.getLogger('research').error(f"Error in _log_event: {e}", exc_info=True)
 
     async def conduct_research(self, on_progress=None):
+        try:
+            return await self._conduct_research(on_progress)
+        finally:
+            # Nested researchers of detailed and deep reports would otherwise each keep pools open
+            await self.scraper_manager.aclose()
+            await self.research_conductor.aclose()
+
+    async def _conduct_research(self, on_progress=None):
         await self._log_event("research", step="start", details={
             "query": self.query,
             "report_type": self.report_type,
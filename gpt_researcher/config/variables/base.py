@@ -4,6 +4,11 @@ from typing_extensions import TypedDict
 
 class BaseConfig(TypedDict):
     RETRIEVER: str
+    RETRIEVER_TIMEOUT: float
+    RETRIEVER_WEIGHTS: Union[str, None]
+    HEDGED_SEARCH: bool
+    HEDGE_DELAY: float
+    HEDGE_QUANTILE: float
     EMBEDDING: str
     SIMILARITY_THRESHOLD: float
     FAST_LLM: str
@@ -17,6 +22,7 @@ class BaseConfig(TypedDict):
     TEMPERATURE: float
     USER_AGENT: str
     MAX_SEARCH_RESULTS_PER_QUERY: int
+    MAX_SCRAPE_URLS_PER_QUERY: int
     MEMORY_BACKEND: str
     TOTAL_WORDS: int
     REPORT_FORMAT: str
@@ -25,7 +31,35 @@ class BaseConfig(TypedDict):
     LANGUAGE: str
     AGENT_ROLE: Union[str, None]
     SCRAPER: str
+    SCRAPER_FALLBACK: Union[str, None]
+    SCRAPER_HEDGE_DELAY: float
+    SCRAPER_DOMAIN_ERROR_BUDGET: int
+    SCRAPER_DOMAIN_COOLDOWN: float
+    SCRAPER_FAILED_URL_TTL: float
     MAX_SCRAPER_WORKERS: int
+    BROWSER_POOL_SIZE: int
+    BROWSER_MAX_PAGES_PER_DRIVER: int
+    NODRIVER_ADAPTIVE_SCROLL: bool
+    SCRAPER_PARSE_PROCESSES: int
+    SCRAPER_ADAPTIVE_CONCURRENCY: bool
+    MAX_SCRAPER_CONNECTIONS: int
+    MAX_SCRAPER_CONNECTIONS_PER_HOST: int
+    SCRAPER_HTTP2: bool
+    SCRAPER_MAX_DOWNLOAD_SIZE_MB: int
+    SCRAPER_PDF_MAX_PAGES: int
+    SCRAPER_PDF_MAX_CHARS: int
+    SCRAPER_DOMAIN_CONCURRENCY: int
+    SCRAPER_DOMAIN_RATE_LIMIT: float
+    SCRAPE_STREAMING: bool
+    SUB_QUERY_DEADLINE: float
+    NEAR_DUPLICATE_THRESHOLD: float
+    CACHE_DIR: Union[str, None]
+    SCRAPER_CACHE_TTL: int
+    SCRAPER_CACHE_MAX_SIZE_MB: int
+    SEARCH_CACHE_TTL: int
+    SEARCH_CACHE_RETRIEVER_TTLS: Union[str, None]
+    SEARCH_CACHE_MAX_ENTRIES: int
+    EMBEDDING_CACHE_MAX_BYTES: int
     MAX_SUBTOPICS: int
     REPORT_SOURCE: Union[str, None]
     DOC_PATH: str
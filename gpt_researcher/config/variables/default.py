@@ -2,6 +2,11 @@ from .base import BaseConfig
 
 DEFAULT_CONFIG: BaseConfig = {
     "RETRIEVER": "tavily",
+    "RETRIEVER_TIMEOUT": 20,
+    "RETRIEVER_WEIGHTS": None,
+    "HEDGED_SEARCH": False,
+    "HEDGE_DELAY": 0,
+    "HEDGE_QUANTILE": 0.9,
     "EMBEDDING": "openai:text-embedding-3-small",
     "SIMILARITY_THRESHOLD": 0.42,
     "FAST_LLM": "openai:gpt-4o-mini",
@@ -16,13 +21,42 @@ DEFAULT_CONFIG: BaseConfig = {
     "TEMPERATURE": 0.4,
     "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36 Edg/119.0.0.0",
     "MAX_SEARCH_RESULTS_PER_QUERY": 5,
+    "MAX_SCRAPE_URLS_PER_QUERY": 0,
     "MEMORY_BACKEND": "local",
     "TOTAL_WORDS": 1200,
     "REPORT_FORMAT": "APA",
     "MAX_ITERATIONS": 3,
     "AGENT_ROLE": None,
     "SCRAPER": "bs",
+    "SCRAPER_FALLBACK": None,
+    "SCRAPER_HEDGE_DELAY": 0,
+    "SCRAPER_DOMAIN_ERROR_BUDGET": 3,
+    "SCRAPER_DOMAIN_COOLDOWN": 300,
+    "SCRAPER_FAILED_URL_TTL": 3600,
     "MAX_SCRAPER_WORKERS": 15,
+    "BROWSER_POOL_SIZE": 3,
+    "BROWSER_MAX_PAGES_PER_DRIVER": 50,
+    "NODRIVER_ADAPTIVE_SCROLL": True,
+    "SCRAPER_PARSE_PROCESSES": 0,
+    "SCRAPER_ADAPTIVE_CONCURRENCY": False,
+    "MAX_SCRAPER_CONNECTIONS": 100,
+    "MAX_SCRAPER_CONNECTIONS_PER_HOST": 6,
+    "SCRAPER_HTTP2": False,
+    "SCRAPER_MAX_DOWNLOAD_SIZE_MB": 10,
+    "SCRAPER_PDF_MAX_PAGES": 10,
+    "SCRAPER_PDF_MAX_CHARS": 20000,
+    "SCRAPER_DOMAIN_CONCURRENCY": 4,
+    "SCRAPER_DOMAIN_RATE_LIMIT": 4.0,
+    "SCRAPE_STREAMING": False,
+    "SUB_QUERY_DEADLINE": 0,
+    "NEAR_DUPLICATE_THRESHOLD": 0.8,
+    "CACHE_DIR": None,
+    "SCRAPER_CACHE_TTL": 86400,
+    "SCRAPER_CACHE_MAX_SIZE_MB": 256,
+    "SEARCH_CACHE_TTL": 86400,
+    "SEARCH_CACHE_RETRIEVER_TTLS": None,
+    "SEARCH_CACHE_MAX_ENTRIES": 10000,
+    "EMBEDDING_CACHE_MAX_BYTES": 268435456,
     "MAX_SUBTOPICS": 3,
     "LANGUAGE": "english",
     "REPORT_SOURCE": "web",
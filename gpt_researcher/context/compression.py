@@ -1,6 +1,9 @@
 import os
 import asyncio
 from typing import Optional
+
+from langchain.schema import Document
+from langchain_core.embeddings import Embeddings
 from .retriever import SearchAPIRetriever, SectionRetriever
 from langchain.retrievers import (
     ContextualCompressionRetriever,
@@ -15,6 +18,13 @@ from ..utils.costs import estimate_embedding_cost
 from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
 
 
+def pretty_print_docs(docs, top_n=None):
+    return f"\n".join(f"Source: {d.metadata.get('source')}\n"
+                      f"Title: {d.metadata.get('title')}\n"
+                      f"Content: {d.page_content}\n"
+                      for i, d in enumerate(docs) if top_n is None or i < top_n)
+
+
 class VectorstoreCompressor:
     def __init__(self, vector_store: VectorStoreWrapper, max_results:int = 7, filter: Optional[dict] = None, **kwargs):
 
@@ -23,16 +33,10 @@ class VectorstoreCompressor:
         self.filter = filter
         self.kwargs = kwargs
 
-    def __pretty_print_docs(self, docs):
-        return f"\n".join(f"Source: {d.metadata.get('source')}\n"
-                          f"Title: {d.metadata.get('title')}\n"
-                          f"Content: {d.page_content}\n"
-                          for d in docs)
-
     async def async_get_context(self, query, max_results=5):
         """Get relevant context from vector store"""
         results = await self.vector_store.asimilarity_search(query=query, k=max_results, filter=self.filter)
-        return self.__pretty_print_docs(results)
+        return pretty_print_docs(results)
 
 
 class ContextCompressor:
@@ -58,18 +62,71 @@ class ContextCompressor:
         )
         return contextual_retriever
 
-    def __pretty_print_docs(self, docs, top_n):
-        return f"\n".join(f"Source: {d.metadata.get('source')}\n"
-                          f"Title: {d.metadata.get('title')}\n"
-                          f"Content: {d.page_content}\n"
-                          for i, d in enumerate(docs) if i < top_n)
-
     async def async_get_context(self, query, max_results=5, cost_callback=None):
         compressed_docs = self.__get_contextual_retriever()
         if cost_callback:
             cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
         relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query)
-        return self.__pretty_print_docs(relevant_docs, max_results)
+        return pretty_print_docs(relevant_docs, max_results)
+
+
+class _EmbeddedChunks(Embeddings):
+    """Serves the vectors of chunks embedded ahead of time, and embeds queries with `embeddings`."""
+
+    def __init__(self, embeddings, vectors: dict[str, list[float]]):
+        self.embeddings = embeddings
+        self.vectors = vectors
+
+    def embed_documents(self, texts):
+        return [self.vectors[text] for text in texts]
+
+    def embed_query(self, text):
+        return self.embeddings.embed_query(text)
+
+
+class StreamingContextCompressor:
+    """
+    Incremental counterpart of `ContextCompressor`.
+
+    Pages are split and embedded as soon as they are scraped with `add_pages`, so by the time
+    the last page arrives (or a deadline is hit) only the query remains to be embedded. The
+    chunks are then selected by an `EmbeddingsFilter` configured like the one of
+    `ContextCompressor`, so both return the same context for the same pages.
+    """
+
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+        self.similarity_threshold = os.environ.get("SIMILARITY_THRESHOLD", 0.35)
+        self.splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+        self.chunks: list[Document] = []
+        self.vectors: dict[str, list[float]] = {}
+
+    async def add_pages(self, pages, cost_callback=None):
+        """Splits and embeds newly scraped pages."""
+        docs = [
+            Document(
+                page_content=page.get("raw_content", ""),
+                metadata={"title": page.get("title", ""), "source": page.get("url", "")},
+            )
+            for page in pages
+        ]
+        chunks = self.splitter.split_documents(docs)
+        if not chunks:
+            return
+        if cost_callback:
+            cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=pages))
+        texts = [chunk.page_content for chunk in chunks]
+        vectors = await asyncio.to_thread(self.embeddings.embed_documents, texts)
+        self.chunks.extend(chunks)
+        self.vectors.update(zip(texts, vectors))
+
+    async def async_get_context(self, query, max_results=5):
+        if not self.chunks:
+            return ""
+        relevance_filter = EmbeddingsFilter(embeddings=_EmbeddedChunks(self.embeddings, self.vectors),
+                                            similarity_threshold=self.similarity_threshold)
+        relevant_docs = await asyncio.to_thread(relevance_filter.compress_documents, self.chunks, query)
+        return pretty_print_docs(relevant_docs, max_results)
 
 
 class WrittenContentCompressor:
@@ -0,0 +1,100 @@
+import re
+import zlib
+
+import numpy as np
+
+# Largest prime below 2**32, so permuted hashes fit in 32 bits
+_PRIME = 4294967291
+_WORD_RE = re.compile(r"\w+")
+# Shingles permuted at once, bounding the permutation matrix to num_perm x 4096 uint64s (4 MB)
+_CHUNK_SIZE = 4096
+
+
+class NearDuplicateIndex:
+    """
+    MinHash index of the pages seen during a research run.
+
+    Pages are reduced to MinHash signatures over word shingles, whose agreement estimates the
+    Jaccard similarity of the pages' texts. Locality sensitive hashing over bands of the
+    signature finds candidate duplicates without comparing a page against every indexed page.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        # a < 2**31 and hashes < 2**32 keep a * hash + b within uint64
+        self._a = rng.integers(1, 2**31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2**31, size=num_perm, dtype=np.uint64)
+        self._buckets: list[dict[bytes, list[str]]] = [{} for _ in range(bands)]
+        self._signatures: dict[str, np.ndarray] = {}
+
+    def signature(self, text: str) -> np.ndarray:
+        """Computes the MinHash signature of a text. CPU-bound, safe to run in a worker thread."""
+        words = _WORD_RE.findall(text.lower())
+        size = min(self.shingle_size, len(words)) or 1
+        shingles = {" ".join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        signature = np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        for start in range(0, len(hashes), _CHUNK_SIZE):
+            chunk = hashes[start:start + _CHUNK_SIZE]
+            permuted = (np.outer(self._a, chunk) + self._b[:, None]) % np.uint64(_PRIME)
+            np.minimum(signature, permuted.min(axis=1), out=signature)
+        return signature
+
+    def similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of the texts behind two signatures."""
+        return float(np.mean(first == second))
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def find(self, signature: np.ndarray) -> str | None:
+        """Returns the key of an indexed page that is a near-duplicate of the signature, if any."""
+        checked = set()
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            for key in bucket.get(band_key, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                if self.similarity(signature, self._signatures[key]) >= self.threshold:
+                    return key
+        return None
+
+    def add(self, key: str, signature: np.ndarray) -> str | None:
+        """
+        Indexes a page unless it is a near-duplicate of one already indexed.
+
+        Returns:
+            The key of the page it duplicates, or None if the page was indexed.
+        """
+        duplicate_of = self.find(signature)
+        if duplicate_of is not None:
+            return duplicate_of
+        self._signatures[key] = signature
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(band_key, []).append(key)
+        return None
+
+    def __len__(self) -> int:
+        return len(self._signatures)
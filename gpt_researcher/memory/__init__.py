@@ -1 +1,2 @@
+from .cache import CachedEmbeddings, EmbeddingStore, get_embedding_store
 from .embeddings import Memory
@@ -0,0 +1,215 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from array import array
+
+from langchain_core.embeddings import Embeddings
+
+# Keys looked up per SQLite query, under SQLite's limit of bound variables
+LOOKUP_BATCH_SIZE = 500
+
+
+class EmbeddingStore:
+    """
+    Persistent SQLite store of embedding vectors, addressed by content.
+
+    Vectors are stored as float32 blobs keyed by provider, model, kind (document or query, which
+    some providers embed differently) and the SHA-256 of the embedded text, so a chunk is
+    embedded once whichever research, sub-query or compressor meets it. The store keeps at most
+    `max_bytes` of vectors, evicting least recently used vectors first.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # UTF-8 bytes of the texts served from the store rather than sent to the provider
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                provider TEXT,
+                model TEXT,
+                kind TEXT,
+                hash BLOB,
+                vector BLOB,
+                accessed_at REAL,
+                PRIMARY KEY (provider, model, kind, hash)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_accessed_at ON embeddings (accessed_at)"
+        )
+        self._conn.commit()
+        # Bytes of vectors stored, summed once and then kept up to date by `put_many` and
+        # `_evict`. Vectors written by other processes are counted when the store is reopened.
+        (self._size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()
+
+    @staticmethod
+    def text_hash(text: str) -> bytes:
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    def get_many(self, provider: str, model: str, kind: str, texts: list[str]) -> dict[str, list[float]]:
+        """
+        Looks up the vectors of texts.
+
+        Returns:
+            The vectors found, by text. Texts missing from the result have to be embedded.
+        """
+        hashes = {self.text_hash(text): text for text in texts}
+        found = {}
+        now = time.time()
+        with self._lock:
+            keys = list(hashes)
+            for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+                batch = keys[start:start + LOOKUP_BATCH_SIZE]
+                rows = self._conn.execute(
+                    "SELECT hash, vector FROM embeddings WHERE provider = ? AND model = ? AND kind = ? "
+                    f"AND hash IN ({', '.join('?' * len(batch))})",
+                    (provider, model, kind, *batch),
+                ).fetchall()
+                for text_hash, vector in rows:
+                    found[hashes[text_hash]] = array("f", vector).tolist()
+                self._conn.executemany(
+                    "UPDATE embeddings SET accessed_at = ? "
+                    "WHERE provider = ? AND model = ? AND kind = ? AND hash = ?",
+                    [(now, provider, model, kind, text_hash) for text_hash, _ in rows],
+                )
+            self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(hashes) - len(found)
+            self.bytes_saved += sum(len(text.encode("utf-8")) for text in found)
+        return found
+
+    def put_many(self, provider: str, model: str, kind: str, vectors: dict[str, list[float]]) -> None:
+        """
+        Stores vectors by text and evicts old vectors if the store is full. Vectors already
+        stored, e.g. by a concurrent research, are kept as they are the same.
+        """
+        now = time.time()
+        with self._lock:
+            for text, vector in vectors.items():
+                blob = array("f", vector).tobytes()
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO embeddings (provider, model, kind, hash, vector, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (provider, model, kind, self.text_hash(text), blob, now),
+                )
+                self._size += len(blob) * cursor.rowcount
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        if self._size <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT rowid, LENGTH(vector) FROM embeddings ORDER BY accessed_at ASC"
+        )
+        evicted = []
+        for rowid, length in rows:
+            if self._size <= self.max_bytes:
+                break
+            evicted.append((rowid,))
+            self._size -= length
+        self._conn.executemany("DELETE FROM embeddings WHERE rowid = ?", evicted)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "bytes_saved": self.bytes_saved}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# One store per file for the whole process, so researches do not each open a connection
+_embedding_stores: dict[str, EmbeddingStore] = {}
+_embedding_stores_lock = threading.Lock()
+
+
+def get_embedding_store(path: str, max_bytes: int = 256 * 1024 * 1024) -> EmbeddingStore:
+    """Returns the shared embedding store of the file, with the size of the latest caller."""
+    key = os.path.abspath(path)
+    with _embedding_stores_lock:
+        store = _embedding_stores.get(key)
+        if store is None:
+            store = EmbeddingStore(path, max_bytes)
+            _embedding_stores[key] = store
+        store.max_bytes = max_bytes
+    return store
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LangChain embeddings that serve vectors from an `EmbeddingStore` and send only the texts
+    missing from it to the wrapped embeddings, in one batch.
+
+    Vectors are stored under the model name and a digest of the `settings` the embeddings were
+    created with (e.g. `EMBEDDING_KWARGS`), as settings such as dimensions change the vectors.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        store: EmbeddingStore,
+        provider: str,
+        model: str,
+        settings: dict | None = None,
+    ):
+        self.embeddings = embeddings
+        self.store = store
+        self.provider = provider
+        self.model = model
+        if settings:
+            digest = hashlib.sha256(
+                json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest()[:16]
+            self.model = f"{model}#{digest}"
+
+    def _split(self, kind: str, texts: list[str]) -> tuple[dict[str, list[float]], list[str]]:
+        cached = self.store.get_many(self.provider, self.model, kind, texts)
+        # dict.fromkeys keeps the order of the texts while embedding repeated texts once
+        missing = [text for text in dict.fromkeys(texts) if text not in cached]
+        return cached, missing
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        vectors, missing = self._split("document", texts)
+        if missing:
+            embedded = dict(zip(missing, self.embeddings.embed_documents(missing)))
+            self.store.put_many(self.provider, self.model, "document", embedded)
+            vectors.update(embedded)
+        return [vectors[text] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        vectors, missing = self._split("query", [text])
+        if missing:
+            vectors[text] = self.embeddings.embed_query(text)
+            self.store.put_many(self.provider, self.model, "query", vectors)
+        return vectors[text]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        vectors, missing = await asyncio.to_thread(self._split, "document", texts)
+        if missing:
+            embedded = dict(zip(missing, await self.embeddings.aembed_documents(missing)))
+            await asyncio.to_thread(self.store.put_many, self.provider, self.model, "document", embedded)
+            vectors.update(embedded)
+        return [vectors[text] for text in texts]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        vectors, missing = await asyncio.to_thread(self._split, "query", [text])
+        if missing:
+            vectors[text] = await self.embeddings.aembed_query(text)
+            await asyncio.to_thread(self.store.put_many, self.provider, self.model, "query", vectors)
+        return vectors[text]
@@ -1,6 +1,8 @@
 import os
 from typing import Any
 
+from .cache import CachedEmbeddings, EmbeddingStore
+
 OPENAI_EMBEDDING_MODEL = os.environ.get(
     "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
 )
@@ -25,7 +27,13 @@ _SUPPORTED_PROVIDERS = {
 
 
 class Memory:
-    def __init__(self, embedding_provider: str, model: str, **embdding_kwargs: Any):
+    def __init__(
+        self,
+        embedding_provider: str,
+        model: str,
+        cache: EmbeddingStore | None = None,
+        **embdding_kwargs: Any,
+    ):
         _embeddings = None
         match embedding_provider:
             case "custom":
@@ -116,6 +124,12 @@ class Memory:
                 raise Exception("Embedding not found.")
 
         self._embeddings = _embeddings
+        self.cache = cache
+        if cache is not None:
+            # Chunks already embedded, in this research or an earlier one, are not sent again
+            self._embeddings = CachedEmbeddings(
+                _embeddings, cache, embedding_provider, model, settings=embdding_kwargs
+            )
 
     def get_embeddings(self):
         return self._embeddings
@@ -3,6 +3,7 @@ from .bing.bing import BingSearch
 from .custom.custom import CustomRetriever
 from .duckduckgo.duckduckgo import Duckduckgo
 from .google.google import GoogleSearch
+from .local_bm25.local_bm25 import LocalBM25Search
 from .pubmed_central.pubmed_central import PubMedCentralSearch
 from .searx.searx import SearxSearch
 from .semantic_scholar.semantic_scholar import SemanticScholarSearch
@@ -25,5 +26,6 @@ __all__ = [
     "ArxivSearch",
     "SemanticScholarSearch",
     "PubMedCentralSearch",
-    "ExaSearch"
+    "ExaSearch",
+    "LocalBM25Search"
 ]
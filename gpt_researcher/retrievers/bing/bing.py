@@ -6,6 +6,8 @@ import requests
 import json
 import logging
 
+from ..utils import async_http_client
+
 
 class BingSearch():
     """
@@ -36,16 +38,8 @@ class BingSearch():
                 "Bing API key not found. Please set the BING_API_KEY environment variable.")
         return api_key
 
-    def search(self, max_results=7) -> list[dict[str]]:
-        """
-        Searches the query
-        Returns:
-
-        """
-        print("Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using the Bing API."""
-
-        # Search the query
+    def _request(self, max_results: int) -> tuple[str, dict, dict]:
+        """The URL, headers and parameters of a search request"""
         url = "https://api.bing.microsoft.com/v7.0/search"
 
         headers = {
@@ -62,14 +56,44 @@ class BingSearch():
             "textFormat": "HTML",
             "safeSearch": "Strict"
         }
+        return url, headers, params
 
+    def search(self, max_results=7) -> list[dict[str]]:
+        """
+        Searches the query
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using the Bing API."""
+
+        # Search the query
+        url, headers, params = self._request(max_results)
         resp = requests.get(url, headers=headers, params=params)
 
         # Preprocess the results
         if resp is None:
             return []
+        return self._format_results(resp.text)
+
+    async def asearch(self, max_results=7, http_client=None) -> list[dict[str]]:
+        """
+        Searches the query like `search`, without blocking the event loop
+        Args:
+            max_results: Maximum number of results to return
+            http_client: Shared pooled async client to send the request with (optional)
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
+        url, headers, params = self._request(max_results)
+        async with async_http_client(http_client) as client:
+            resp = await client.get(url, headers=headers, params=params)
+        return self._format_results(resp.text)
+
+    def _format_results(self, text: str) -> list[dict[str]]:
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
             results = search_results["webPages"]["value"]
         except Exception as e:
             self.logger.error(
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class SearchCache:
+    """
+    Persistent SQLite cache of search results.
+
+    Results are keyed by retriever, normalised query, query domains and number of results, so
+    repeated searches of a research, and of later researches, skip the search API. Entries
+    expire after the TTL of their retriever (`ttls`, falling back to `ttl`), and the cache
+    keeps at most `max_entries` entries, evicting least recently used entries first.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 86400,
+        ttls: dict[str, float] | None = None,
+        max_entries: int = 10000,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS searches (
+                key TEXT PRIMARY KEY,
+                retriever TEXT,
+                query TEXT,
+                results BLOB,
+                searched_at REAL,
+                accessed_at REAL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS searches_accessed_at ON searches (accessed_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Folds case, whitespace and surrounding quotes and punctuation of a query."""
+        return " ".join(query.lower().split()).strip(" \"'.?!")
+
+    @classmethod
+    def cache_key(
+        cls,
+        retriever: str,
+        query: str,
+        query_domains: list[str] | None = None,
+        max_results: int | None = None,
+    ) -> str:
+        """Hashes the parameters that identify a search into the key it is stored under."""
+        identity = json.dumps(
+            [retriever, cls.normalize_query(query), sorted(query_domains or []), max_results]
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        retriever: str,
+        query: str,
+        query_domains: list[str] | None = None,
+        max_results: int | None = None,
+    ) -> list[dict] | None:
+        """
+        Looks up a search.
+
+        Returns:
+            The cached results, or None if the search is not cached or has expired.
+        """
+        key = self.cache_key(retriever, query, query_domains, max_results)
+        ttl = self.ttls.get(retriever, self.ttl)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, searched_at FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] >= ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE searches SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(
+        self,
+        retriever: str,
+        query: str,
+        results: list[dict],
+        query_domains: list[str] | None = None,
+        max_results: int | None = None,
+    ) -> None:
+        """Stores (or refreshes) the results of a search and evicts old entries if the cache is full."""
+        key = self.cache_key(retriever, query, query_domains, max_results)
+        blob = zlib.compress(json.dumps(results).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches "
+                "(key, retriever, query, results, searched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, retriever, query, blob, now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM searches").fetchone()
+        if count <= self.max_entries:
+            return
+        self._conn.execute(
+            "DELETE FROM searches WHERE key IN "
+            "(SELECT key FROM searches ORDER BY accessed_at ASC LIMIT ?)",
+            (count - self.max_entries,),
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# One cache per file for the whole process, so researches do not each open a connection
+_search_caches: dict[str, SearchCache] = {}
+_search_caches_lock = threading.Lock()
+
+
+def get_search_cache(
+    path: str,
+    ttl: float = 86400,
+    ttls: dict[str, float] | None = None,
+    max_entries: int = 10000,
+) -> SearchCache:
+    """Returns the shared search cache of the file, with the settings of the latest caller."""
+    key = os.path.abspath(path)
+    with _search_caches_lock:
+        cache = _search_caches.get(key)
+        if cache is None:
+            cache = SearchCache(path, ttl, ttls, max_entries)
+            _search_caches[key] = cache
+        cache.ttl = ttl
+        cache.ttls = ttls or {}
+        cache.max_entries = max_entries
+    return cache
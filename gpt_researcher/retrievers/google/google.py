@@ -5,6 +5,8 @@ import os
 import requests
 import json
 
+from ..utils import async_http_client
+
 
 class GoogleSearch:
     """
@@ -50,12 +52,8 @@ class GoogleSearch:
                             "You can get a key at https://developers.google.com/custom-search/v1/overview")
         return api_key
 
-    def search(self, max_results=7):
-        """
-        Searches the query using Google Custom Search API, optionally restricting to specific domains
-        Returns:
-            list: List of search results with title, href and body
-        """
+    def _search_url(self) -> str:
+        """Builds the search URL, optionally restricting the query to specific domains"""
         # Build query with domain restrictions if specified
         search_query = self.query
         if self.query_domains and len(self.query_domains) > 0:
@@ -64,9 +62,32 @@ class GoogleSearch:
 
         print("Searching with query {0}...".format(search_query))
 
-        url = f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={search_query}&start=1"
-        resp = requests.get(url)
+        return f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={search_query}&start=1"
+
+    def search(self, max_results=7):
+        """
+        Searches the query using Google Custom Search API, optionally restricting to specific domains
+        Returns:
+            list: List of search results with title, href and body
+        """
+        resp = requests.get(self._search_url())
+        return self._format_results(resp, max_results)
+
+    async def asearch(self, max_results=7, http_client=None):
+        """
+        Searches the query like `search`, without blocking the event loop
+        Args:
+            max_results: Maximum number of results to return
+            http_client: Shared pooled async client to send the request with (optional)
+        Returns:
+            list: List of search results with title, href and body
+        """
+        async with async_http_client(http_client) as client:
+            resp = await client.get(self._search_url())
+        return self._format_results(resp, max_results)
 
+    @staticmethod
+    def _format_results(resp, max_results):
         if resp.status_code < 200 or resp.status_code >= 300:
             print("Google search: unexpected response status: ", resp.status_code)
 
@@ -0,0 +1,214 @@
+import asyncio
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import sys
+import threading
+from array import array
+
+TOKEN_PATTERN = re.compile(r"\w+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have how in into is it its of on or that the "
+    "their there these this to was were what when where which who why will with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercases text into word tokens, without stopwords and one-character tokens."""
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def split_passages(text: str, size: int = 200, overlap: int = 40) -> list[str]:
+    """Splits text into passages of `size` words, consecutive passages sharing `overlap` words."""
+    words = text.split()
+    if len(words) <= size:
+        return [" ".join(words)] if words else []
+    step = size - overlap
+    return [" ".join(words[start:start + size]) for start in range(0, len(words) - overlap, step)]
+
+
+class BM25Index:
+    """
+    Inverted index of the passages of a document folder, scored with Okapi BM25.
+
+    The postings of each term are slices of two flat arrays, one of passage ids and one of term
+    frequencies, located by the term's offset and count in the vocabulary. The index is saved
+    next to a manifest of the indexed files, and is rebuilt when one of them changes.
+    """
+
+    VERSION = 1
+    k1 = 1.5
+    b = 0.75
+
+    def __init__(self, manifest: dict, passages: list[list[str]], vocabulary: dict,
+                 doc_ids: array, term_freqs: array, lengths: array):
+        self.manifest = manifest
+        # [source, text] of each passage
+        self.passages = passages
+        # term -> [offset, count] of its postings
+        self.vocabulary = vocabulary
+        self.doc_ids = doc_ids
+        self.term_freqs = term_freqs
+        self.lengths = lengths
+        self.average_length = sum(lengths) / len(lengths) if lengths else 0.0
+
+    @classmethod
+    def build(cls, documents: list[dict], manifest: dict) -> "BM25Index":
+        """Indexes documents in the format of `DocumentLoader` ({"url", "raw_content"})."""
+        passages = []
+        postings: dict[str, list[tuple[int, int]]] = {}
+        lengths = array("I")
+        for document in documents:
+            for text in split_passages(document["raw_content"]):
+                passage_id = len(passages)
+                passages.append([document["url"], text])
+                tokens = tokenize(text)
+                lengths.append(len(tokens))
+                counts: dict[str, int] = {}
+                for token in tokens:
+                    counts[token] = counts.get(token, 0) + 1
+                for token, count in counts.items():
+                    postings.setdefault(token, []).append((passage_id, count))
+
+        vocabulary = {}
+        doc_ids = array("I")
+        term_freqs = array("H")
+        for term in sorted(postings):
+            vocabulary[term] = [len(doc_ids), len(postings[term])]
+            for passage_id, count in postings[term]:
+                doc_ids.append(passage_id)
+                term_freqs.append(min(count, 65535))
+        return cls(manifest, passages, vocabulary, doc_ids, term_freqs, lengths)
+
+    def search(self, query: str, k: int = 10) -> list[tuple[float, int]]:
+        """Returns the (score, passage id) of the `k` best passages for the query, best first."""
+        total = len(self.passages)
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            if term not in self.vocabulary:
+                continue
+            offset, count = self.vocabulary[term]
+            idf = math.log(1 + (total - count + 0.5) / (count + 0.5))
+            for position in range(offset, offset + count):
+                passage_id = self.doc_ids[position]
+                freq = self.term_freqs[position]
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[passage_id] / self.average_length)
+                scores[passage_id] = scores.get(passage_id, 0.0) + idf * freq * (self.k1 + 1) / (freq + norm)
+        return heapq.nlargest(k, ((score, passage_id) for passage_id, score in scores.items()))
+
+    def save(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "postings.bin"), "wb") as f:
+            self.doc_ids.tofile(f)
+            self.term_freqs.tofile(f)
+            self.lengths.tofile(f)
+        metadata = {
+            "version": self.VERSION,
+            "byteorder": sys.byteorder,
+            "manifest": self.manifest,
+            "passages": self.passages,
+            "vocabulary": self.vocabulary,
+            "sizes": [len(self.doc_ids), len(self.term_freqs), len(self.lengths)],
+        }
+        # The metadata is written last, so an interrupted save leaves no loadable index
+        with open(os.path.join(directory, "index.json"), "w", encoding="utf-8") as f:
+            json.dump(metadata, f)
+
+    @classmethod
+    def load(cls, directory: str) -> "BM25Index | None":
+        """Loads a saved index, or returns None if there is none or it was saved by another version."""
+        try:
+            with open(os.path.join(directory, "index.json"), encoding="utf-8") as f:
+                metadata = json.load(f)
+            if metadata["version"] != cls.VERSION or metadata["byteorder"] != sys.byteorder:
+                return None
+            doc_ids, term_freqs, lengths = array("I"), array("H"), array("I")
+            with open(os.path.join(directory, "postings.bin"), "rb") as f:
+                for values, size in zip((doc_ids, term_freqs, lengths), metadata["sizes"]):
+                    values.fromfile(f, size)
+        except (OSError, ValueError, KeyError, EOFError):
+            return None
+        return cls(
+            metadata["manifest"], metadata["passages"], metadata["vocabulary"],
+            doc_ids, term_freqs, lengths,
+        )
+
+
+class LocalBM25Search:
+    """
+    Offline BM25 retriever over the local documents of `DOC_PATH`.
+
+    Returns the passages of the documents that best match the query, with the document's
+    file name as href. The index is kept under `CACHE_DIR` (or the user cache directory) and
+    shared by all searches of the process.
+    """
+
+    # The index follows the documents, so its results must not outlive them in the search cache
+    cacheable = False
+    _indexes: dict[str, BM25Index] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, query, query_domains=None, doc_path=None, cache_dir=None):
+        """
+        Initializes the LocalBM25Search object
+        Args:
+            query: Search query string
+            doc_path: Folder of the documents, `DOC_PATH` by default
+            cache_dir: Folder the index is saved under, `CACHE_DIR` by default
+        """
+        self.query = query
+        self.doc_path = doc_path or os.environ.get("DOC_PATH", "./my-docs")
+        self.cache_dir = cache_dir or os.environ.get("CACHE_DIR") or os.path.join(
+            os.path.expanduser("~"), ".cache", "gpt_researcher"
+        )
+
+    def index_dir(self) -> str:
+        folder = hashlib.sha256(os.path.abspath(self.doc_path).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, "bm25", folder)
+
+    def _manifest(self) -> dict:
+        manifest = {}
+        for root, _, files in os.walk(self.doc_path):
+            for file in files:
+                path = os.path.join(root, file)
+                stat = os.stat(path)
+                manifest[os.path.relpath(path, self.doc_path)] = [stat.st_mtime_ns, stat.st_size]
+        return manifest
+
+    def get_index(self) -> BM25Index:
+        """Returns the index of `DOC_PATH`, loading or rebuilding it if the documents changed."""
+        directory = self.index_dir()
+        manifest = self._manifest()
+        with self._lock:
+            index = self._indexes.get(directory)
+            if index is None or index.manifest != manifest:
+                index = BM25Index.load(directory)
+            if index is None or index.manifest != manifest:
+                from ...document import DocumentLoader
+
+                # Called from a worker thread by the research, so the loader gets its own event loop
+                documents = asyncio.run(DocumentLoader(self.doc_path).load())
+                index = BM25Index.build(documents, manifest)
+                index.save(directory)
+            self._indexes[directory] = index
+        return index
+
+    def search(self, max_results=10):
+        """
+        Searches the local documents
+        Args:
+            max_results: Maximum number of passages to return
+        Returns:
+            list: The best passages, as {"href": file name, "body": passage}
+        """
+        index = self.get_index()
+        return [
+            {"href": index.passages[passage_id][0], "body": index.passages[passage_id][1]}
+            for _, passage_id in index.search(self.query, max_results)
+        ]
@@ -1,14 +1,33 @@
+import asyncio
 import os
+import threading
+import time
 import xml.etree.ElementTree as ET
 
 import requests
 
+from ..utils import async_http_client
+
+ESEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+NAMESPACES = {
+    "mml": "http://www.w3.org/1998/Math/MathML",
+    "xlink": "http://www.w3.org/1999/xlink",
+}
+
 
 class PubMedCentralSearch:
     """
     PubMed Central API Retriever
     """
 
+    # Articles fetched per efetch request
+    fetch_batch_size = 5
+    # NCBI allows 10 requests per second with an API key, shared by all searches of the process
+    requests_per_second = 10
+    _next_request_at = 0.0
+    _rate_lock = threading.Lock()
+
     def __init__(self, query, query_domains=None):
         """
         Initializes the PubMedCentralSearch object.
@@ -35,16 +54,17 @@ class PubMedCentralSearch:
             )
         return api_key
 
-    def search(self, max_results=10):
-        """
-        Searches the query using the PubMed Central API.
-        Args:
-            max_results: The maximum number of results to return.
-        Returns:
-            A list of search results.
-        """
-        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-        params = {
+    @classmethod
+    def _reserve_request(cls) -> float:
+        """Books the next request slot under NCBI's rate limit and returns the seconds to wait for it."""
+        with cls._rate_lock:
+            now = time.monotonic()
+            slot = max(now, cls._next_request_at)
+            cls._next_request_at = slot + 1 / cls.requests_per_second
+        return slot - now
+
+    def _search_params(self, max_results):
+        return {
             "db": "pmc",
             "term": f"{self.query} AND free fulltext[filter]",
             "retmax": max_results,
@@ -53,33 +73,146 @@ class PubMedCentralSearch:
             "retmode": "json",
             "sort": "relevance"
         }
-        response = requests.get(base_url, params=params)
+
+    def _fetch_params(self, search_result, retstart):
+        """Parameters of an efetch request for a batch of the search results kept on the history server"""
+        return {
+            "db": "pmc",
+            "query_key": search_result["querykey"],
+            "WebEnv": search_result["webenv"],
+            "retstart": retstart,
+            "retmax": self.fetch_batch_size,
+            "retmode": "xml",
+            "api_key": self.api_key,
+        }
+
+    def search(self, max_results=10):
+        """
+        Searches the query using the PubMed Central API.
+        Args:
+            max_results: The maximum number of results to return.
+        Returns:
+            A list of search results.
+        """
+        time.sleep(self._reserve_request())
+        response = requests.get(ESEARCH_URL, params=self._search_params(max_results))
 
         if response.status_code != 200:
             raise Exception(
                 f"Failed to retrieve data: {response.status_code} - {response.text}"
             )
 
-        results = response.json()
-        ids = results["esearchresult"]["idlist"]
+        search_result = response.json()["esearchresult"]
+        ids = search_result["idlist"]
 
         search_response = []
-        for article_id in ids:
-            xml_content = self.fetch([article_id])
-            if self.has_body_content(xml_content):
-                article_data = self.parse_xml(xml_content)
-                if article_data:
-                    search_response.append(
-                        {
-                            "href": f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/",
-                            "body": f"{article_data['title']}\n\n{article_data['abstract']}\n\n{article_data['body'][:500]}...",
-                        }
+        for retstart in range(0, len(ids), self.fetch_batch_size):
+            time.sleep(self._reserve_request())
+            with requests.get(
+                EFETCH_URL, params=self._fetch_params(search_result, retstart), stream=True
+            ) as response:
+                if response.status_code != 200:
+                    raise Exception(
+                        f"Failed to retrieve data: {response.status_code} - {response.text}"
                     )
+                parser = ET.XMLPullParser(events=("end",))
+                batch_ids = ids[retstart:retstart + self.fetch_batch_size]
+                articles = []
+                for chunk in response.iter_content(chunk_size=65536):
+                    parser.feed(chunk)
+                    articles.extend(self._read_articles(parser, batch_ids, len(articles)))
+                parser.close()
+                articles.extend(self._read_articles(parser, batch_ids, len(articles)))
+            search_response.extend(article for article in articles if article)
 
             if len(search_response) >= max_results:
                 break
 
-        return search_response
+        return search_response[:max_results]
+
+    async def asearch(self, max_results=10, http_client=None):
+        """
+        Searches the query like `search`, without blocking the event loop. The articles are
+        fetched in concurrent batches from the history server, paced to NCBI's rate limit, and
+        parsed as they stream in.
+        Args:
+            max_results: The maximum number of results to return.
+            http_client: Shared pooled async client to send the requests with (optional)
+        Returns:
+            A list of search results.
+        """
+        async with async_http_client(http_client) as client:
+            await asyncio.sleep(self._reserve_request())
+            response = await client.get(ESEARCH_URL, params=self._search_params(max_results))
+
+            if response.status_code != 200:
+                raise Exception(
+                    f"Failed to retrieve data: {response.status_code} - {response.text}"
+                )
+
+            search_result = response.json()["esearchresult"]
+            ids = search_result["idlist"]
+
+            batches = await asyncio.gather(*(
+                self._afetch_batch(client, search_result, retstart, ids)
+                for retstart in range(0, len(ids), self.fetch_batch_size)
+            ))
+
+        search_response = [article for articles in batches for article in articles if article]
+        return search_response[:max_results]
+
+    async def _afetch_batch(self, client, search_result, retstart, ids):
+        await asyncio.sleep(self._reserve_request())
+        batch_ids = ids[retstart:retstart + self.fetch_batch_size]
+        articles = []
+        async with client.stream(
+            "GET", EFETCH_URL, params=self._fetch_params(search_result, retstart)
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise Exception(
+                    f"Failed to retrieve data: {response.status_code} - {response.text}"
+                )
+            parser = ET.XMLPullParser(events=("end",))
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                articles.extend(self._read_articles(parser, batch_ids, len(articles)))
+        parser.close()
+        articles.extend(self._read_articles(parser, batch_ids, len(articles)))
+        return articles
+
+    def _read_articles(self, parser, batch_ids, position):
+        """
+        Formats the articles the pull parser has finished reading, freeing each once formatted.
+        Articles without a body are returned as None, so `position` keeps counting the articles of
+        the batch; it gives the id of an article whose XML does not include it.
+        """
+        articles = []
+        for _, elem in parser.read_events():
+            if elem.tag != "article":
+                continue
+            fallback_id = batch_ids[position] if position < len(batch_ids) else None
+            articles.append(self._format_article(elem, fallback_id))
+            position += 1
+            elem.clear()
+        return articles
+
+    def _format_article(self, article, fallback_id=None):
+        article_id = self._article_id(article) or fallback_id
+        if not article_id or not self._has_body(article):
+            return None
+        article_data = self._parse_article(article)
+        return {
+            "href": f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/",
+            "body": f"{article_data['title']}\n\n{article_data['abstract']}\n\n{article_data['body'][:500]}...",
+        }
+
+    @staticmethod
+    def _article_id(article):
+        for elem in article.iterfind(".//article-meta/article-id", NAMESPACES):
+            if elem.get("pub-id-type") in ("pmc", "pmcid") and elem.text:
+                return elem.text.strip().removeprefix("PMC")
+        return None
 
     def fetch(self, ids):
         """
@@ -89,14 +222,14 @@ class PubMedCentralSearch:
         Returns:
             XML content of the articles.
         """
-        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
         params = {
             "db": "pmc",
             "id": ",".join(ids),
             "retmode": "xml",
             "api_key": self.api_key,
         }
-        response = requests.get(base_url, params=params)
+        time.sleep(self._reserve_request())
+        response = requests.get(EFETCH_URL, params=params)
 
         if response.status_code != 200:
             raise Exception(
@@ -114,20 +247,19 @@ class PubMedCentralSearch:
             Boolean indicating presence of body content.
         """
         root = ET.fromstring(xml_content)
-        ns = {
-            "mml": "http://www.w3.org/1998/Math/MathML",
-            "xlink": "http://www.w3.org/1999/xlink",
-        }
-        article = root.find("article", ns)
+        article = root.find("article", NAMESPACES)
         if article is None:
             return False
+        return self._has_body(article)
 
-        body_elem = article.find(".//body", namespaces=ns)
+    @staticmethod
+    def _has_body(article):
+        body_elem = article.find(".//body", namespaces=NAMESPACES)
         if body_elem is not None:
             return True
         else:
-            for sec in article.findall(".//sec", namespaces=ns):
-                for p in sec.findall(".//p", namespaces=ns):
+            for sec in article.findall(".//sec", namespaces=NAMESPACES):
+                for p in sec.findall(".//p", namespaces=NAMESPACES):
                     if p.text:
                         return True
         return False
@@ -141,33 +273,31 @@ class PubMedCentralSearch:
             Dictionary containing title, abstract, and body text.
         """
         root = ET.fromstring(xml_content)
-        ns = {
-            "mml": "http://www.w3.org/1998/Math/MathML",
-            "xlink": "http://www.w3.org/1999/xlink",
-        }
-
-        article = root.find("article", ns)
+        article = root.find("article", NAMESPACES)
         if article is None:
             return None
+        return self._parse_article(article)
 
+    @staticmethod
+    def _parse_article(article):
         title = article.findtext(
-            ".//title-group/article-title", default="", namespaces=ns
+            ".//title-group/article-title", default="", namespaces=NAMESPACES
         )
 
-        abstract = article.find(".//abstract", namespaces=ns)
+        abstract = article.find(".//abstract", namespaces=NAMESPACES)
         abstract_text = (
             "".join(abstract.itertext()).strip() if abstract is not None else ""
         )
 
         body = []
-        body_elem = article.find(".//body", namespaces=ns)
+        body_elem = article.find(".//body", namespaces=NAMESPACES)
         if body_elem is not None:
-            for p in body_elem.findall(".//p", namespaces=ns):
+            for p in body_elem.findall(".//p", namespaces=NAMESPACES):
                 if p.text:
                     body.append(p.text.strip())
         else:
-            for sec in article.findall(".//sec", namespaces=ns):
-                for p in sec.findall(".//p", namespaces=ns):
+            for sec in article.findall(".//sec", namespaces=NAMESPACES):
+                for p in sec.findall(".//p", namespaces=NAMESPACES):
                     if p.text:
                         body.append(p.text.strip())
 
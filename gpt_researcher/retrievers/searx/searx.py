@@ -1,9 +1,12 @@
 import os
 import json
+import httpx
 import requests
 from typing import List, Dict
 from urllib.parse import urljoin
 
+from ..utils import async_http_client
+
 
 class SearxSearch():
     """
@@ -36,14 +39,8 @@ class SearxSearch():
                 "You can find public instances at https://searx.space/"
             )
 
-    def search(self, max_results: int = 10) -> List[Dict[str, str]]:
-        """
-        Searches the query using SearxNG API
-        Args:
-            max_results: Maximum number of results to return
-        Returns:
-            List of dictionaries containing search results
-        """
+    def _request(self) -> tuple[str, dict]:
+        """The URL and parameters of a search request"""
         search_url = urljoin(self.base_url, "search")
         # TODO: Add support for query domains
         params = {
@@ -52,6 +49,17 @@ class SearxSearch():
             # Output format of results. Format needs to be activated in searxng config.
             'format': 'json'
         }
+        return search_url, params
+
+    def search(self, max_results: int = 10) -> List[Dict[str, str]]:
+        """
+        Searches the query using SearxNG API
+        Args:
+            max_results: Maximum number of results to return
+        Returns:
+            List of dictionaries containing search results
+        """
+        search_url, params = self._request()
 
         try:
             response = requests.get(
@@ -60,19 +68,47 @@ class SearxSearch():
                 headers={'Accept': 'application/json'}
             )
             response.raise_for_status()
-            results = response.json()
+            return self._format_results(response.json(), max_results)
 
-            # Normalize results to match the expected format
-            search_response = []
-            for result in results.get('results', [])[:max_results]:
-                search_response.append({
-                    "href": result.get('url', ''),
-                    "body": result.get('content', '')
-                })
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Error querying SearxNG: {str(e)}")
+        except json.JSONDecodeError:
+            raise Exception("Error parsing SearxNG response")
 
-            return search_response
+    async def asearch(self, max_results: int = 10, http_client=None) -> List[Dict[str, str]]:
+        """
+        Searches the query like `search`, without blocking the event loop
+        Args:
+            max_results: Maximum number of results to return
+            http_client: Shared pooled async client to send the request with (optional)
+        Returns:
+            List of dictionaries containing search results
+        """
+        search_url, params = self._request()
 
-        except requests.exceptions.RequestException as e:
+        try:
+            async with async_http_client(http_client) as client:
+                response = await client.get(
+                    search_url,
+                    params=params,
+                    headers={'Accept': 'application/json'}
+                )
+            response.raise_for_status()
+            return self._format_results(response.json(), max_results)
+
+        except httpx.HTTPError as e:
             raise Exception(f"Error querying SearxNG: {str(e)}")
         except json.JSONDecodeError:
             raise Exception("Error parsing SearxNG response")
+
+    @staticmethod
+    def _format_results(results: dict, max_results: int) -> List[Dict[str, str]]:
+        # Normalize results to match the expected format
+        search_response = []
+        for result in results.get('results', [])[:max_results]:
+            search_response.append({
+                "href": result.get('url', ''),
+                "body": result.get('content', '')
+            })
+
+        return search_response
@@ -5,6 +5,8 @@ import os
 import requests
 import urllib.parse
 
+from ..utils import async_http_client
+
 
 class SerpApiSearch():
     """
@@ -33,15 +35,8 @@ class SerpApiSearch():
                             "You can get a key at https://serpapi.com/")
         return api_key
 
-    def search(self, max_results=7):
-        """
-        Searches the query
-        Returns:
-
-        """
-        print("SerpApiSearch: Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using SerpApi."""
-
+    def _search_url(self) -> str:
+        """The URL of a search request"""
         url = "https://serpapi.com/search.json"
 
         search_query = self.query
@@ -53,30 +48,68 @@ class SerpApiSearch():
             "q": search_query,
             "api_key": self.api_key
         }
-        encoded_url = url + "?" + urllib.parse.urlencode(params)
+        return url + "?" + urllib.parse.urlencode(params)
+
+    def search(self, max_results=7):
+        """
+        Searches the query
+        Returns:
+
+        """
+        print("SerpApiSearch: Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using SerpApi."""
+
+        encoded_url = self._search_url()
         search_response = []
         try:
             response = requests.get(encoded_url, timeout=10)
             if response.status_code == 200:
-                search_results = response.json()
-                if search_results:
-                    results = search_results["organic_results"]
-                    results_processed = 0
-                    for result in results:
-                        # skip youtube results
-                        if "youtube.com" in result["link"]:
-                            continue
-                        if results_processed >= max_results:
-                            break
-                        search_result = {
-                            "title": result["title"],
-                            "href": result["link"],
-                            "body": result["snippet"],
-                        }
-                        search_response.append(search_result)
-                        results_processed += 1
+                search_response = self._format_results(response.json(), max_results)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
 
         return search_response
+
+    async def asearch(self, max_results=7, http_client=None):
+        """
+        Searches the query like `search`, without blocking the event loop
+        Args:
+            max_results: Maximum number of results to return
+            http_client: Shared pooled async client to send the request with (optional)
+        Returns:
+
+        """
+        print("SerpApiSearch: Searching with query {0}...".format(self.query))
+        search_response = []
+        try:
+            async with async_http_client(http_client) as client:
+                response = await client.get(self._search_url(), timeout=10)
+            if response.status_code == 200:
+                search_response = self._format_results(response.json(), max_results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+
+        return search_response
+
+    @staticmethod
+    def _format_results(search_results, max_results):
+        search_response = []
+        if search_results:
+            results = search_results["organic_results"]
+            results_processed = 0
+            for result in results:
+                # skip youtube results
+                if "youtube.com" in result["link"]:
+                    continue
+                if results_processed >= max_results:
+                    break
+                search_result = {
+                    "title": result["title"],
+                    "href": result["link"],
+                    "body": result["snippet"],
+                }
+                search_response.append(search_result)
+                results_processed += 1
+        return search_response
@@ -5,6 +5,8 @@ import os
 import requests
 import json
 
+from ..utils import async_http_client
+
 
 class SerperSearch():
     """
@@ -34,15 +36,8 @@ class SerperSearch():
                             "You can get a key at https://serper.dev/")
         return api_key
 
-    def search(self, max_results=7):
-        """
-        Searches the query
-        Returns:
-
-        """
-        print("Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using the Serp API."""
-
+    def _request(self, max_results: int) -> tuple[str, dict, str]:
+        """The URL, headers and body of a search request"""
         # Search the query (see https://serper.dev/playground for the format)
         url = "https://google.serper.dev/search"
 
@@ -53,14 +48,44 @@ class SerperSearch():
 
         # TODO: Add support for query domains
         data = json.dumps({"q": self.query, "num": max_results})
+        return url, headers, data
 
+    def search(self, max_results=7):
+        """
+        Searches the query
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using the Serp API."""
+
+        url, headers, data = self._request(max_results)
         resp = requests.request("POST", url, timeout=10, headers=headers, data=data)
 
         # Preprocess the results
         if resp is None:
             return
+        return self._format_results(resp.text)
+
+    async def asearch(self, max_results=7, http_client=None):
+        """
+        Searches the query like `search`, without blocking the event loop
+        Args:
+            max_results: Maximum number of results to return
+            http_client: Shared pooled async client to send the request with (optional)
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
+        url, headers, data = self._request(max_results)
+        async with async_http_client(http_client) as client:
+            resp = await client.post(url, timeout=10, headers=headers, content=data)
+        return self._format_results(resp.text)
+
+    @staticmethod
+    def _format_results(text):
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
         except Exception:
             return
         if search_results is None:
@@ -6,6 +6,8 @@ from typing import Literal, Sequence, Optional
 import requests
 import json
 
+from ..utils import async_http_client
+
 
 class TavilySearch:
     """
@@ -50,7 +52,7 @@ class TavilySearch:
         return api_key
 
 
-    def _search(
+    def _request_body(
         self,
         query: str,
         search_depth: Literal["basic", "advanced"] = "basic",
@@ -65,10 +67,9 @@ class TavilySearch:
         use_cache: bool = True,
     ) -> dict:
         """
-        Internal search method to send the request to the API.
+        Builds the body of a search request to the API.
         """
-
-        data = {
+        return {
             "query": query,
             "search_depth": search_depth,
             "topic": topic,
@@ -83,6 +84,29 @@ class TavilySearch:
             "use_cache": use_cache,
         }
 
+    def _search(
+        self,
+        query: str,
+        search_depth: Literal["basic", "advanced"] = "basic",
+        topic: str = "general",
+        days: int = 2,
+        max_results: int = 10,
+        include_domains: Sequence[str] = None,
+        exclude_domains: Sequence[str] = None,
+        include_answer: bool = False,
+        include_raw_content: bool = False,
+        include_images: bool = False,
+        use_cache: bool = True,
+    ) -> dict:
+        """
+        Internal search method to send the request to the API.
+        """
+
+        data = self._request_body(
+            query, search_depth, topic, days, max_results, include_domains, exclude_domains,
+            include_answer, include_raw_content, include_images, use_cache,
+        )
+
         response = requests.post(
             self.base_url, data=json.dumps(data), headers=self.headers, timeout=100
         )
@@ -108,14 +132,42 @@ class TavilySearch:
                 topic=self.topic,
                 include_domains=self.query_domains,
             )
-            sources = results.get("results", [])
-            if not sources:
-                raise Exception("No results found with Tavily API search.")
-            # Return the results
-            search_response = [
-                {"href": obj["url"], "body": obj["content"]} for obj in sources
-            ]
+            search_response = self._format_results(results)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
         return search_response
+
+    async def asearch(self, max_results=10, http_client=None):
+        """
+        Searches the query like `search`, without blocking the event loop
+        Args:
+            max_results: Maximum number of results to return
+            http_client: Shared pooled async client to send the request with (optional)
+        Returns:
+
+        """
+        try:
+            data = self._request_body(
+                self.query,
+                search_depth="basic",
+                max_results=max_results,
+                topic=self.topic,
+                include_domains=self.query_domains,
+            )
+            async with async_http_client(http_client) as client:
+                response = await client.post(self.base_url, json=data, headers=self.headers, timeout=100)
+            response.raise_for_status()
+            search_response = self._format_results(response.json())
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+        return search_response
+
+    @staticmethod
+    def _format_results(results: dict) -> list[dict]:
+        sources = results.get("results", [])
+        if not sources:
+            raise Exception("No results found with Tavily API search.")
+        # Return the results
+        return [{"href": obj["url"], "body": obj["content"]} for obj in sources]
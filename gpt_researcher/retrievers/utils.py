@@ -1,5 +1,11 @@
 import importlib.util
+import logging
 import os
+from contextlib import asynccontextmanager
+
+from ..utils.http_client import HTTPClient
+
+logger = logging.getLogger(__name__)
 
 VALID_RETRIEVERS = [
     "arxiv",
@@ -8,6 +14,7 @@ VALID_RETRIEVERS = [
     "duckduckgo",
     "exa",
     "google",
+    "local_bm25",
     "searchapi",
     "searx",
     "semantic_scholar",
@@ -17,6 +24,9 @@ VALID_RETRIEVERS = [
     "pubmed_central",
 ]
 
+# Seconds an HTTP request of a retriever may wait to connect or between reads
+HTTP_TIMEOUT = 20
+
 
 def check_pkg(pkg: str) -> None:
     if not importlib.util.find_spec(pkg):
@@ -26,6 +36,31 @@ def check_pkg(pkg: str) -> None:
             f"`pip install -U {pkg_kebab}`"
         )
 
+@asynccontextmanager
+async def async_http_client(http_client: HTTPClient | None = None):
+    """Yields the shared pooled client of the research, or a private one closed on exit."""
+    if http_client is not None:
+        yield http_client
+        return
+    client = HTTPClient(timeout=HTTP_TIMEOUT)
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+def parse_retriever_values(value: str | None) -> dict[str, float]:
+    """Parses per-retriever settings given as `retriever:number` pairs, e.g. `tavily:3600,arxiv:604800`"""
+    values = {}
+    for pair in (value or "").split(","):
+        if not pair.strip():
+            continue
+        retriever, _, number = pair.partition(":")
+        try:
+            values[retriever.strip()] = float(number)
+        except ValueError:
+            logger.warning(f"Ignoring malformed retriever setting {pair.strip()!r}, expected retriever:number")
+    return values
+
 # Get a list of all retriever names to be used as validators for supported retrievers
 def get_all_retriever_names() -> list:
     try:
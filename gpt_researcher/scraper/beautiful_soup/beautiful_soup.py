@@ -9,11 +9,40 @@ class BeautifulSoupScraper:
         self.link = link
         self.session = session
 
+    @staticmethod
+    def parse(html: bytes, url: str, encoding: str | None = None) -> tuple:
+        """
+        Parses a downloaded page into its cleaned text, relevant images and title.
+
+        This is the CPU-bound half of `scrape`. `Scraper` downloads the page with its pooled
+        async client and only hands this step to the worker pool.
+
+        Args:
+          html (bytes): The raw response body.
+          url (str): The page URL, used to resolve relative image links.
+          encoding (str, optional): The response encoding, if known.
+
+        Returns:
+          A tuple of (content, image_urls, title).
+        """
+        soup = BeautifulSoup(html, "lxml", from_encoding=encoding)
+
+        soup = clean_soup(soup)
+
+        content = get_text_from_soup(soup)
+
+        image_urls = get_relevant_images(soup, url)
+
+        # Extract the title using the utility function
+        title = extract_title(soup)
+
+        return content, image_urls, title
+
     def scrape(self):
         """
         This function scrapes content from a webpage by making a GET request, parsing the HTML using
         BeautifulSoup, and extracting script and style elements before returning the cleaned content.
-        
+
         Returns:
           The `scrape` method is returning the cleaned and extracted content from the webpage specified
         by the `self.link` attribute. The method fetches the webpage content, removes script and style
@@ -22,21 +51,8 @@ class BeautifulSoupScraper:
         """
         try:
             response = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response.content, "lxml", from_encoding=response.encoding
-            )
-
-            soup = clean_soup(soup)
-
-            content = get_text_from_soup(soup)
-
-            image_urls = get_relevant_images(soup, self.link)
-            
-            # Extract the title using the utility function
-            title = extract_title(soup)
-
-            return content, image_urls, title
+            return self.parse(response.content, self.link, response.encoding)
 
         except Exception as e:
             print("Error! : " + str(e))
-            return "", [], ""
\ No newline at end of file
+            return "", [], ""
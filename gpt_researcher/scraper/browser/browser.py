@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import traceback
 import pickle
 from pathlib import Path
@@ -12,6 +13,7 @@ import os
 from bs4 import BeautifulSoup
 from typing import Iterable, cast
 
+from .driver_pool import DriverPool, get_driver_pool
 from .processing.scrape_skills import (scrape_pdf_with_pymupdf,
                                        scrape_pdf_with_arxiv)
 
@@ -22,9 +24,11 @@ from ..utils import get_relevant_images, extract_title, get_text_from_soup, clea
 FILE_DIR = Path(__file__).parent.parent
 
 class BrowserScraper:
-    def __init__(self, url: str, session=None):
+    def __init__(self, url: str, session=None, driver_pool: DriverPool | None = None):
         self.url = url
         self.session = session
+        # Pool of warm drivers used by `scrape_async`, the default pool of the loop if not given
+        self.driver_pool = driver_pool
         self.selenium_web_browser = "chrome"
         self.headless = False
         self.user_agent = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -58,6 +62,48 @@ class BrowserScraper:
                 self.driver.quit()
             self._cleanup_cookie_file()
 
+    async def scrape_async(self) -> tuple:
+        """
+        Scrapes the page with a warm driver from the shared pool instead of starting a browser.
+
+        The blocking Selenium calls run in a thread so other pages keep loading meanwhile.
+        Errors are raised so the caller counts the page as failed, rather than scraping the
+        error message as its text.
+        """
+        if not self.url:
+            print("URL not specified")
+            return "A URL was not specified, cancelling request to browse website.", [], ""
+
+        if self.driver_pool is None:
+            self.driver_pool = get_driver_pool()
+        try:
+            return await self.driver_pool.run(
+                self._create_pooled_driver, self._scrape_with_pooled_driver
+            )
+        finally:
+            self.driver = None
+
+    def _scrape_with_pooled_driver(self, driver) -> tuple:
+        self.driver = driver
+        self._add_header()
+        return self.scrape_text_with_selenium()
+
+    def _create_pooled_driver(self):
+        """Starts a driver for the pool and warms it up with the pool's shared cookie jar."""
+        self.setup_driver()
+        pool = self.driver_pool
+        try:
+            self.driver.get("https://www.google.com")
+            if pool.cookies:
+                for cookie in pool.cookies:
+                    self.driver.add_cookie(cookie)
+            else:
+                time.sleep(2)  # Wait for cookies to be set
+                pool.cookies = self.driver.get_cookies()
+        except Exception as e:
+            print(f"Failed to visit Google and load cookies: {str(e)}")
+        return self.driver
+
     def _import_selenium(self):
         try:
             global webdriver, By, EC, WebDriverWait, TimeoutException, WebDriverException
@@ -103,7 +149,8 @@ class BrowserScraper:
             else:  # chrome
                 if platform == "linux" or platform == "linux2":
                     options.add_argument("--disable-dev-shm-usage")
-                    options.add_argument("--remote-debugging-port=9222")
+                    # Let Chrome pick a free port so pooled drivers can run side by side
+                    options.add_argument("--remote-debugging-port=0")
                 options.add_argument("--no-sandbox")
                 options.add_experimental_option("prefs", {"download_restrictions": 3})
                 self.driver = webdriver.Chrome(options=options)
@@ -0,0 +1,144 @@
+import asyncio
+import atexit
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class PooledDriver:
+    def __init__(self, driver: Any):
+        self.driver = driver
+        self.pages = 0
+
+
+class DriverPool:
+    """
+    Pool of warm Selenium drivers shared by the `BrowserScraper`s of an event loop.
+
+    Drivers are started on demand up to `size`, handed out through the async `acquire`/`release`
+    API (or the `driver` context manager), checked before reuse and recycled after `max_pages`
+    pages. The cookies collected by the first driver are kept in a shared jar and loaded into
+    every driver started later.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, size: int = 3, max_pages: int = 50):
+        self.size = size
+        self.max_pages = max_pages
+        self.cookies: list[dict] = []
+        self._idle: list[PooledDriver] = []
+        self._busy: set[PooledDriver] = set()
+        self._semaphore = asyncio.Semaphore(size)
+        atexit.register(self.close)
+
+    async def acquire(self, create_driver: Callable[[], Any]) -> PooledDriver:
+        """
+        Waits for a free slot and returns a healthy idle driver, or starts a new one with
+        `create_driver` (run in a thread, as starting a browser blocks for seconds).
+        """
+        await self._semaphore.acquire()
+        try:
+            while self._idle:
+                pooled = self._idle.pop()
+                if await asyncio.to_thread(self._is_healthy, pooled):
+                    break
+                self.logger.info("Discarding an unresponsive browser driver")
+                await asyncio.to_thread(self._quit, pooled)
+            else:
+                pooled = PooledDriver(await asyncio.to_thread(create_driver))
+        except BaseException:
+            self._semaphore.release()
+            raise
+        self._busy.add(pooled)
+        return pooled
+
+    async def release(self, pooled: PooledDriver, broken: bool = False) -> None:
+        """Returns a driver to the pool, or quits it if it failed or has served `max_pages`."""
+        self._busy.discard(pooled)
+        pooled.pages += 1
+        try:
+            if broken or pooled.pages >= self.max_pages:
+                await asyncio.to_thread(self._quit, pooled)
+            else:
+                self._idle.append(pooled)
+        finally:
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def driver(self, create_driver: Callable[[], Any]):
+        """
+        Holds a pooled driver for the duration of the block. The driver is quit if the block
+        fails, but not if it is cancelled, as cancelling says nothing about the driver's health.
+        """
+        pooled = await self.acquire(create_driver)
+        broken = False
+        try:
+            yield pooled.driver
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            broken = True
+            raise
+        finally:
+            await self.release(pooled, broken=broken)
+
+    async def run(self, create_driver: Callable[[], Any], func: Callable[[Any], T]) -> T:
+        """
+        Runs the blocking `func(driver)` in a thread with a pooled driver.
+
+        A thread cannot be interrupted, so if the caller is cancelled the driver stays checked
+        out until `func` returns, and the cancellation is raised once it has been released.
+        """
+        async with self.driver(create_driver) as driver:
+            job = asyncio.ensure_future(asyncio.to_thread(func, driver))
+            try:
+                return await asyncio.shield(job)
+            except asyncio.CancelledError:
+                while not job.done():
+                    try:
+                        await asyncio.wait({job})
+                    except asyncio.CancelledError:
+                        pass
+                raise
+
+    @staticmethod
+    def _is_healthy(pooled: PooledDriver) -> bool:
+        try:
+            pooled.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, pooled: PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Failed to quit browser driver: {e}")
+
+    def close(self) -> None:
+        """Quits every driver. Registered to run at interpreter exit."""
+        for pooled in self._idle + list(self._busy):
+            self._quit(pooled)
+        self._idle.clear()
+        self._busy.clear()
+
+
+# Pools by event loop and settings, as a pool's semaphore can only be used in one loop
+_driver_pools: dict[tuple[asyncio.AbstractEventLoop, int, int], DriverPool] = {}
+
+
+def get_driver_pool(size: int = 3, max_pages: int = 50) -> DriverPool:
+    """
+    Returns the driver pool with these settings of the running event loop, creating it on
+    first use. The pools of loops that have been closed since are closed.
+    """
+    for key in [key for key in _driver_pools if key[0].is_closed()]:
+        _driver_pools.pop(key).close()
+    key = (asyncio.get_running_loop(), size, max_pages)
+    pool = _driver_pools.get(key)
+    if pool is None:
+        pool = _driver_pools[key] = DriverPool(size, max_pages)
+    return pool
@@ -8,9 +8,23 @@ from typing import Dict, cast, Tuple, List
 import requests
 import asyncio
 import logging
+import time
 
 from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
 
+# Milliseconds since the DOM last changed, or 0 while the document is still loading. The
+# observer is installed on first use and lives as long as the document.
+DOM_IDLE_JS = """
+(() => {
+    if (!window.__gptrObserver) {
+        window.__gptrLastMutation = Date.now();
+        window.__gptrObserver = new MutationObserver(() => { window.__gptrLastMutation = Date.now(); });
+        window.__gptrObserver.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    }
+    return document.readyState === "complete" ? Date.now() - window.__gptrLastMutation : 0;
+})()
+"""
+
 
 class NoDriverScraper:
     logger = logging.getLogger(__name__)
@@ -40,11 +54,28 @@ class NoDriverScraper:
             self.tab_mode = True
             self.max_scroll_percent = 500
             self.stopping = False
+            # Finished tabs are parked on about:blank and reused for the next pages
+            self.idle_tabs: List["zendriver.Tab"] = []
+            self.max_idle_tabs = 4
+            self.dom_idle_time = 0.5
+            self.dom_idle_timeout = 3.0
 
         async def get(self, url: str) -> "zendriver.Tab":
             self.processing_count += 1
             try:
                 async with self.rate_limit_for_domain(url):
+                    if self.idle_tabs:
+                        tab = self.idle_tabs.pop()
+                        try:
+                            await tab.get(url)
+                        except Exception:
+                            # The tab left the pool, close it rather than leak it
+                            try:
+                                await tab.close()
+                            except Exception:
+                                pass
+                            raise
+                        return tab
                     new_window = not self.has_blank_page
                     self.has_blank_page = False
                     if self.tab_mode:
@@ -55,7 +86,32 @@ class NoDriverScraper:
                 self.processing_count -= 1
                 raise
 
-        async def scroll_page_to_bottom(self, page: "zendriver.Tab"):
+        async def wait_for_page(self, page: "zendriver.Tab", adaptive: bool = True):
+            """
+            Waits for the page to finish loading and rendering before it is read: until the DOM
+            stops changing if `adaptive`, or else for a fixed time.
+            """
+            if adaptive:
+                await self.wait_for_dom_idle(page)
+                return
+            await page.wait(2)
+            await page.sleep(random.uniform(1, 2.3))
+            await page.wait(random.uniform(2, 3))
+
+        async def wait_for_dom_idle(self, page: "zendriver.Tab"):
+            """Waits until the DOM has not changed for `dom_idle_time` seconds, at most `dom_idle_timeout`."""
+            deadline = time.monotonic() + self.dom_idle_timeout
+            while time.monotonic() < deadline:
+                idle_ms = await page.evaluate(DOM_IDLE_JS)
+                if idle_ms and idle_ms >= self.dom_idle_time * 1000:
+                    return
+                await page.sleep(0.1)
+
+        async def scroll_page_to_bottom(self, page: "zendriver.Tab", adaptive: bool = True):
+            if adaptive:
+                await self.scroll_page_adaptively(page)
+                return
+
             total_scroll_percent = 0
             while True:
                 # in tab mode, we need to bring the tab to front before scrolling to load the page content properly
@@ -78,8 +134,28 @@ class NoDriverScraper:
                 ):
                     break
 
+        async def scroll_page_adaptively(self, page: "zendriver.Tab"):
+            """Scrolls to the bottom until the page stops growing, e.g. after infinite scroll loads."""
+            height = await page.evaluate("document.scrollingElement.scrollHeight")
+            for _ in range(self.max_scroll_percent // 100):
+                if self.tab_mode:
+                    await page.bring_to_front()
+                await page.evaluate("window.scrollTo(0, document.scrollingElement.scrollHeight)")
+                await self.wait_for_dom_idle(page)
+                new_height = await page.evaluate("document.scrollingElement.scrollHeight")
+                if new_height <= height:
+                    break
+                height = new_height
+
         async def close_page(self, page: "zendriver.Tab"):
             try:
+                if not self.stopping and len(self.idle_tabs) < self.max_idle_tabs:
+                    try:
+                        await page.get("about:blank")
+                        self.idle_tabs.append(page)
+                        return
+                    except Exception:
+                        pass
                 await page.close()
             finally:
                 self.processing_count -= 1
@@ -94,23 +170,26 @@ class NoDriverScraper:
                 if not semaphore:
                     semaphore = asyncio.Semaphore(1)
                     self.domain_semaphores[domain] = semaphore
-
-                was_locked = semaphore.locked()
-                async with semaphore:
-                    if was_locked:
-                        await asyncio.sleep(random.uniform(0.6, 1.2))
-                    yield
-
             except Exception as e:
                 # Log error but don't block the request
                 NoDriverScraper.logger.warning(
                     f"Rate limiting error for {url}: {str(e)}"
                 )
+                yield
+                return
+
+            # Errors of the request itself propagate to the caller
+            was_locked = semaphore.locked()
+            async with semaphore:
+                if was_locked:
+                    await asyncio.sleep(random.uniform(0.6, 1.2))
+                yield
 
         async def stop(self):
             if self.stopping:
                 return
             self.stopping = True
+            self.idle_tabs.clear()
             await self.driver.stop()
 
     @classmethod
@@ -160,10 +239,13 @@ class NoDriverScraper:
                 finally:
                     cls.browsers.discard(browser)
 
-    def __init__(self, url: str, session: requests.Session | None = None):
+    def __init__(self, url: str, session: requests.Session | None = None, adaptive_scroll: bool = True):
         self.url = url
         self.session = session
+        # Stop waiting and scrolling once the DOM stops changing instead of sleeping a fixed time
+        self.adaptive_scroll = adaptive_scroll
         self.debug = False
+        self.timings: Dict[str, float] = {}
 
     async def scrape_async(self) -> Tuple[str, List[str], str]:
         """Returns tuple of (text, image_urls, title)"""
@@ -183,18 +265,29 @@ class NoDriverScraper:
                 self.logger.error(f"Failed to initialize browser: {str(e)}")
                 return str(e), [], ""
 
+            started = time.perf_counter()
             page = await browser.get(self.url)
-            await page.wait(2)
-            await page.sleep(random.uniform(1, 2.3))
-            await page.wait(random.uniform(2, 3))
-
-            await browser.scroll_page_to_bottom(page)
+            loaded = time.perf_counter()
+            await browser.wait_for_page(page, self.adaptive_scroll)
+            settled = time.perf_counter()
+            await browser.scroll_page_to_bottom(page, self.adaptive_scroll)
+            scrolled = time.perf_counter()
             html = await page.get_content()
             soup = BeautifulSoup(html, "lxml")
             clean_soup(soup)
             text = get_text_from_soup(soup)
             image_urls = get_relevant_images(soup, self.url)
             title = extract_title(soup)
+            self.timings = {
+                "load": loaded - started,
+                "settle": settled - loaded,
+                "scroll": scrolled - settled,
+                "extract": time.perf_counter() - scrolled,
+            }
+            self.logger.info(
+                f"Timings for {self.url}: "
+                + ", ".join(f"{step} {seconds:.2f}s" for step, seconds in self.timings.items())
+            )
 
             if len(text) < 200:
                 self.logger.warning(
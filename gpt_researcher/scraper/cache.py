@@ -0,0 +1,171 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+
+class PageCache:
+    """
+    Persistent SQLite cache of scraped pages.
+
+    Stores the extracted `raw_content` (zlib-compressed), `image_urls` and `title` of a page
+    together with its ETag/Last-Modified validators. Entries younger than `ttl` seconds are
+    served without any network traffic; older entries are revalidated with a conditional GET
+    by the caller. The cache is bounded by `max_size` bytes and evicts least recently used
+    entries first.
+
+    `stats` counts fresh pages served as hits, and stale pages found as revalidations.
+    """
+
+    def __init__(self, path: str, ttl: float = 86400, max_size: int = 256 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                raw_content BLOB,
+                image_urls TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL,
+                accessed_at REAL,
+                size INTEGER
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_accessed_at ON pages (accessed_at)")
+        self._conn.commit()
+        # Bytes of the stored entries, summed once and then kept up to date by `put` and
+        # `_evict`. Entries written by other processes are counted when the cache is reopened.
+        (self._size,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()
+
+    @staticmethod
+    def cache_key(url: str) -> str:
+        """Normalises a URL into the key it is stored under."""
+        parts = urlsplit(url.strip())
+        return urlunsplit(
+            (parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, "")
+        )
+
+    def is_fresh(self, page: dict[str, Any]) -> bool:
+        return time.time() - page["fetched_at"] < self.ttl
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """
+        Looks up a page.
+
+        Returns:
+            The cached page in the same shape as `Scraper.extract_data_from_url` results, plus
+            `etag`, `last_modified` and `fetched_at`, or None if the page is not cached.
+        """
+        key = self.cache_key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, raw_content, image_urls, etag, last_modified, fetched_at "
+                "FROM pages WHERE url = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if time.time() - row[5] < self.ttl:
+                self.hits += 1
+            else:
+                self.revalidations += 1
+            self._conn.execute(
+                "UPDATE pages SET accessed_at = ? WHERE url = ?", (time.time(), key)
+            )
+            self._conn.commit()
+
+        title, raw_content, image_urls, etag, last_modified, fetched_at = row
+        return {
+            "url": url,
+            "raw_content": zlib.decompress(raw_content).decode("utf-8"),
+            "image_urls": json.loads(image_urls),
+            "title": title,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": fetched_at,
+        }
+
+    def put(
+        self,
+        url: str,
+        raw_content: str,
+        image_urls: list,
+        title: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Stores (or refreshes) a page and evicts old entries if the cache is over its size bound."""
+        blob = zlib.compress(raw_content.encode("utf-8"))
+        images = json.dumps(image_urls)
+        size = len(blob) + len(images) + len(title or "")
+        now = time.time()
+        key = self.cache_key(url)
+        with self._lock:
+            replaced = self._conn.execute("SELECT size FROM pages WHERE url = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(url, title, raw_content, image_urls, etag, last_modified, fetched_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, title, blob, images, etag, last_modified, now, now, size),
+            )
+            self._size += size - (replaced[0] if replaced else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        if self._size <= self.max_size:
+            return
+        rows = self._conn.execute("SELECT url, size FROM pages ORDER BY accessed_at ASC")
+        evicted = []
+        for url, size in rows:
+            if self._size <= self.max_size:
+                break
+            evicted.append((url,))
+            self._size -= size
+        self._conn.executemany("DELETE FROM pages WHERE url = ?", evicted)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "revalidations": self.revalidations}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# One cache per file for the whole process, so researches do not each open a connection
+_page_caches: dict[str, PageCache] = {}
+_page_caches_lock = threading.Lock()
+
+
+def get_page_cache(path: str, ttl: float = 86400, max_size: int = 256 * 1024 * 1024) -> PageCache:
+    """Returns the shared page cache of the file, with the settings of the latest caller."""
+    key = os.path.abspath(path)
+    with _page_caches_lock:
+        cache = _page_caches.get(key)
+        if cache is None:
+            cache = PageCache(path, ttl, max_size)
+            _page_caches[key] = cache
+        cache.ttl = ttl
+        cache.max_size = max_size
+    return cache
@@ -0,0 +1,133 @@
+from gpt_researcher.utils.http_client import HTTPClient
+
+# Bytes read before deciding what the payload is
+SNIFF_SIZE = 1024
+
+PDF = "application/pdf"
+HTML = "text/html"
+TEXT = "text/plain"
+BINARY = "application/octet-stream"
+
+_BINARY_SIGNATURES = (
+    b"\x89PNG",
+    b"\xff\xd8\xff",  # JPEG
+    b"GIF8",
+    b"RIFF",  # WebP, WAV, AVI
+    b"PK\x03\x04",  # Zip, docx, xlsx, epub
+    b"\x1f\x8b",  # Gzip
+    b"7z\xbc\xaf",
+    b"Rar!",
+    b"ID3",  # MP3
+    b"OggS",
+    b"fLaC",
+    b"\x1a\x45\xdf\xa3",  # WebM, MKV
+    b"\xd0\xcf\x11\xe0",  # Legacy Office documents
+    b"MZ",  # Windows executables
+    b"\x7fELF",
+)
+_HTML_PREFIXES = (
+    b"<!doctype html", b"<html", b"<head", b"<body", b"<title", b"<meta", b"<div", b"<p", b"<!--",
+)
+
+
+class DownloadAborted(Exception):
+    """Raised when a download is stopped early because the payload cannot be scraped."""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        # Status of the error page that was refused, None if the body itself was refused
+        self.status_code = status_code
+
+
+class Download:
+    """The body and metadata of a page fetched with `download`."""
+
+    def __init__(self, response, content: bytes, mime: str):
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.encoding = response.charset_encoding
+        self.content = content
+        self.mime = mime
+
+
+def sniff_mime(head: bytes, content_type: str | None = None) -> str:
+    """
+    Guesses the type of a payload from its first bytes, falling back to the declared
+    `Content-Type` only when the bytes are inconclusive, since servers often mislabel files.
+
+    Returns:
+        One of `PDF`, `HTML`, `TEXT` or `BINARY`.
+    """
+    stripped = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if stripped.startswith(b"%pdf-"):
+        return PDF
+    if head.startswith(_BINARY_SIGNATURES) or head[4:8] == b"ftyp":  # ftyp: MP4, MOV, HEIC
+        return BINARY
+    if stripped.startswith(_HTML_PREFIXES):
+        return HTML
+
+    declared = (content_type or "").split(";")[0].strip().lower()
+    if declared == PDF:
+        return PDF
+    if declared in ("text/html", "application/xhtml+xml"):
+        return HTML
+    # NUL bytes never appear in text in the usual web encodings (UTF-16 pages are not scraped)
+    if b"\x00" in head:
+        return BINARY
+    if declared and not (declared.startswith("text/") or declared.endswith(("xml", "json"))):
+        return BINARY
+    return TEXT
+
+
+async def download(
+    http_client: HTTPClient,
+    url: str,
+    max_bytes: int | None = None,
+    headers: dict | None = None,
+) -> Download:
+    """
+    Streams a page body with a size bound and stops as soon as it is known to be useless.
+
+    The body is not read at all for error statuses or when `Content-Length` is over
+    `max_bytes`, and reading stops after the first bytes if they are not HTML, text or PDF.
+
+    Args:
+        http_client: The pooled client to download with.
+        url: The URL to download.
+        max_bytes: Maximum body size; larger downloads are aborted. None disables the bound.
+        headers: Extra request headers, e.g. conditional request validators.
+
+    Returns:
+        The downloaded page. `content` is empty for 304 and 429/503 answers, which the caller
+        handles from the status code and headers.
+
+    Raises:
+        DownloadAborted: If the payload is an error page, too large or not text.
+    """
+    async with http_client.stream("GET", url, headers=headers) as response:
+        if response.status_code in (304, 429, 503):
+            return Download(response, b"", "")
+        if response.is_error:
+            raise DownloadAborted(f"HTTP {response.status_code}", response.status_code)
+
+        content_length = response.headers.get("Content-Length", "")
+        if max_bytes and content_length.isdigit() and int(content_length) > max_bytes:
+            raise DownloadAborted(f"body of {content_length} bytes exceeds the {max_bytes} byte limit")
+
+        body = bytearray()
+        mime = None
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if max_bytes and len(body) > max_bytes:
+                raise DownloadAborted(f"body exceeds the {max_bytes} byte limit")
+            if mime is None and len(body) >= SNIFF_SIZE:
+                mime = sniff_mime(bytes(body[:SNIFF_SIZE]), response.headers.get("Content-Type"))
+                if mime == BINARY:
+                    raise DownloadAborted("binary payload")
+
+        if mime is None:
+            mime = sniff_mime(bytes(body), response.headers.get("Content-Type"))
+            if mime == BINARY:
+                raise DownloadAborted("binary payload")
+
+        return Download(response, bytes(body), mime)
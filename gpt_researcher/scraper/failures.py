@@ -0,0 +1,131 @@
+import logging
+import time
+
+from .scheduler import DomainScheduler
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class DomainCircuit:
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_started_at = None
+
+
+class FailureTracker:
+    """
+    Circuit breaker over the domains scraped by the process, plus a negative cache of URLs
+    that recently failed.
+
+    A domain's circuit opens after `error_budget` consecutive pages failed because the host is
+    down or overloaded, and its URLs are skipped for `cooldown` seconds. After that the circuit is half-open: a single trial URL is
+    let through, and its outcome closes the circuit again or reopens it for another cooldown.
+    Failed URLs are skipped for `failed_url_ttl` seconds regardless of their domain's state,
+    whatever the cause of their failure.
+
+    Only domains with failures and URLs that have not expired are kept, at most `max_entries`
+    of each, forgetting the least recently failed first.
+    """
+
+    def __init__(
+        self,
+        error_budget: int = 3,
+        cooldown: float = 300,
+        failed_url_ttl: float = 3600,
+        max_entries: int = 10000,
+    ):
+        self.error_budget = error_budget
+        self.cooldown = cooldown
+        self.failed_url_ttl = failed_url_ttl
+        self.max_entries = max_entries
+        # Both ordered from the least to the most recently failed
+        self._circuits: dict[str, DomainCircuit] = {}
+        self._failed_urls: dict[str, float] = {}
+
+    def allow(self, url: str) -> bool:
+        """Tells whether the URL should be scheduled. Grants the trial of a half-open domain."""
+        now = time.monotonic()
+        failed_until = self._failed_urls.get(url)
+        if failed_until is not None:
+            if failed_until > now:
+                return False
+            del self._failed_urls[url]
+
+        circuit = self._circuits.get(DomainScheduler.get_domain(url))
+        if circuit is None:
+            return True
+        if circuit.state == OPEN and now - circuit.opened_at >= self.cooldown:
+            circuit.state = HALF_OPEN
+            circuit.trial_started_at = None
+        if circuit.state == OPEN:
+            return False
+        if circuit.state == HALF_OPEN:
+            # A trial that never reported back (e.g. its URL was dropped) does not block forever
+            if circuit.trial_started_at is not None and now - circuit.trial_started_at < self.cooldown:
+                return False
+            circuit.trial_started_at = now
+        return True
+
+    def filter(self, urls: list[str]) -> list[str]:
+        return [url for url in urls if self.allow(url)]
+
+    def record_success(self, url: str) -> None:
+        # A closed circuit without failures is the same as no circuit
+        self._circuits.pop(DomainScheduler.get_domain(url), None)
+
+    def record_failure(self, url: str, host_failure: bool = True) -> None:
+        """
+        Records a failed URL. Only `host_failure`s (transport errors, timeouts, 429 and 5xx
+        answers) count towards opening its domain's circuit; other failures, such as a missing
+        or empty page, show that the host answers.
+        """
+        now = time.monotonic()
+        self._failed_urls.pop(url, None)
+        self._failed_urls[url] = now + self.failed_url_ttl
+        # The TTL is the same for every URL, so they expire in the order they failed
+        while self._failed_urls:
+            oldest = next(iter(self._failed_urls))
+            if self._failed_urls[oldest] > now and len(self._failed_urls) <= self.max_entries:
+                break
+            del self._failed_urls[oldest]
+        if not host_failure:
+            self.record_success(url)
+            return
+
+        domain = DomainScheduler.get_domain(url)
+        circuit = self._circuits.pop(domain, None) or DomainCircuit()
+        self._circuits[domain] = circuit
+        while len(self._circuits) > self.max_entries:
+            del self._circuits[next(iter(self._circuits))]
+        circuit.failures += 1
+        if circuit.state == HALF_OPEN or circuit.failures >= self.error_budget:
+            if circuit.state != OPEN:
+                logger.warning(
+                    f"Skipping {DomainScheduler.get_domain(url)} for {self.cooldown:.0f}s "
+                    f"after {circuit.failures} failed pages"
+                )
+            circuit.state = OPEN
+            circuit.opened_at = now
+
+
+# Shared by every research of the process, so a dead host found by one research is skipped
+# by the next
+_failure_trackers: dict[tuple, FailureTracker] = {}
+
+
+def get_failure_tracker(
+    error_budget: int = 3, cooldown: float = 300, failed_url_ttl: float = 3600
+) -> FailureTracker:
+    """Returns the shared failure tracker with the given settings."""
+    key = (error_budget, cooldown, failed_url_ttl)
+    tracker = _failure_trackers.get(key)
+    if tracker is None:
+        tracker = FailureTracker(error_budget, cooldown, failed_url_ttl)
+        _failure_trackers[key] = tracker
+    return tracker
@@ -1,8 +1,14 @@
+import asyncio
+import time
 from bs4 import BeautifulSoup
 import os
 from ..utils import get_relevant_images
 
 class FireCrawl:
+    max_batch_size = 50
+    # Seconds between batch job status checks, and before a batch job is given up
+    poll_interval = 1.0
+    batch_timeout = 120.0
 
     def __init__(self, link, session=None):
         self.link = link
@@ -10,7 +16,8 @@ class FireCrawl:
         from firecrawl import FirecrawlApp
         self.firecrawl = FirecrawlApp(api_key=self.get_api_key(), api_url=self.get_server_url())
 
-    def get_api_key(self) -> str:
+    @staticmethod
+    def get_api_key() -> str:
         """
         Gets the FireCrawl API key
         Returns:
@@ -23,7 +30,8 @@ class FireCrawl:
                 "FireCrawl API key not found. Please set the FIRECRAWL_API_KEY environment variable.")
         return api_key
 
-    def get_server_url(self) -> str:
+    @staticmethod
+    def get_server_url() -> str:
         """
         Gets the FireCrawl server URL.
         Default to official FireCrawl server ('https://api.firecrawl.dev').
@@ -76,4 +84,67 @@ class FireCrawl:
 
         except Exception as e:
             print("Error! : " + str(e))
-            return "", [], ""
\ No newline at end of file
+            return "", [], ""
+
+    @classmethod
+    async def scrape_batch(cls, urls: list[str], http_client) -> dict[str, tuple]:
+        """
+        Scrapes many links with a single FireCrawl batch scrape job. The job returns the page HTML
+        along with the markdown, so images are found without downloading the pages again.
+
+        Args:
+          urls: The links to scrape, at most `max_batch_size`.
+          http_client: The pooled `HTTPClient` to call the FireCrawl API with.
+
+        Returns:
+          A dict mapping each scraped link to a (content, image_urls, title) tuple. Links that
+        FireCrawl failed to scrape are left out.
+        """
+        server_url = cls.get_server_url().rstrip("/")
+        headers = {"Authorization": f"Bearer {cls.get_api_key()}"}
+        response = await http_client.post(
+            f"{server_url}/v1/batch/scrape",
+            json={"urls": urls, "formats": ["markdown", "html"]},
+            headers=headers,
+            timeout=30,
+        )
+        response.raise_for_status()
+        job = response.json()
+        if not job.get("success"):
+            raise Exception(f"FireCrawl batch scrape failed: {job.get('error')}")
+
+        # The job runs asynchronously: poll until it completes, then follow the result pages
+        status_url = f"{server_url}/v1/batch/scrape/{job['id']}"
+        deadline = time.monotonic() + cls.batch_timeout
+        while True:
+            response = await http_client.get(status_url, headers=headers, timeout=30)
+            response.raise_for_status()
+            status = response.json()
+            if status.get("status") == "completed":
+                break
+            if status.get("status") == "failed":
+                raise Exception(f"FireCrawl batch scrape failed: {status.get('error')}")
+            if time.monotonic() > deadline:
+                raise Exception(f"FireCrawl batch scrape timed out after {cls.batch_timeout:.0f}s")
+            await asyncio.sleep(cls.poll_interval)
+
+        documents = list(status.get("data", []))
+        while status.get("next"):
+            response = await http_client.get(status["next"], headers=headers, timeout=30)
+            response.raise_for_status()
+            status = response.json()
+            documents.extend(status.get("data", []))
+
+        pages = {}
+        for document in documents:
+            metadata = document.get("metadata", {})
+            url = metadata.get("sourceURL") or metadata.get("url")
+            if not url or metadata.get("statusCode") != 200:
+                continue
+            image_urls = await asyncio.to_thread(cls._find_images, document.get("html") or "", url)
+            pages[url] = (document.get("markdown") or "", image_urls, metadata.get("title") or "")
+        return pages
+
+    @staticmethod
+    def _find_images(html: str, url: str) -> list:
+        return get_relevant_images(BeautifulSoup(html, "lxml"), url) if html else []
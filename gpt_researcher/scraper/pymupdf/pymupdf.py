@@ -1,8 +1,6 @@
-import os
+import pymupdf
 import requests
-import tempfile
 from urllib.parse import urlparse
-from langchain_community.document_loaders import PyMuPDFLoader
 
 
 class PyMuPDFScraper:
@@ -31,38 +29,69 @@ class PyMuPDFScraper:
         except Exception:
             return False
 
-    def scrape(self) -> str:
+    @staticmethod
+    def parse(
+        data: bytes,
+        url: str,
+        encoding: str | None = None,
+        max_pages: int = 10,
+        max_chars: int = 20000,
+    ) -> tuple:
         """
-        The `scrape` function uses PyMuPDFLoader to load a document from the provided link (either URL or local file)
-        and returns the document as a string.
+        Extracts a downloaded PDF document from memory.
+
+        Args:
+          data (bytes): The PDF file content.
+          url (str): The URL the document was downloaded from.
+          encoding (str, optional): Unused, accepted for parity with the HTML scrapers.
+          max_pages (int): Maximum number of pages to extract.
+          max_chars (int): Extraction stops once this many characters have been collected.
 
         Returns:
-          str: A string representation of the loaded document.
+          A tuple of (content, image_urls, title).
         """
-        try:
-            if self.is_url():
-                response = requests.get(self.link, timeout=5, stream=True)
-                response.raise_for_status()
+        with pymupdf.open(stream=data, filetype="pdf") as document:
+            return PyMuPDFScraper.extract(document, max_pages, max_chars)
+
+    @staticmethod
+    def extract(document, max_pages: int = 10, max_chars: int = 20000) -> tuple:
+        """
+        Extracts text page by page from an open document, stopping at the page or
+        character budget so the rest of the document is never parsed.
+        """
+        pages = []
+        length = 0
+        for page_number in range(min(max_pages, document.page_count)):
+            text = document.load_page(page_number).get_text().strip()
+            if not text:
+                continue
+            pages.append(text)
+            length += len(text)
+            if length >= max_chars:
+                break
 
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-                    temp_filename = temp_file.name  # Get the temporary file name
-                    for chunk in response.iter_content(chunk_size=8192):
-                        temp_file.write(chunk)  # Write the downloaded content to the temporary file
+        title = (document.metadata or {}).get("title") or ""
+        # PDFs do not carry scorable images
+        return "\n\n".join(pages)[:max_chars], [], title
 
-                loader = PyMuPDFLoader(temp_filename)
-                doc = loader.load()
+    def scrape(self) -> tuple:
+        """
+        Extracts the PDF document at the provided link (either URL or local file).
 
-                os.remove(temp_filename)
-            else:
-                loader = PyMuPDFLoader(self.link)
-                doc = loader.load()
+        Returns:
+          A tuple of (content, image_urls, title).
+        """
+        try:
+            if self.is_url():
+                response = requests.get(self.link, timeout=5)
+                response.raise_for_status()
+                return self.parse(response.content, self.link)
 
-            # Extract the content, image (if any), and title from the document.
-            image = []
-            # Retrieve the content of the first page to minimize embedding costs.
-            return doc[0].page_content, image, doc[0].metadata["title"]
+            with pymupdf.open(self.link) as document:
+                return self.extract(document)
 
         except requests.exceptions.Timeout:
             print(f"Download timed out. Please check the link : {self.link}")
         except Exception as e:
             print(f"Error loading PDF : {self.link} {e}")
+        return "", [], ""
@@ -0,0 +1,140 @@
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of blocking."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how many seconds the caller must wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class DomainState:
+    def __init__(self, max_concurrency: int, rate: float):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.bucket = TokenBucket(rate, max(1, max_concurrency))
+        self.paused_until = 0.0
+        self.preferred_scraper = None
+
+
+class DomainScheduler:
+    """
+    Politeness scheduler for the scrape path.
+
+    Every request to a domain goes through `slot`, which enforces a per-domain concurrency cap,
+    a per-domain token bucket and any pause requested by the site through `Retry-After`.
+    It also remembers which scraper tier works for each domain.
+    Requests waiting on a busy domain do not hold a global worker slot, so other hosts keep the
+    global concurrency saturated.
+    """
+
+    def __init__(
+        self,
+        max_per_domain: int = 4,
+        rate: float = 4.0,
+        max_retries: int = 2,
+        max_retry_after: float = 30,
+    ):
+        self.max_per_domain = max_per_domain
+        self.rate = rate
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self._domains: dict[str, DomainState] = {}
+
+    @staticmethod
+    def get_domain(url: str) -> str:
+        domain = urlparse(url).netloc.lower()
+        return domain[4:] if domain.startswith("www.") else domain
+
+    def _state(self, url: str) -> DomainState:
+        domain = self.get_domain(url)
+        state = self._domains.get(domain)
+        if state is None:
+            state = DomainState(self.max_per_domain, self.rate)
+            self._domains[domain] = state
+        return state
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Waits until a request to the URL's domain is allowed and holds the slot while it runs."""
+        state = self._state(url)
+        async with state.semaphore:
+            delay = state.bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            while (pause := state.paused_until - time.monotonic()) > 0:
+                await asyncio.sleep(pause)
+            yield
+
+    def backoff(self, url: str, retry_after: str | None, attempt: int = 0) -> float | None:
+        """
+        Pauses the URL's domain after a 429/503 answer.
+
+        Args:
+            url: The rate limited URL.
+            retry_after: The `Retry-After` header value, in seconds or as an HTTP date.
+            attempt: Number of retries already made, used for exponential backoff when the
+                site did not send `Retry-After`.
+
+        Returns:
+            The number of seconds to wait before retrying, or None if the site asked for a
+            longer pause than `max_retry_after` and the request should be abandoned.
+        """
+        delay = self.parse_retry_after(retry_after)
+        if delay is None:
+            delay = 2 ** attempt
+        state = self._state(url)
+        state.paused_until = max(
+            state.paused_until, time.monotonic() + min(delay, self.max_retry_after)
+        )
+        return delay if delay <= self.max_retry_after else None
+
+    @staticmethod
+    def parse_retry_after(value: str | None) -> float | None:
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def get_preferred_scraper(self, url: str):
+        """The scraper class that last succeeded for the URL's domain after escalation, if any."""
+        return self._state(url).preferred_scraper
+
+    def set_preferred_scraper(self, url: str, scraper_class) -> None:
+        self._state(url).preferred_scraper = scraper_class
+
+    @classmethod
+    def interleave(cls, urls: list[str]) -> list[str]:
+        """Orders URLs round-robin by domain so consecutive requests go to different hosts."""
+        by_domain: OrderedDict[str, list[str]] = OrderedDict()
+        for url in urls:
+            by_domain.setdefault(cls.get_domain(url), []).append(url)
+
+        interleaved = []
+        queues = list(by_domain.values())
+        while queues:
+            interleaved.extend(queue.pop(0) for queue in queues)
+            queues = [queue for queue in queues if queue]
+        return interleaved
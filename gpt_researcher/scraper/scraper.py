@@ -1,17 +1,24 @@
 import asyncio
-from colorama import Fore, init
+import functools
 
+import httpx
 import requests
-import subprocess
-import sys
-import importlib
 import logging
 
 from gpt_researcher.utils.workers import WorkerPool
+from gpt_researcher.utils.http_client import HTTPClient
+from gpt_researcher.utils.urls import canonicalize_url
+
+from .cache import PageCache
+from .browser.driver_pool import get_driver_pool
+from .download import PDF, DownloadAborted, download
+from .failures import FailureTracker
+from .scheduler import DomainScheduler
 
 from . import (
     ArxivScraper,
     BeautifulSoupScraper,
+    LxmlScraper,
     PyMuPDFScraper,
     WebBaseLoaderScraper,
     BrowserScraper,
@@ -20,135 +27,468 @@ from . import (
     FireCrawl,
 )
 
+SCRAPER_CLASSES = {
+    "pdf": PyMuPDFScraper,
+    "arxiv": ArxivScraper,
+    "bs": BeautifulSoupScraper,
+    "lxml": LxmlScraper,
+    "web_base_loader": WebBaseLoaderScraper,
+    "browser": BrowserScraper,
+    "nodriver": NoDriverScraper,
+    "tavily_extract": TavilyExtract,
+    "firecrawl": FireCrawl,
+}
+
+# Pages with less extracted text than this are dropped, or escalated to the fallback scraper
+MIN_CONTENT_LENGTH = 100
+# Seconds a batch request to an extraction API waits for more links before it is sent
+BATCH_WINDOW = 0.05
+
 
 class Scraper:
     """
     Scraper class to extract the content from the links
     """
 
-    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool):
+    def __init__(
+        self,
+        urls,
+        user_agent,
+        scraper,
+        worker_pool: WorkerPool,
+        http_client: HTTPClient | None = None,
+        page_cache: PageCache | None = None,
+        scheduler: DomainScheduler | None = None,
+        max_download_size: int | None = 10 * 1024 * 1024,
+        pdf_max_pages: int = 10,
+        pdf_max_chars: int = 20000,
+        fallback_scraper: str | None = None,
+        hedge_delay: float = 0,
+        failure_tracker: FailureTracker | None = None,
+        browser_pool_size: int = 3,
+        browser_max_pages_per_driver: int = 50,
+        nodriver_adaptive_scroll: bool = True,
+    ):
         """
         Initialize the Scraper class.
         Args:
             urls:
+            http_client: Pooled async client used by scrapers that expose a `parse` step.
+                A private client is created (and closed after `run`) when not provided.
+            page_cache: Persistent cache of extracted pages (optional).
+            scheduler: Per-domain politeness scheduler, shared across concurrent scrapes so
+                limits hold for every request made to a domain (optional).
+            max_download_size: Maximum body size in bytes of pages downloaded with the pooled
+                client; larger downloads are aborted. None disables the bound.
+            pdf_max_pages: Maximum number of pages extracted from a PDF document.
+            pdf_max_chars: PDF extraction stops once this many characters have been collected.
+            fallback_scraper: Scraper (e.g. `nodriver` or `browser`) to escalate web pages to
+                when `scraper` extracts too little content (optional).
+            hedge_delay: Seconds after which the fallback scraper is started in parallel if
+                `scraper` has not finished yet. 0 only escalates after `scraper` fails.
+            failure_tracker: Shared tracker the outcome of every scraped page is reported to,
+                so failing hosts can be skipped (optional).
+            browser_pool_size: Number of warm drivers in the pool of the `browser` scraper.
+            browser_max_pages_per_driver: Pages a pooled driver serves before it is restarted.
+            nodriver_adaptive_scroll: Whether the `nodriver` scraper waits for the DOM to settle
+                rather than for a fixed time.
         """
         self.urls = urls
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
+        self.http_client = http_client or HTTPClient(user_agent=user_agent)
+        self._owns_http_client = http_client is None
+        self.page_cache = page_cache
+        # The cache is shared by the process, so this scrape reports the difference
+        self._page_cache_stats = page_cache.stats() if page_cache else None
+        self.scheduler = scheduler or DomainScheduler()
+        self.max_download_size = max_download_size
+        self.pdf_max_pages = pdf_max_pages
+        self.pdf_max_chars = pdf_max_chars
         self.scraper = scraper
-        if self.scraper == "tavily_extract":
-            self._check_pkg(self.scraper)
-        if self.scraper == "firecrawl":
-            self._check_pkg(self.scraper)
+        self.fallback_scraper = fallback_scraper if fallback_scraper != scraper else None
+        self.hedge_delay = hedge_delay
+        self.failure_tracker = failure_tracker
+        self.browser_pool_size = browser_pool_size
+        self.browser_max_pages_per_driver = browser_max_pages_per_driver
+        self.nodriver_adaptive_scroll = nodriver_adaptive_scroll
         self.logger = logging.getLogger(__name__)
         self.worker_pool = worker_pool
+        self._open_batches: dict[type, dict[str, asyncio.Future]] = {}
+        self._batch_tasks: set[asyncio.Task] = set()
 
     async def run(self):
         """
         Extracts the content from the links
         """
-        contents = await asyncio.gather(
-            *(self.extract_data_from_url(url, self.session) for url in self.urls)
-        )
+        try:
+            tasks = self._start_tasks()
+            contents = await asyncio.gather(*(tasks[url] for url in self.urls))
+        finally:
+            await self._finish()
 
         res = [content for content in contents if content["raw_content"] is not None]
         return res
 
-    def _check_pkg(self, scrapper_name: str) -> None:
-        """
-        Checks and ensures required Python packages are available for scrapers that need
-        dependencies beyond requirements.txt. When adding a new scraper to the repo, update `pkg_map`
-        with its required information and call check_pkg() during initialization.
-        """
-        pkg_map = {
-            "tavily_extract": {
-                "package_installation_name": "tavily-python",
-                "import_name": "tavily",
-            },
-            "firecrawl": {
-                "package_installation_name": "firecrawl-py",
-                "import_name": "firecrawl",
-            },
+    async def stream(self):
+        """
+        Extracts the content from the links, yielding each page as soon as it is scraped.
+        Closing the generator early cancels the scrapes that are still running.
+        """
+        tasks = self._start_tasks()
+        try:
+            for next_done in asyncio.as_completed(list(tasks.values())):
+                content = await next_done
+                if content["raw_content"] is not None:
+                    yield content
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            await self._finish()
+
+    def _start_tasks(self) -> dict:
+        # Start requests round-robin across domains, keyed by URL so callers keep the given order
+        return {
+            url: asyncio.ensure_future(self.extract_data_from_url(url, self.session))
+            for url in self.scheduler.interleave(self.urls)
         }
-        pkg = pkg_map[scrapper_name]
-        if not importlib.util.find_spec(pkg["import_name"]):
-            pkg_inst_name = pkg["package_installation_name"]
-            init(autoreset=True)
-            print(Fore.YELLOW + f"{pkg_inst_name} not found. Attempting to install...")
-            try:
-                subprocess.check_call(
-                    [sys.executable, "-m", "pip", "install", pkg_inst_name]
-                )
-                print(Fore.GREEN + f"{pkg_inst_name} installed successfully.")
-            except subprocess.CalledProcessError:
-                raise ImportError(
-                    Fore.RED
-                    + f"Unable to install {pkg_inst_name}. Please install manually with "
-                    f"`pip install -U {pkg_inst_name}`"
-                )
+
+    async def _finish(self):
+        for batch in self._open_batches.values():
+            for future in batch.values():
+                future.cancel()
+        self._open_batches.clear()
+        for task in list(self._batch_tasks):
+            task.cancel()
+
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+        if self.page_cache:
+            stats = self.page_cache.stats()
+            hits, misses, revalidations = (
+                stats[name] - self._page_cache_stats[name]
+                for name in ("hits", "misses", "revalidations")
+            )
+            self.logger.info(
+                f"Page cache: {hits} hits, {misses} misses, {revalidations} revalidations"
+            )
 
     async def extract_data_from_url(self, link, session):
         """
         Extracts the data from the link with logging
         """
-        async with self.worker_pool.throttle():
-            try:
-                Scraper = self.get_scraper(link)
-                scraper = Scraper(link, session)
-
-                # Get scraper name
-                scraper_name = scraper.__class__.__name__
-                self.logger.info(f"\n=== Using {scraper_name} ===")
-
-                # Get content
-                if hasattr(scraper, "scrape_async"):
-                    content, image_urls, title = await scraper.scrape_async()
-                else:
-                    (
-                        content,
-                        image_urls,
-                        title,
-                    ) = await asyncio.get_running_loop().run_in_executor(
-                        self.worker_pool.executor, scraper.scrape
-                    )
-
-                if len(content) < 100:
-                    self.logger.warning(f"Content too short or empty for {link}")
-                    return {
-                        "url": link,
-                        "raw_content": None,
-                        "image_urls": [],
-                        "title": title,
-                    }
-
-                # Log results
-                self.logger.info(f"\nTitle: {title}")
-                self.logger.info(
-                    f"Content length: {len(content) if content else 0} characters"
+        try:
+            cached = None
+            if self.page_cache:
+                cached = await asyncio.to_thread(self.page_cache.get, link)
+                if cached and self.page_cache.is_fresh(cached):
+                    self.logger.info(f"Cache hit for {link}")
+                    return self._page_result(cached)
+
+            Scraper = self.get_scraper(link)
+            fallback = self.get_fallback_scraper(link)
+            if fallback is None:
+                content, image_urls, title, validators = await self.scrape_with(
+                    link, Scraper, session, cached
+                )
+            else:
+                content, image_urls, title, validators = await self.scrape_tiered(
+                    link, Scraper, fallback, session, cached
                 )
-                self.logger.info(f"Number of images: {len(image_urls)}")
-                self.logger.info(f"URL: {link}")
-                self.logger.info("=" * 50)
-
-                if not content or len(content) < 100:
-                    self.logger.warning(f"Content too short or empty for {link}")
-                    return {
-                        "url": link,
-                        "raw_content": None,
-                        "image_urls": [],
-                        "title": title,
-                    }
 
+            if not content or len(content) < MIN_CONTENT_LENGTH:
+                self.logger.warning(f"Content too short or empty for {link}")
+                self._record_outcome(link, False)
                 return {
                     "url": link,
-                    "raw_content": content,
-                    "image_urls": image_urls,
+                    "raw_content": None,
+                    "image_urls": [],
                     "title": title,
                 }
 
-            except Exception as e:
-                self.logger.error(f"Error processing {link}: {str(e)}")
-                return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
+            # Log results
+            self.logger.info(f"\nTitle: {title}")
+            self.logger.info(
+                f"Content length: {len(content) if content else 0} characters"
+            )
+            self.logger.info(f"Number of images: {len(image_urls)}")
+            self.logger.info(f"URL: {link}")
+            self.logger.info("=" * 50)
+
+            if self.page_cache:
+                await asyncio.to_thread(
+                    self.page_cache.put, link, content, image_urls, title, **validators
+                )
+            self._record_outcome(link, True)
+
+            return {
+                "url": link,
+                "raw_content": content,
+                "image_urls": image_urls,
+                "title": title,
+            }
+
+        except DownloadAborted as e:
+            self.logger.warning(f"Skipping {link}: {e}")
+            self._record_outcome(link, False, e)
+            return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
+        except Exception as e:
+            self.logger.error(f"Error processing {link}: {str(e)}")
+            self._record_outcome(link, False, e)
+            return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
+
+    def _record_outcome(self, link, success, error=None):
+        if self.failure_tracker is None:
+            return
+        if success:
+            self.failure_tracker.record_success(link)
+        else:
+            self.failure_tracker.record_failure(link, host_failure=self._is_host_failure(error))
+
+    @staticmethod
+    def _is_host_failure(error) -> bool:
+        """Whether a scrape failed because the host is down or overloaded, not because of the page."""
+        if isinstance(error, DownloadAborted):
+            status = error.status_code
+            return status is not None and (status == 429 or status >= 500)
+        return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
+    async def scrape_with(self, link, scraper_class, session, cached=None):
+        """
+        Scrapes a link with one scraper class.
+
+        Returns:
+            A tuple of (content, image_urls, title, validators).
+        """
+        # Get scraper name
+        self.logger.info(f"\n=== Using {scraper_class.__name__} ===")
+
+        if hasattr(scraper_class, "scrape_batch"):
+            content, image_urls, title = await self.scrape_batched(link, scraper_class)
+            return content, image_urls, title, {}
+
+        if hasattr(scraper_class, "parse"):
+            return await self.fetch_and_parse(link, scraper_class, cached)
+
+        # Wait for the domain before taking a global worker slot
+        async with self.scheduler.slot(link), self.worker_pool.throttle():
+            scraper = self._new_scraper(scraper_class, link, session)
+            if hasattr(scraper, "scrape_async"):
+                content, image_urls, title = await scraper.scrape_async()
+            else:
+                (
+                    content,
+                    image_urls,
+                    title,
+                ) = await asyncio.get_running_loop().run_in_executor(
+                    self.worker_pool.executor, scraper.scrape
+                )
+        return content, image_urls, title, {}
+
+    def _new_scraper(self, scraper_class, link, session):
+        if scraper_class is BrowserScraper:
+            pool = get_driver_pool(self.browser_pool_size, self.browser_max_pages_per_driver)
+            return scraper_class(link, session, driver_pool=pool)
+        if scraper_class is NoDriverScraper:
+            return scraper_class(link, session, adaptive_scroll=self.nodriver_adaptive_scroll)
+        return scraper_class(link, session)
+
+    async def scrape_batched(self, link, scraper_class):
+        """
+        Queues the link into the next request of a scraper class backed by an extraction API
+        and waits for its page. Links queued within `BATCH_WINDOW` of each other share one
+        request, of at most `max_batch_size` links. The request goes to the API rather than to
+        the links' domains, so it takes a worker slot but no domain slot.
+
+        Returns:
+            A tuple of (content, image_urls, title), empty if the link could not be extracted.
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._open_batches.get(scraper_class)
+        if batch is None:
+            batch = self._open_batches[scraper_class] = {}
+            loop.call_later(BATCH_WINDOW, self._send_batch, scraper_class, batch)
+        future = batch.get(link)
+        if future is None:
+            future = batch[link] = loop.create_future()
+        if len(batch) >= scraper_class.max_batch_size:
+            self._send_batch(scraper_class, batch)
+        # Shielded as duplicate links wait on the same future
+        return await asyncio.shield(future)
+
+    def _send_batch(self, scraper_class, batch):
+        if self._open_batches.get(scraper_class) is not batch:
+            return  # Already sent because it was full, or abandoned
+        del self._open_batches[scraper_class]
+        task = asyncio.ensure_future(self._run_batch(scraper_class, batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, scraper_class, batch):
+        self.logger.info(f"Sending {len(batch)} links to {scraper_class.__name__} in one request")
+        try:
+            async with self.worker_pool.throttle():
+                pages = await scraper_class.scrape_batch(list(batch), self.http_client)
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            self.logger.error(f"{scraper_class.__name__} batch of {len(batch)} links failed: {e}")
+            pages = {}
+
+        # APIs may report a link in another form than it was sent in
+        canonical_pages = {canonicalize_url(url): page for url, page in pages.items()}
+        for link, future in batch.items():
+            if not future.done():
+                page = pages.get(link) or canonical_pages.get(canonicalize_url(link))
+                future.set_result(page or ("", [], ""))
+
+    async def scrape_tiered(self, link, scraper_class, fallback, session, cached=None):
+        """
+        Scrapes a link with the cheap scraper first and escalates to the fallback scraper when
+        it extracts too little content or fails, or hedges by starting the fallback in parallel
+        once `hedge_delay` has passed. A page the cheap scraper refused to download (missing,
+        binary or too large) is not escalated. The first good result wins. When the fallback wins, it is
+        remembered for the link's domain so later links from the host skip the cheap tier.
+
+        Returns:
+            A tuple of (content, image_urls, title, validators).
+        """
+        preferred = self.scheduler.get_preferred_scraper(link)
+        if preferred is not None:
+            return await self.scrape_with(link, preferred, session, cached)
+
+        tasks = {
+            asyncio.ensure_future(self.scrape_with(link, scraper_class, session, cached)): scraper_class
+        }
+        fallback_started = False
+        timeout = self.hedge_delay or None
+        result = ("", [], "", {})
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(
+                    tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self.logger.info(f"{link} is slow, hedging with {fallback.__name__}")
+                for task in done:
+                    task_scraper = tasks.pop(task)
+                    error = task.exception()
+                    if isinstance(error, DownloadAborted) and error.status_code != 403:
+                        # A browser would get the same page; 403 is often a bot wall it gets past
+                        raise error
+                    if error is not None:
+                        self.logger.warning(f"{task_scraper.__name__} failed for {link}: {error}")
+                        continue
+                    result = task.result()
+                    if result[0] and len(result[0]) >= MIN_CONTENT_LENGTH:
+                        if task_scraper is fallback:
+                            self.scheduler.set_preferred_scraper(link, fallback)
+                        return result
+
+                # Escalate when the cheap scraper came back empty, hedge when it is too slow
+                if not fallback_started:
+                    fallback_started = True
+                    timeout = None
+                    self.logger.info(f"Escalating {link} to {fallback.__name__}")
+                    tasks[asyncio.ensure_future(
+                        self.scrape_with(link, fallback, session, cached)
+                    )] = fallback
+            return result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def fetch_and_parse(self, link, scraper_class, cached=None):
+        """
+        Downloads the page with the pooled async client and runs only the CPU-bound
+        `parse` step of the scraper class in the worker pool (threads or processes).
+
+        If a stale cached copy of the page is given, the request is made conditional on its
+        validators and a `304 Not Modified` answer reuses the cached extraction without parsing.
+
+        Returns:
+            A tuple of (content, image_urls, title, validators) where validators holds the
+            `etag` and `last_modified` values to store alongside the page.
+
+        Raises:
+            DownloadAborted: If the page is an error page, too large or not text, or the host
+                kept rate limiting the request.
+        """
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        for attempt in range(self.scheduler.max_retries + 1):
+            async with self.scheduler.slot(link), self.worker_pool.fetch_slot() as sample:
+                response = await download(
+                    self.http_client, link, self.max_download_size, headers=headers
+                )
+                # Rate limiting is a sign of overload for the adaptive worker limit
+                sample.error = response.status_code in (429, 503)
+            if response.status_code not in (429, 503):
+                break
+            delay = self.scheduler.backoff(link, response.headers.get("Retry-After"), attempt)
+            if delay is None or attempt == self.scheduler.max_retries:
+                raise DownloadAborted(
+                    f"rate limited (HTTP {response.status_code})", response.status_code
+                )
+            self.logger.info(f"Rate limited by {link}, retrying in {delay:.1f}s")
+
+        if cached and response.status_code == 304:
+            self.logger.info(f"Cache revalidated for {link}")
+            validators = {"etag": cached["etag"], "last_modified": cached["last_modified"]}
+            return cached["raw_content"], cached["image_urls"], cached["title"], validators
+
+        # Route on what was actually downloaded rather than on the URL
+        if response.mime == PDF:
+            scraper_class = PyMuPDFScraper
+        elif scraper_class is PyMuPDFScraper:
+            scraper_class = self._html_scraper_class()
+
+        parse = scraper_class.parse
+        if scraper_class is PyMuPDFScraper:
+            parse = functools.partial(
+                parse, max_pages=self.pdf_max_pages, max_chars=self.pdf_max_chars
+            )
+
+        content, image_urls, title = await self.worker_pool.run_parse(
+            parse, response.content, link, response.encoding
+        )
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        return content, image_urls, title, validators
+
+    def _html_scraper_class(self):
+        """The configured scraper if it can parse downloaded HTML, BeautifulSoup otherwise."""
+        scraper_class = self.get_scraper("")
+        return scraper_class if hasattr(scraper_class, "parse") else BeautifulSoupScraper
+
+    @staticmethod
+    def _page_result(page):
+        return {
+            "url": page["url"],
+            "raw_content": page["raw_content"],
+            "image_urls": page["image_urls"],
+            "title": page["title"],
+        }
+
+    def get_fallback_scraper(self, link):
+        """The class pages of the link escalate to, or None if the link has no fallback tier."""
+        if not self.fallback_scraper or link.endswith(".pdf") or "arxiv.org" in link:
+            return None
+        scraper_class = SCRAPER_CLASSES.get(self.fallback_scraper)
+        if scraper_class is None:
+            raise Exception("Scraper not found.")
+        return scraper_class
 
     def get_scraper(self, link):
         """
@@ -167,17 +507,6 @@ class Scraper:
         `PyMuPDFScraper` class. If the link contains "arxiv.org", it selects the `ArxivScraper
         """
 
-        SCRAPER_CLASSES = {
-            "pdf": PyMuPDFScraper,
-            "arxiv": ArxivScraper,
-            "bs": BeautifulSoupScraper,
-            "web_base_loader": WebBaseLoaderScraper,
-            "browser": BrowserScraper,
-            "nodriver": NoDriverScraper,
-            "tavily_extract": TavilyExtract,
-            "firecrawl": FireCrawl,
-        }
-
         scraper_key = None
 
         if link.endswith(".pdf"):
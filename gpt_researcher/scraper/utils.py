@@ -16,37 +16,44 @@ def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
         for img in all_images:
             img_src = urljoin(url, img['src'])
             if img_src.startswith(('http://', 'https://')):
-                score = 0
-                # Check for relevant classes
-                if any(cls in img.get('class', []) for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
-                    score = 4  # Higher score
-                # Check for size attributes
-                elif img.get('width') and img.get('height'):
-                    width = parse_dimension(img['width'])
-                    height = parse_dimension(img['height'])
-                    if width and height:
-                        if width >= 2000 and height >= 1000:
-                            score = 3  # Medium score (very large images)
-                        elif width >= 1600 or height >= 800:
-                            score = 2  # Lower score
-                        elif width >= 800 or height >= 500:
-                            score = 1  # Lowest score
-                        elif width >= 500 or height >= 300:
-                            score = 0  # Lowest score
-                        else:
-                            continue  # Skip small images
-                
-                image_urls.append({'url': img_src, 'score': score})
+                score = score_image(img.get('class', []), img.get('width'), img.get('height'))
+                if score is not None:
+                    image_urls.append({'url': img_src, 'score': score})
         
-        # Sort images by score (highest first)
-        sorted_images = sorted(image_urls, key=lambda x: x['score'], reverse=True)
-        
-        return sorted_images[:10]  # Ensure we don't return more than 10 images in total
+        return sort_images(image_urls)
     
     except Exception as e:
         logging.error(f"Error in get_relevant_images: {e}")
         return []
 
+def score_image(classes: list, width: str | None, height: str | None) -> int | None:
+    """Score an image by its classes and size attributes, None for images too small to keep"""
+    # Check for relevant classes
+    if any(cls in classes for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
+        return 4  # Higher score
+    # Check for size attributes
+    if width and height:
+        width = parse_dimension(width)
+        height = parse_dimension(height)
+        if width and height:
+            if width >= 2000 and height >= 1000:
+                return 3  # Medium score (very large images)
+            elif width >= 1600 or height >= 800:
+                return 2  # Lower score
+            elif width >= 800 or height >= 500:
+                return 1  # Lowest score
+            elif width >= 500 or height >= 300:
+                return 0  # Lowest score
+            else:
+                return None  # Skip small images
+    return 0
+
+def sort_images(image_urls: list) -> list:
+    """Sort images by score (highest first)"""
+    sorted_images = sorted(image_urls, key=lambda x: x['score'], reverse=True)
+    
+    return sorted_images[:10]  # Ensure we don't return more than 10 images in total
+
 def parse_dimension(value: str) -> int:
     """Parse dimension value, handling px units"""
     if value.lower().endswith('px'):
@@ -59,7 +66,13 @@ def parse_dimension(value: str) -> int:
 
 def extract_title(soup: BeautifulSoup) -> str:
     """Extract the title from the BeautifulSoup object"""
-    return soup.title.string if soup.title else ""
+    # Convert to a plain str so the result does not keep (or pickle) the whole tree
+    return str(soup.title.string) if soup.title and soup.title.string else ""
+
+def extract_markdown_title(text: str) -> str:
+    """Extract the first heading of a markdown document"""
+    match = re.search(r"^#{1,3}[ \t]+(.+?)[ \t#]*$", text, re.MULTILINE)
+    return match.group(1) if match else ""
 
 def get_image_hash(image_url: str) -> str:
     """Calculate a simple hash based on the image filename and essential query parameters"""
@@ -1,5 +1,4 @@
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 import requests
 from ..utils import get_relevant_images, extract_title
 
@@ -9,34 +8,57 @@ class WebBaseLoaderScraper:
         self.link = link
         self.session = session or requests.Session()
 
+    @staticmethod
+    def parse(html: bytes, url: str, encoding: str | None = None) -> tuple:
+        """
+        Parses a downloaded page into the same text LangChain's `WebBaseLoader` extracts, along
+        with its relevant images and title.
+
+        `Scraper` downloads the page once with its pooled async client and hands only this step
+        to the worker pool, so the page is neither fetched nor parsed twice.
+
+        Args:
+          html (bytes): The raw response body.
+          url (str): The page URL, used to resolve relative image links.
+          encoding (str, optional): The response encoding, if known.
+
+        Returns:
+          A tuple of (content, image_urls, title).
+        """
+        soup = BeautifulSoup(html, "lxml", from_encoding=encoding)
+        return WebBaseLoaderScraper._extract(soup, url)
+
+    @staticmethod
+    def _extract(soup: BeautifulSoup, url: str, get_text_kwargs: dict | None = None) -> tuple:
+        # WebBaseLoader keeps the text of the whole page, boilerplate included
+        content = soup.get_text(**(get_text_kwargs or {}))
+        image_urls = get_relevant_images(soup, url)
+        title = extract_title(soup)
+        return content, image_urls, title
+
     def scrape(self) -> tuple:
         """
         This Python function scrapes content from a webpage using a WebBaseLoader object and returns the
-        concatenated page content.
-        
+        page content, images and title.
+
+        The loader fetches the page once through the shared session and parses it once with lxml; the
+        images and title are taken from the same parsed page.
+
         Returns:
-          The `scrape` method is returning a string variable named `content` which contains the
-        concatenated page content from the documents loaded by the `WebBaseLoader`. If an exception
-        occurs during the process, an error message is printed and an empty string is returned.
+          The `scrape` method returns a tuple containing the page content loaded by the `WebBaseLoader`,
+        a list of image URLs, and the title of the webpage. If an exception occurs during the process, an
+        error message is printed and an empty result is returned.
         """
         try:
             from langchain_community.document_loaders import WebBaseLoader
-            loader = WebBaseLoader(self.link)
-            loader.requests_kwargs = {"verify": False}
-            docs = loader.load()
-            content = ""
-
-            for doc in docs:
-                content += doc.page_content
-
-            response = self.session.get(self.link)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            image_urls = get_relevant_images(soup, self.link)
-            
-            # Extract the title using the utility function
-            title = extract_title(soup)
-
-            return content, image_urls, title
+            loader = WebBaseLoader(
+                self.link,
+                session=self.session,
+                default_parser="lxml",
+                requests_kwargs={"verify": False, "timeout": 4},
+            )
+            soup = loader.scrape()
+            return self._extract(soup, self.link, loader.bs_get_text_kwargs)
 
         except Exception as e:
             print("Error! : " + str(e))
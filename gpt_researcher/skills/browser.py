@@ -1,7 +1,17 @@
+import asyncio
+import logging
+import os
+from typing import AsyncIterator
+
 from gpt_researcher.utils.workers import WorkerPool
+from gpt_researcher.utils.http_client import HTTPClient
 
 from ..actions.utils import stream_output
-from ..actions.web_scraping import scrape_urls
+from ..context.dedup import NearDuplicateIndex
+from ..actions.web_scraping import scrape_urls, scrape_urls_stream
+from ..scraper.cache import get_page_cache
+from ..scraper.failures import get_failure_tracker
+from ..scraper.scheduler import DomainScheduler
 from ..scraper.utils import get_image_hash
 
 
@@ -10,7 +20,48 @@ class BrowserManager:
 
     def __init__(self, researcher):
         self.researcher = researcher
-        self.worker_pool = WorkerPool(researcher.cfg.max_scraper_workers)
+        self.worker_pool = WorkerPool(
+            researcher.cfg.max_scraper_workers,
+            parse_processes=researcher.cfg.scraper_parse_processes,
+            adaptive=researcher.cfg.scraper_adaptive_concurrency,
+            max_concurrency=researcher.cfg.max_scraper_connections,
+        )
+        self.http_client = HTTPClient(
+            user_agent=researcher.cfg.user_agent,
+            max_connections=researcher.cfg.max_scraper_connections,
+            max_connections_per_host=researcher.cfg.max_scraper_connections_per_host,
+            http2=researcher.cfg.scraper_http2,
+        )
+        self.scheduler = DomainScheduler(
+            max_per_domain=researcher.cfg.scraper_domain_concurrency,
+            rate=researcher.cfg.scraper_domain_rate_limit,
+        )
+        self.page_cache = None
+        if researcher.cfg.cache_dir:
+            self.page_cache = get_page_cache(
+                os.path.join(researcher.cfg.cache_dir, "pages.sqlite"),
+                ttl=researcher.cfg.scraper_cache_ttl,
+                max_size=researcher.cfg.scraper_cache_max_size_mb * 1024 * 1024,
+            )
+        # Shared by every sub-query of the research so mirrored pages are only embedded once
+        self.near_duplicates = None
+        if researcher.cfg.near_duplicate_threshold > 0:
+            self.near_duplicates = NearDuplicateIndex(
+                threshold=researcher.cfg.near_duplicate_threshold
+            )
+        # Shared by every research of the process so a dead host is not retried by each one
+        self.failure_tracker = None
+        if researcher.cfg.scraper_domain_error_budget > 0:
+            self.failure_tracker = get_failure_tracker(
+                error_budget=researcher.cfg.scraper_domain_error_budget,
+                cooldown=researcher.cfg.scraper_domain_cooldown,
+                failed_url_ttl=researcher.cfg.scraper_failed_url_ttl,
+            )
+        self.logger = logging.getLogger('research')
+
+    async def aclose(self) -> None:
+        """Closes the connection pool of the research; it is reopened if the researcher scrapes again."""
+        await self.http_client.aclose()
 
     async def browse_urls(self, urls: list[str]) -> list[dict]:
         """
@@ -30,10 +81,83 @@ class BrowserManager:
                 self.researcher.websocket,
             )
 
-        scraped_content, images = await scrape_urls(
-            urls, self.researcher.cfg, self.worker_pool
+        scraped_content, _ = await scrape_urls(
+            urls,
+            self.researcher.cfg,
+            self.worker_pool,
+            self.http_client,
+            self.page_cache,
+            self.scheduler,
+            self.failure_tracker,
         )
+        scraped_content = [
+            page for page in scraped_content if not await self._is_near_duplicate(page)
+        ]
+        # Only the pages kept contribute images, as in `browse_urls_stream`
+        images = [image for page in scraped_content for image in page.get("image_urls", [])]
         self.researcher.add_research_sources(scraped_content)
+        await self._finish_browsing(scraped_content, images)
+
+        return scraped_content
+
+    async def browse_urls_stream(self, urls: list[str]) -> AsyncIterator[dict]:
+        """
+        Scrape content from a list of URLs, yielding each page as soon as it is scraped.
+
+        Sources are added to the researcher as pages arrive. If the consumer stops early,
+        the remaining scrapes are cancelled and only the pages yielded so far are kept.
+
+        Args:
+            urls (list[str]): list of URLs to scrape.
+
+        Yields:
+            dict: scraped content of a single page.
+        """
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "scraping_urls",
+                f"🌐 Scraping content from {len(urls)} URLs...",
+                self.researcher.websocket,
+            )
+
+        scraped_content = []
+        images = []
+        pages = scrape_urls_stream(
+            urls,
+            self.researcher.cfg,
+            self.worker_pool,
+            self.http_client,
+            self.page_cache,
+            self.scheduler,
+            self.failure_tracker,
+        )
+        try:
+            async for page in pages:
+                if await self._is_near_duplicate(page):
+                    continue
+                self.researcher.add_research_sources([page])
+                scraped_content.append(page)
+                images.extend(page.get("image_urls", []))
+                yield page
+        finally:
+            await pages.aclose()
+            await self._finish_browsing(scraped_content, images)
+
+    async def _is_near_duplicate(self, page: dict) -> bool:
+        """Indexes a scraped page and tells whether it nearly duplicates a page seen before."""
+        if self.near_duplicates is None:
+            return False
+
+        signature = await asyncio.to_thread(self.near_duplicates.signature, page["raw_content"])
+        duplicate_of = self.near_duplicates.add(page["url"], signature)
+        if duplicate_of is None:
+            return False
+
+        self.logger.info(f"Dropping {page['url']}, a near-duplicate of {duplicate_of}")
+        return True
+
+    async def _finish_browsing(self, scraped_content: list[dict], images: list[dict]) -> None:
         new_images = self.select_top_images(images, k=4)  # Select top 4 images
         self.researcher.add_research_images(new_images)
 
@@ -59,8 +183,6 @@ class BrowserManager:
                 self.researcher.websocket,
             )
 
-        return scraped_content
-
     def select_top_images(self, images: list[dict], k: int = 2) -> list[str]:
         """
         Select most relevant images and remove duplicates based on image content.
@@ -1,7 +1,13 @@
 import asyncio
-from typing import List, Dict, Optional, Set
+import logging
+from typing import List, Dict, Optional, Set, AsyncIterator
 
-from ..context.compression import ContextCompressor, WrittenContentCompressor, VectorstoreCompressor
+from ..context.compression import (
+    ContextCompressor,
+    StreamingContextCompressor,
+    WrittenContentCompressor,
+    VectorstoreCompressor,
+)
 from ..actions.utils import stream_output
 
 
@@ -10,6 +16,7 @@ class ContextManager:
 
     def __init__(self, researcher):
         self.researcher = researcher
+        self.logger = logging.getLogger('research')
 
     async def get_similar_content_by_query(self, query, pages):
         if self.researcher.verbose:
@@ -27,6 +34,54 @@ class ContextManager:
             query=query, max_results=10, cost_callback=self.researcher.add_costs
         )
         
+    async def get_similar_content_by_query_stream(
+        self,
+        query: str,
+        pages: AsyncIterator[Dict],
+        deadline: float | None = None,
+    ) -> str:
+        """
+        Embeds pages while they are still being scraped and builds the context from them.
+
+        Args:
+            query: The query to find relevant content for.
+            pages: Async iterator of scraped pages, e.g. `BrowserManager.browse_urls_stream`.
+            deadline: Seconds after which the context is built from the pages received so far
+                and the remaining scrapes are cancelled. No deadline when None or 0.
+        """
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "fetching_query_content",
+                f"📚 Getting relevant content based on query: {query}...",
+                self.researcher.websocket,
+            )
+
+        context_compressor = StreamingContextCompressor(
+            embeddings=self.researcher.memory.get_embeddings()
+        )
+        received = []
+
+        async def consume():
+            async for page in pages:
+                await context_compressor.add_pages([page], cost_callback=self.researcher.add_costs)
+                # Only pages fully embedded count as received when the deadline cancels
+                received.append(page)
+
+        try:
+            await asyncio.wait_for(consume(), timeout=deadline or None)
+        except asyncio.TimeoutError:
+            self.logger.info(
+                f"Deadline of {deadline}s reached for '{query}', using {len(received)} pages"
+            )
+        finally:
+            await pages.aclose()
+
+        if self.researcher.vector_store:
+            self.researcher.vector_store.load(received)
+
+        return await context_compressor.async_get_context(query=query, max_results=10)
+
     async def get_similar_content_by_query_with_vectorstore(self, query, filter): 
         if self.researcher.verbose:
             await stream_output(
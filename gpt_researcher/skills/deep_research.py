@@ -388,7 +388,7 @@ Format each question on a new line starting with 'Question: '"""}
         
         # Set enhanced context and visited URLs
         self.researcher.context = "\n".join(final_context)
-        self.researcher.visited_urls = results['visited_urls']
+        self.researcher.visited_urls.update(results['visited_urls'])
 
         # Set research sources
         if results.get('sources'):
@@ -1,12 +1,24 @@
 import asyncio
-import random
 import logging
 import os
 from ..actions.utils import stream_output
 from ..actions.query_processing import plan_research_outline, get_search_results
+from ..actions.retriever import (
+    PlanningSearch,
+    fuse_results,
+    get_retriever_name,
+    hedged_search,
+    search_all,
+    search_with,
+)
 from ..document import DocumentLoader, OnlineDocumentLoader, LangChainDocumentLoader
+from ..retrievers import LocalBM25Search
+from ..retrievers.cache import get_search_cache
+from ..retrievers.utils import HTTP_TIMEOUT, parse_retriever_values
 from ..utils.enum import ReportSource
+from ..utils.http_client import HTTPClient
 from ..utils.logging_config import get_json_handler
+from ..utils.urls import canonicalize_url
 
 
 class ResearchConductor:
@@ -16,6 +28,20 @@ class ResearchConductor:
         self.researcher = researcher
         self.logger = logging.getLogger('research')
         self.json_handler = get_json_handler()
+        # Pooled client shared by the retrievers that search natively with asyncio. Its timeout
+        # stays finite when RETRIEVER_TIMEOUT=0 lets searches run indefinitely, so a stalled
+        # connection still fails.
+        self.search_client = HTTPClient(timeout=researcher.cfg.retriever_timeout or HTTP_TIMEOUT)
+        self.search_cache = None
+        if researcher.cfg.cache_dir:
+            self.search_cache = get_search_cache(
+                os.path.join(researcher.cfg.cache_dir, "search.sqlite"),
+                ttl=researcher.cfg.search_cache_ttl,
+                ttls=parse_retriever_values(researcher.cfg.search_cache_retriever_ttls),
+                max_entries=researcher.cfg.search_cache_max_entries,
+            )
+        # Results of the last planning search, reused when the research query itself is searched
+        self.planning_search: PlanningSearch | None = None
 
     async def plan_research(self, query, query_domains=None):
         self.logger.info(f"Planning research for query: {query}")
@@ -29,8 +55,18 @@ class ResearchConductor:
             self.researcher.websocket,
         )
 
-        search_results = await get_search_results(query, self.researcher.retrievers[0], query_domains)
+        search_results = await get_search_results(
+            query,
+            self.researcher.retrievers[0],
+            query_domains,
+            search_cache=self.search_cache,
+            http_client=self.search_client,
+            retriever_kwargs=self._retriever_kwargs(self.researcher.retrievers[0]),
+        )
         self.logger.info(f"Initial search results obtained: {len(search_results)} results")
+        self.planning_search = PlanningSearch(
+            self.researcher.retrievers[0], query, query_domains, search_results
+        )
 
         await stream_output(
             "logs",
@@ -51,15 +87,32 @@ class ResearchConductor:
         self.logger.info(f"Research outline planned: {outline}")
         return outline
 
+    async def aclose(self) -> None:
+        """Closes the search connection pool; it is reopened if the researcher searches again."""
+        await self.search_client.aclose()
+
+    def _retriever_kwargs(self, retriever_class) -> dict:
+        """Settings of the research a retriever would otherwise read from the environment."""
+        if retriever_class is LocalBM25Search:
+            cfg = self.researcher.cfg
+            return {"doc_path": cfg.doc_path, "cache_dir": cfg.cache_dir}
+        return {}
+
     async def conduct_research(self):
         """Runs the GPT Researcher to conduct research"""
         if self.json_handler:
             self.json_handler.update_content("query", self.researcher.query)
         
         self.logger.info(f"Starting research for query: {self.researcher.query}")
+        # The caches are shared by the process, so each research reports the difference
+        search_cache_stats = self.search_cache.stats() if self.search_cache else None
+        embedding_cache = self.researcher.memory.cache
+        embedding_cache_stats = embedding_cache.stats() if embedding_cache else None
         
-        # Reset visited_urls and source_urls at the start of each research task
-        self.researcher.visited_urls.clear()
+        # Reset visited_urls and source_urls at the start of each research task, unless they are
+        # shared with the parent and sibling researchers
+        if not self.researcher.shares_visited_urls:
+            self.researcher.visited_urls.clear()
         research_data = []
 
         if self.researcher.verbose:
@@ -96,6 +149,15 @@ class ResearchConductor:
             self.logger.info("Using web search")
             research_data = await self._get_context_by_web_search(self.researcher.query, [], self.researcher.query_domains)
 
+        elif self.researcher.report_source == ReportSource.Local.value and LocalBM25Search in self.researcher.retrievers:
+            self.logger.info("Using local search with the BM25 index")
+            if self.researcher.vector_store:
+                self.researcher.vector_store.load(await DocumentLoader(self.researcher.cfg.doc_path).load())
+
+            research_data = await self._get_context_by_web_search(
+                self.researcher.query, [], self.researcher.query_domains, local_search=True
+            )
+
         elif self.researcher.report_source == ReportSource.Local.value:
             self.logger.info("Using local search")
             document_data = await DocumentLoader(self.researcher.cfg.doc_path).load()
@@ -157,6 +219,20 @@ class ResearchConductor:
                 self.json_handler.update_content("costs", self.researcher.get_costs())
                 self.json_handler.update_content("context", self.researcher.context)
 
+        if self.search_cache:
+            stats = self.search_cache.stats()
+            hits = stats["hits"] - search_cache_stats["hits"]
+            misses = stats["misses"] - search_cache_stats["misses"]
+            self.logger.info(f"Search cache: {hits} hits, {misses} misses")
+        if embedding_cache:
+            stats = {
+                name: value - embedding_cache_stats[name]
+                for name, value in embedding_cache.stats().items()
+            }
+            self.logger.info(
+                f"Embedding cache: {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['bytes_saved']} bytes not re-embedded"
+            )
         self.logger.info(f"Research completed. Context size: {len(str(self.researcher.context))}")
         return self.researcher.context
 
@@ -164,7 +240,13 @@ class ResearchConductor:
         """Scrapes and compresses the context from the given urls"""
         self.logger.info(f"Getting context from URLs: {urls}")
         
-        new_search_urls = await self._get_new_urls(urls)
+        if self.researcher.shares_visited_urls:
+            # Explicit sources are read by every researcher they are given to, even when a
+            # sibling already scraped them
+            new_search_urls = list({canonicalize_url(url): url for url in urls}.values())
+            self.researcher.visited_urls.update(new_search_urls)
+        else:
+            new_search_urls = await self._get_new_urls(urls)
         self.logger.info(f"New URLs to process: {new_search_urls}")
 
         scraped_content = await self.researcher.scraper_manager.browse_urls(new_search_urls) # 根据url爬具体网页的数据。
@@ -214,9 +296,13 @@ class ResearchConductor:
         )
         return context
 
-    async def _get_context_by_web_search(self, query, scraped_data: list | None = None, query_domains: list | None = None):
+    async def _get_context_by_web_search(
+        self, query, scraped_data: list | None = None, query_domains: list | None = None, local_search: bool = False
+    ):
         """
         Generates the context for the research task by searching the query and scraping the results
+        Args:
+            local_search (bool): Search the local document index instead of the web for each sub-query
         Returns:
             context: List of context
         """
@@ -249,7 +335,7 @@ class ResearchConductor:
         try:
             context = await asyncio.gather(
                 *[
-                    self._process_sub_query(sub_query, scraped_data, query_domains)
+                    self._process_sub_query(sub_query, scraped_data, query_domains, local_search)
                     for sub_query in sub_queries
                 ]
             )
@@ -265,7 +351,9 @@ class ResearchConductor:
             self.logger.error(f"Error during web search: {e}", exc_info=True)
             return []
 
-    async def _process_sub_query(self, sub_query: str, scraped_data: list = [], query_domains: list = []):
+    async def _process_sub_query(
+        self, sub_query: str, scraped_data: list = [], query_domains: list = [], local_search: bool = False
+    ):
         """Takes in a sub query and scrapes urls based on it and gathers context."""
         if self.json_handler:
             self.json_handler.log_event("sub_query", {
@@ -282,11 +370,21 @@ class ResearchConductor:
             )
 
         try:
-            if not scraped_data:
-                scraped_data = await self._scrape_data_by_urls(sub_query, query_domains)
-                self.logger.info(f"Scraped data size: {len(scraped_data)}")
+            if local_search:
+                passages = await self._search_local_passages(sub_query)
+                self.logger.info(f"Local passages found: {len(passages)}")
+                content = (
+                    await self.researcher.context_manager.get_similar_content_by_query(sub_query, passages)
+                    if passages else ""
+                )
+            elif not scraped_data and self.researcher.cfg.scrape_streaming:
+                content = await self._scrape_and_compress_stream(sub_query, query_domains)
+            else:
+                if not scraped_data:
+                    scraped_data = await self._scrape_data_by_urls(sub_query, query_domains)
+                    self.logger.info(f"Scraped data size: {len(scraped_data)}")
 
-            content = await self.researcher.context_manager.get_similar_content_by_query(sub_query, scraped_data)
+                content = await self.researcher.context_manager.get_similar_content_by_query(sub_query, scraped_data)
             self.logger.info(f"Content found for sub-query: {len(str(content)) if content else 0} chars")
 
             if not content and self.researcher.verbose:
@@ -307,6 +405,18 @@ class ResearchConductor:
             self.logger.error(f"Error processing sub-query {sub_query}: {e}", exc_info=True)
             return ""
 
+    async def _search_local_passages(self, sub_query: str) -> list[dict]:
+        """
+        Searches the BM25 index of the local documents, so that only the best passages are
+        compressed rather than every document.
+
+        Returns:
+            list: The passages, in the format of `DocumentLoader`
+        """
+        retriever = LocalBM25Search(sub_query, **self._retriever_kwargs(LocalBM25Search))
+        results = await search_with(retriever, self.researcher.cfg.max_search_results_per_query)
+        return [{"url": result["href"], "raw_content": result["body"]} for result in results]
+
     async def _process_sub_query_with_vectorstore(self, sub_query: str, filter: dict | None = None):
         """Takes in a sub query and gathers context from the user provided vector store
 
@@ -329,7 +439,7 @@ class ResearchConductor:
         return context
 
     async def _get_new_urls(self, url_set_input):
-        """Gets the new urls from the given url set.
+        """Gets the new urls from the given url set, comparing urls on their canonical form.
         Args: url_set_input (set[str]): The url set to get the new urls from
         Returns: list[str]: The new urls from the given url set
         """
@@ -352,29 +462,94 @@ class ResearchConductor:
         return new_urls
 
     async def _search_relevant_source_urls(self, query, query_domains: list | None = None):
-        new_search_urls = []
+        """
+        Searches the query with every retriever and selects the URLs to scrape: results are
+        merged by reciprocal rank fusion, and the best new URLs are kept up to the scrape budget.
+        """
         if query_domains is None:
             query_domains = []
 
-        # Iterate through all retrievers
-        for retriever_class in self.researcher.retrievers:
-            # Instantiate the retriever with the sub-query
-            retriever = retriever_class(query, query_domains=query_domains)
-
-            # Perform the search using the current retriever
-            search_results = await asyncio.to_thread(
-                retriever.search, max_results=self.researcher.cfg.max_search_results_per_query
+        max_results = self.researcher.cfg.max_search_results_per_query
+        # Local passages are not web pages to scrape; they are searched by `_search_local_passages`
+        web_retrievers = [
+            retriever_class for retriever_class in self.researcher.retrievers
+            if retriever_class is not LocalBM25Search
+        ]
+        if not web_retrievers:
+            return []
+        retrievers = web_retrievers
+        planned_results = None
+        if self.planning_search:
+            planned_results = self.planning_search.results_for(
+                web_retrievers[0], query, query_domains, max_results
+            )
+        if planned_results is not None:
+            self.logger.info(f"Reusing the planning search results for '{query}'")
+            retrievers = retrievers[1:]
+
+        if self.researcher.cfg.hedged_search:
+            # The other retrievers are only hedges against a slow primary, which already answered
+            if planned_results is not None:
+                all_search_results = [[] for _ in retrievers]
+            else:
+                all_search_results = await hedged_search(
+                    retrievers,
+                    query,
+                    query_domains=query_domains,
+                    max_results=max_results,
+                    http_client=self.search_client,
+                    timeout=self.researcher.cfg.retriever_timeout or None,
+                    search_cache=self.search_cache,
+                    hedge_delay=self.researcher.cfg.hedge_delay or None,
+                    quantile=self.researcher.cfg.hedge_quantile,
+                )
+        else:
+            # Query all retrievers concurrently
+            all_search_results = await search_all(
+                retrievers,
+                query,
+                query_domains=query_domains,
+                max_results=max_results,
+                http_client=self.search_client,
+                timeout=self.researcher.cfg.retriever_timeout or None,
+                search_cache=self.search_cache,
+            )
+        if planned_results is not None:
+            all_search_results.insert(0, planned_results)
+
+        # Rank the URLs of all retrievers together, leaving out those already visited
+        weights = parse_retriever_values(self.researcher.cfg.retriever_weights)
+        ranked_urls = fuse_results(
+            all_search_results,
+            weights=[
+                weights.get(get_retriever_name(retriever_class), 1.0)
+                for retriever_class in web_retrievers
+            ],
+        )
+        new_search_urls = [url for url in ranked_urls if url not in self.researcher.visited_urls]
+
+        # Keep the best URLs within the scrape budget, however many retrievers contributed,
+        # skipping hosts and URLs that recently failed to scrape. URLs past the budget are not
+        # checked, so they do not take the single trial of a recovering host.
+        budget = self.researcher.cfg.max_scrape_urls_per_query or max_results
+        failure_tracker = self.researcher.scraper_manager.failure_tracker
+        selected_urls = []
+        skipped = 0
+        for url in new_search_urls:
+            if len(selected_urls) >= budget:
+                break
+            if failure_tracker and not failure_tracker.allow(url):
+                skipped += 1
+                continue
+            selected_urls.append(url)
+        if skipped:
+            self.logger.info(f"Skipping {skipped} URLs from failing hosts")
+        if len(new_search_urls) - skipped > budget:
+            self.logger.info(
+                f"Scraping the top {budget} of {len(new_search_urls) - skipped} new URLs"
             )
 
-            # Collect new URLs from search results
-            search_urls = [url.get("href") for url in search_results]
-            new_search_urls.extend(search_urls)
-
-        # Get unique URLs
-        new_search_urls = await self._get_new_urls(new_search_urls)
-        random.shuffle(new_search_urls)
-
-        return new_search_urls
+        return await self._get_new_urls(selected_urls)
 
     async def _scrape_data_by_urls(self, sub_query, query_domains: list | None = None):
         """
@@ -407,3 +582,35 @@ class ResearchConductor:
             self.researcher.vector_store.load(scraped_content)
 
         return scraped_content
+
+    async def _scrape_and_compress_stream(self, sub_query, query_domains: list | None = None):
+        """
+        Streaming variant of `_scrape_data_by_urls` followed by context compression.
+
+        Pages are embedded as soon as they are scraped instead of after the slowest site
+        responds. With `SUB_QUERY_DEADLINE` set, the context is finalised from the pages
+        that arrived in time.
+
+        Args:
+            sub_query (str): The sub-query to search for.
+
+        Returns:
+            str: The context gathered for the sub-query.
+        """
+        if query_domains is None:
+            query_domains = []
+
+        new_search_urls = await self._search_relevant_source_urls(sub_query, query_domains)
+
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "researching",
+                f"🤔 Researching for relevant information across multiple sources...\n",
+                self.researcher.websocket,
+            )
+
+        pages = self.researcher.scraper_manager.browse_urls_stream(new_search_urls)
+        return await self.researcher.context_manager.get_similar_content_by_query_stream(
+            sub_query, pages, deadline=self.researcher.cfg.sub_query_deadline
+        )
@@ -0,0 +1,104 @@
+import asyncio
+import importlib.util
+import logging
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPClient:
+    """
+    Pooled asyncio HTTP client shared by the scrapers of a researcher.
+
+    Wraps a single `httpx.AsyncClient` so connections are kept alive and reused
+    across URLs, caps the number of concurrent requests per host, and optionally
+    negotiates HTTP/2 when the `h2` package is installed.
+    """
+
+    def __init__(
+        self,
+        user_agent: str | None = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 6,
+        timeout: float = 4,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.user_agent = user_agent
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.http2 = http2 and self._http2_available()
+        self.transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(max_connections)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @staticmethod
+    def _http2_available() -> bool:
+        if importlib.util.find_spec("h2") is None:
+            logger.warning(
+                "HTTP/2 requested but the `h2` package is not installed, falling back to HTTP/1.1. "
+                "Install it with `pip install httpx[http2]`."
+            )
+            return False
+        return True
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Created lazily so the client binds to the event loop that actually uses it
+        if self._client is None or self._client.is_closed:
+            headers = {"User-Agent": self.user_agent} if self.user_agent else None
+            self._client = httpx.AsyncClient(
+                headers=headers,
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self.transport,
+            )
+        return self._client
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Holds a per-host and a global connection slot for the duration of a request."""
+        # Acquire the host slot first so a busy host does not pin global slots while it waits
+        async with self._host_semaphore(url):
+            async with self._semaphore:
+                yield
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs):
+        """Opens a streaming request while holding a connection slot."""
+        async with self.slot(url):
+            async with self.client.stream(method, url, **kwargs) as response:
+                yield response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Sends a GET request and reads the full response body."""
+        async with self.slot(url):
+            return await self.client.get(url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """Sends a POST request and reads the full response body."""
+        async with self.slot(url):
+            return await self.client.post(url, **kwargs)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,172 @@
+import hashlib
+import math
+from typing import Iterable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the click and never change the page
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "twclid", "igshid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "_hsenc", "_hsmi", "ref_src", "ref_url", "spm",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "mtm_")
+# Host prefixes of the www, mobile and AMP editions of a site
+VARIANT_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _resolve_amp_cache(host: str, path: str) -> str | None:
+    """Returns the publisher URL behind a Google or Cloudflare AMP cache URL, if it is one."""
+    if host.endswith(".cdn.ampproject.org") or (host.startswith("google.") and path.startswith("/amp/")):
+        parts = path.split("/")
+        # /c/s/example.com/page, /v/s/example.com/page or /amp/s/example.com/page
+        rest = parts[3:] if len(parts) > 3 and parts[2] == "s" else parts[2:]
+        if rest and "." in rest[0]:
+            return "https://" + "/".join(rest)
+    return None
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Reduces a URL to the key shared by its equivalent variants.
+
+    The scheme is set to https, the host is lowercased and stripped of its default port and
+    of `www.`, mobile and AMP prefixes, AMP cache URLs and `/amp` paths are mapped back to the
+    page they mirror, tracking parameters are dropped, the query string is sorted, and the
+    fragment and trailing slash are removed. The key is meant for comparisons only: the
+    variants it merges are served by most sites but may not all resolve.
+    """
+    url = url.strip()
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.rstrip(".")
+    amp_origin = _resolve_amp_cache(host.removeprefix("www."), parts.path)
+    if amp_origin:
+        return canonicalize_url(amp_origin + (f"?{parts.query}" if parts.query else ""))
+    for prefix in VARIANT_HOST_PREFIXES:
+        if host.startswith(prefix) and "." in host[len(prefix):]:
+            host = host[len(prefix):]
+            break
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    path = parts.path.rstrip("/")
+    if path.endswith("/amp"):
+        path = path[:-len("/amp")]
+    elif path.endswith(".amp"):
+        path = path[:-len(".amp")]
+    elif path.endswith(".amp.html"):
+        path = path[:-len(".amp.html")] + ".html"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PREFIXES)
+        and key.lower() != "amp"
+    )
+    return urlunsplit(("https", host, path or "/", urlencode(query), ""))
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Answers "definitely not seen" without false negatives, with a false-positive rate
+    around `error_rate` while it holds up to `capacity` items.
+    """
+
+    def __init__(self, capacity: int = 10000, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        # Double hashing: the k positions are derived from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class VisitedURLs(set):
+    """
+    Set of the URLs visited by a research, deduplicated on their canonical form.
+
+    Behaves as a set of the URLs as first seen, so it can be listed in references, while
+    membership tests match any variant of a visited URL (see `canonicalize_url`). A Bloom filter
+    over the canonical keys answers the common "not visited" case before the exact key set is
+    consulted. One instance is shared by a researcher and the nested researchers it starts.
+    """
+
+    def __init__(self, urls: Iterable[str] = (), capacity: int = 10000):
+        super().__init__()
+        self._keys: set[str] = set()
+        self._bloom = BloomFilter(capacity)
+        self.update(urls)
+
+    def __contains__(self, url) -> bool:
+        if not isinstance(url, str):
+            return False
+        key = canonicalize_url(url)
+        return key in self._bloom and key in self._keys
+
+    def add(self, url: str) -> None:
+        key = canonicalize_url(url)
+        if key in self._keys:
+            return
+        if len(self._keys) >= self._bloom.capacity:
+            self._grow()
+        self._keys.add(key)
+        self._bloom.add(key)
+        super().add(url)
+
+    def update(self, *others: Iterable[str]) -> None:
+        for urls in others:
+            if urls is self:
+                continue
+            for url in urls:
+                self.add(url)
+
+    def discard(self, url: str) -> None:
+        key = canonicalize_url(url)
+        if key not in self._keys:
+            return
+        self._keys.discard(key)
+        # Bloom filters cannot forget, so the filter is rebuilt from the remaining keys
+        self._rebuild(self._bloom.capacity)
+        for visited in [visited for visited in self if canonicalize_url(visited) == key]:
+            super().discard(visited)
+
+    def remove(self, url: str) -> None:
+        if url not in self:
+            raise KeyError(url)
+        self.discard(url)
+
+    def clear(self) -> None:
+        super().clear()
+        self._keys.clear()
+        self._bloom = BloomFilter(self._bloom.capacity)
+
+    def _grow(self) -> None:
+        self._rebuild(self._bloom.capacity * 2)
+
+    def _rebuild(self, capacity: int) -> None:
+        self._bloom = BloomFilter(capacity)
+        for key in self._keys:
+            self._bloom.add(key)
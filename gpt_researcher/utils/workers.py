@@ -1,15 +1,210 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import asynccontextmanager
 
+logger = logging.getLogger(__name__)
+
+# Process pools are shared by every WorkerPool of the process so nested researchers
+# do not each spawn their own set of parser processes
+_process_pools: dict[int, ProcessPoolExecutor] = {}
+
+
+def get_process_pool(max_workers: int, broken: ProcessPoolExecutor | None = None) -> ProcessPoolExecutor:
+    """Returns the shared process pool of the given size, replacing it if it is the `broken` one."""
+    pool = _process_pools.get(max_workers)
+    if pool is None or pool is broken:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        # Spawn instead of fork: the parent runs an event loop and several thread pools
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        _process_pools[max_workers] = pool
+    return pool
+
+
+class Sample:
+    """Outcome of one request made under a worker slot. Callers may flag soft errors."""
+
+    def __init__(self):
+        self.error = False
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit adjusted by additive-increase/multiplicative-decrease (AIMD).
+
+    Request latencies and errors are evaluated in windows of `window` completed requests. A
+    window is unhealthy when its error rate exceeds `max_error_rate` or its p95 latency exceeds
+    `latency_tolerance` times the best p95 seen so far; the limit is then multiplied by
+    `backoff`. Healthy windows double the limit until the first backoff (slow start) and add
+    one afterwards. With `adaptive` off the limit stays at `initial`.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        adaptive: bool = True,
+        window: int = 10,
+        backoff: float = 0.5,
+        max_error_rate: float = 0.2,
+        latency_tolerance: float = 2.0,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, initial)
+        self.limit = float(initial)
+        self.adaptive = adaptive
+        self.window = window
+        self.backoff = backoff
+        self.max_error_rate = max_error_rate
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.queued = 0
+        self._slow_start = True
+        self._baseline_p95 = None
+        self._samples: list[tuple[float, bool]] = []
+        self._last_window: list[tuple[float, bool]] = []
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self):
+        self.queued += 1
+        try:
+            async with self._condition:
+                await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+                self.in_flight += 1
+        finally:
+            self.queued -= 1
+
+        sample = Sample()
+        started = time.monotonic()
+        try:
+            yield sample
+        except Exception:
+            sample.error = True
+            raise
+        finally:
+            self.in_flight -= 1
+            self.record(time.monotonic() - started, sample.error)
+            async with self._condition:
+                self._condition.notify_all()
+
+    def record(self, latency: float, error: bool) -> None:
+        if not self.adaptive:
+            return
+        self._samples.append((latency, error))
+        if len(self._samples) < self.window:
+            return
+
+        window, self._samples = self._samples, []
+        self._last_window = window
+        p95 = self._p95(window)
+        error_rate = sum(error for _, error in window) / len(window)
+        if self._baseline_p95 is None or p95 < self._baseline_p95:
+            self._baseline_p95 = p95
+
+        previous = int(self.limit)
+        if error_rate > self.max_error_rate or p95 > self.latency_tolerance * self._baseline_p95:
+            self._slow_start = False
+            self.limit = max(self.min_limit, self.limit * self.backoff)
+        elif self._slow_start:
+            self.limit = min(self.max_limit, self.limit * 2)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1)
+        if int(self.limit) != previous:
+            logger.info(
+                f"Worker limit {previous} -> {int(self.limit)} "
+                f"(p95 {p95:.2f}s, error rate {error_rate:.0%})"
+            )
+
+    @staticmethod
+    def _p95(window: list[tuple[float, bool]]) -> float:
+        latencies = sorted(latency for latency, _ in window)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+    def stats(self) -> dict:
+        window = self._samples or self._last_window
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "p95_latency": self._p95(window) if window else None,
+            "error_rate": sum(error for _, error in window) / len(window) if window else None,
+        }
+
 
 class WorkerPool:
-    def __init__(self, max_workers: int):
+    def __init__(
+        self,
+        max_workers: int,
+        parse_processes: int = 0,
+        adaptive: bool = False,
+        max_concurrency: int = 100,
+    ):
+        """
+        Args:
+            max_workers: Size of the thread pool, and the concurrency limit (the initial one
+                when `adaptive` is set, in which case the thread pool grows with the limit).
+            parse_processes: Number of processes parsing runs in; 0 parses in the thread pool.
+            adaptive: Adjust the concurrency limit to the observed latency and error rate, and
+                apply it to page downloads too.
+            max_concurrency: Upper bound of the adaptive limit.
+        """
         self.max_workers = max_workers
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.semaphore = asyncio.Semaphore(max_workers)
+        self.parse_processes = parse_processes
+        self.adaptive = adaptive
+        self.limiter = AdaptiveLimiter(
+            max_workers, max_limit=max_concurrency, adaptive=adaptive
+        )
+        # Scrapers holding a slot must not queue for a thread, or the wait would count as
+        # latency. Threads are only started when needed.
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.limiter.max_limit if adaptive else max_workers
+        )
 
     @asynccontextmanager
     async def throttle(self):
-        async with self.semaphore:
-            yield
+        """Holds a worker slot while a scraper without a parse step runs."""
+        async with self.limiter.slot() as sample:
+            yield sample
+
+    @asynccontextmanager
+    async def fetch_slot(self):
+        """
+        Holds a slot while a page is downloaded. Downloads are only limited by the pool when it
+        is adaptive; otherwise they are bounded by the HTTP client's connection limits alone.
+        """
+        if not self.adaptive:
+            yield Sample()
+            return
+        async with self.limiter.slot() as sample:
+            yield sample
+
+    async def run_parse(self, func, *args):
+        """
+        Runs a CPU-bound parse function off the event loop.
+
+        Uses the shared process pool when `parse_processes` is set, so parsing is not serialised
+        by the GIL, and the thread pool otherwise. `func` and its arguments must be picklable.
+        """
+        loop = asyncio.get_running_loop()
+        if self.parse_processes <= 0:
+            return await loop.run_in_executor(self.executor, func, *args)
+
+        pool = get_process_pool(self.parse_processes)
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            logger.warning("Parser process pool broke, restarting it and parsing in a thread")
+            get_process_pool(self.parse_processes, broken=pool)
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    def stats(self) -> dict:
+        """Current concurrency limit, in-flight and queued requests, and recent p95 latency and error rate."""
+        return self.limiter.stats()
@@ -0,0 +1,40 @@
+"""
+Benchmarks the `bs` and `lxml` scrapers' parse step on the saved pages in tests/docs/html.
+
+Usage: python tests/scraper-benchmark.py [repeat]
+"""
+import glob
+import os
+import sys
+import timeit
+
+from gpt_researcher.scraper import BeautifulSoupScraper, LxmlScraper
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "docs", "html")
+URL = "https://example.com/articles/page.html"
+SCRAPERS = {"bs": BeautifulSoupScraper, "lxml": LxmlScraper}
+
+
+def main(repeat: int = 200):
+    pages = {
+        os.path.basename(path): open(path, "rb").read()
+        for path in sorted(glob.glob(os.path.join(CORPUS, "*.html")))
+    }
+    totals = dict.fromkeys(SCRAPERS, 0.0)
+
+    print(f"{'page':<28}" + "".join(f"{name + ' (ms)':>12}{'chars':>8}" for name in SCRAPERS))
+    for name, html in pages.items():
+        row = f"{name:<28}"
+        for key, scraper in SCRAPERS.items():
+            seconds = timeit.timeit(lambda: scraper.parse(html, URL), number=repeat) / repeat
+            totals[key] += seconds
+            content, _, _ = scraper.parse(html, URL)
+            row += f"{seconds * 1000:>12.3f}{len(content):>8}"
+        print(row)
+
+    print(f"{'total':<28}" + "".join(f"{totals[key] * 1000:>12.3f}{'':>8}" for key in SCRAPERS))
+    print(f"lxml speedup: {totals['bs'] / totals['lxml']:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,95 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.context.compression import ContextCompressor, StreamingContextCompressor
+from gpt_researcher.skills.context_manager import ContextManager
+
+
+class KeywordEmbeddings(Embeddings):
+    """Embeds text as keyword counts so similarity is predictable."""
+
+    keywords = ["farm", "village", "tourism"]
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text):
+        return [text.lower().count(word) + 0.01 for word in self.keywords]
+
+
+@pytest.mark.asyncio
+async def test_streaming_compressor_selects_relevant_chunks():
+    compressor = StreamingContextCompressor(embeddings=KeywordEmbeddings())
+    await compressor.add_pages([
+        {"url": "https://a.com", "title": "A", "raw_content": "farm farm farm cooperative"},
+    ])
+    await compressor.add_pages([
+        {"url": "https://b.com", "title": "B", "raw_content": "village tourism festival"},
+    ])
+
+    context = await compressor.async_get_context("farm", max_results=5)
+
+    assert "Source: https://a.com" in context
+    assert "https://b.com" not in context
+
+
+@pytest.mark.asyncio
+async def test_streaming_compressor_without_pages():
+    compressor = StreamingContextCompressor(embeddings=KeywordEmbeddings())
+    assert await compressor.async_get_context("farm") == ""
+
+
+@pytest.mark.asyncio
+async def test_streaming_and_batch_compressors_agree():
+    pages = [
+        {"url": f"https://{i}.com", "title": str(i), "raw_content": text}
+        for i, text in enumerate([
+            "village tourism",
+            "farm village " * 5,
+            "tourism tourism farm",
+            "farm cooperative",
+        ])
+    ]
+    compressor = StreamingContextCompressor(embeddings=KeywordEmbeddings())
+    await compressor.add_pages(pages[:2])
+    await compressor.add_pages(pages[2:])
+
+    batch = ContextCompressor(documents=pages, embeddings=KeywordEmbeddings())
+    assert await compressor.async_get_context("farm", max_results=3) == await batch.async_get_context(
+        "farm", max_results=3
+    )
+
+
+class SlowKeywordEmbeddings(KeywordEmbeddings):
+    """Takes longer than the deadline to embed pages mentioning tourism."""
+
+    def embed_documents(self, texts):
+        if any("tourism" in text for text in texts):
+            time.sleep(0.5)
+        return super().embed_documents(texts)
+
+
+@pytest.mark.asyncio
+async def test_stream_deadline_skips_pages_still_being_embedded():
+    loaded = []
+    researcher = SimpleNamespace(
+        verbose=False,
+        websocket=None,
+        memory=SimpleNamespace(get_embeddings=SlowKeywordEmbeddings),
+        vector_store=SimpleNamespace(load=loaded.extend),
+        add_costs=None,
+    )
+
+    async def pages():
+        yield {"url": "https://a.com", "title": "A", "raw_content": "farm cooperative"}
+        yield {"url": "https://b.com", "title": "B", "raw_content": "village tourism"}
+
+    context = await ContextManager(researcher).get_similar_content_by_query_stream(
+        "farm", pages(), deadline=0.2
+    )
+
+    assert [page["url"] for page in loaded] == ["https://a.com"]
+    assert "https://b.com" not in context
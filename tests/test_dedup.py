@@ -0,0 +1,79 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.config import Config
+from gpt_researcher.scraper import LxmlScraper
+from gpt_researcher.skills import browser as browser_skill
+from gpt_researcher.context import dedup as dedup_module
+from gpt_researcher.context.dedup import NearDuplicateIndex
+
+CORPUS = os.path.join(os.path.dirname(__file__), "docs", "html")
+
+
+def read_page(name):
+    with open(os.path.join(CORPUS, name), "rb") as f:
+        content, _, _ = LxmlScraper.parse(f.read(), "https://example.com/")
+    return content
+
+
+def test_syndicated_copy_is_a_near_duplicate():
+    article = read_page("news-article.html")
+    syndicated = "Reprinted with permission from The Daily Ledger.\n" + article.replace(
+        "Maria Okafor", "Maria Okafor, The Daily Ledger"
+    ) + "\nShare this story on social media."
+    index = NearDuplicateIndex()
+
+    assert index.add("https://ledger.example.com/broadband", index.signature(article)) is None
+    assert index.add("https://mirror.example.org/story", index.signature(syndicated)) == (
+        "https://ledger.example.com/broadband"
+    )
+    assert len(index) == 1
+
+
+def test_distinct_pages_are_kept():
+    index = NearDuplicateIndex()
+    for name in sorted(os.listdir(CORPUS)):
+        assert index.add(name, index.signature(read_page(name))) is None
+
+    assert len(index) == len(os.listdir(CORPUS))
+
+
+def test_signature_does_not_depend_on_chunking(monkeypatch):
+    article = read_page("news-article.html")
+    index = NearDuplicateIndex()
+    whole = index.signature(article)
+
+    monkeypatch.setattr(dedup_module, "_CHUNK_SIZE", 7)
+
+    assert (index.signature(article) == whole).all()
+
+
+@pytest.mark.asyncio
+async def test_near_duplicates_contribute_no_images(monkeypatch):
+    article = read_page("news-article.html")
+    pages = [
+        {"url": f"https://{host}/story", "raw_content": article, "title": "",
+         "image_urls": [{"url": f"https://{host}/lead.jpg", "score": 1}]}
+        for host in ("example.com", "mirror.example.org")
+    ]
+
+    async def scrape_urls(urls, *args):
+        return pages, [image for page in pages for image in page["image_urls"]]
+
+    monkeypatch.setattr(browser_skill, "scrape_urls", scrape_urls)
+    images = []
+    researcher = SimpleNamespace(
+        cfg=Config(),
+        verbose=False,
+        websocket=None,
+        add_research_sources=lambda sources: None,
+        add_research_images=images.extend,
+        get_research_images=lambda: images,
+    )
+
+    kept = await browser_skill.BrowserManager(researcher).browse_urls([page["url"] for page in pages])
+
+    assert [page["url"] for page in kept] == ["https://example.com/story"]
+    assert images == ["https://example.com/lead.jpg"]
@@ -0,0 +1,75 @@
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.memory import CachedEmbeddings, EmbeddingStore, get_embedding_store
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self):
+        self.batches = []
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text)), 0.5] for text in texts]
+
+    def embed_query(self, text):
+        self.batches.append([text])
+        return [float(len(text)), 1.5]
+
+
+def test_only_missing_chunks_are_embedded_across_runs(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite")
+    provider = CountingEmbeddings()
+    embeddings = CachedEmbeddings(provider, EmbeddingStore(path), "openai", "text-embedding-3-small")
+
+    assert embeddings.embed_documents(["alpha", "beta"]) == [[5.0, 0.5], [4.0, 0.5]]
+    assert embeddings.embed_documents(["beta", "gamma", "gamma", "alpha"]) == [
+        [4.0, 0.5], [5.0, 0.5], [5.0, 0.5], [5.0, 0.5]
+    ]
+    assert provider.batches == [["alpha", "beta"], ["gamma"]]
+
+    # A later research reads the store from disk; queries and other models are kept apart
+    store = EmbeddingStore(path)
+    embeddings = CachedEmbeddings(provider, store, "openai", "text-embedding-3-small")
+    assert embeddings.embed_documents(["gamma", "alpha"]) == [[5.0, 0.5], [5.0, 0.5]]
+    assert embeddings.embed_query("alpha") == [5.0, 1.5]
+    CachedEmbeddings(provider, store, "openai", "text-embedding-3-large").embed_documents(["alpha"])
+    assert provider.batches[2:] == [["alpha"], ["alpha"]]
+    assert store.stats() == {"hits": 2, "misses": 2, "bytes_saved": 10}
+
+
+@pytest.mark.asyncio
+async def test_store_evicts_least_recently_used_vectors(tmp_path):
+    # Each vector takes 8 bytes, so the store holds two of them
+    store = EmbeddingStore(str(tmp_path / "embeddings.sqlite"), max_bytes=16)
+    provider = CountingEmbeddings()
+    embeddings = CachedEmbeddings(provider, store, "openai", "text-embedding-3-small")
+
+    await embeddings.aembed_documents(["one", "two"])
+    await embeddings.aembed_documents(["one"])
+    await embeddings.aembed_documents(["three"])
+    await embeddings.aembed_documents(["one", "two"])
+
+    assert provider.batches == [["one", "two"], ["three"], ["two"]]
+    assert store._size == 16
+
+    # The size is read back when the store is reopened
+    assert EmbeddingStore(str(tmp_path / "embeddings.sqlite"), max_bytes=16)._size == 16
+
+
+def test_embedding_settings_are_part_of_the_key(tmp_path):
+    store = EmbeddingStore(str(tmp_path / "embeddings.sqlite"))
+    provider = CountingEmbeddings()
+
+    for dimensions in (256, 512, 256):
+        settings = {"dimensions": dimensions}
+        CachedEmbeddings(provider, store, "openai", "text-embedding-3-small", settings).embed_query("alpha")
+
+    assert provider.batches == [["alpha"], ["alpha"]]
+
+
+def test_embedding_store_is_shared_per_file(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite")
+
+    assert get_embedding_store(path) is get_embedding_store(path)
+    assert get_embedding_store(path, max_bytes=16) is get_embedding_store(path)
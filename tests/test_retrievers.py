@@ -0,0 +1,433 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from gpt_researcher.actions.retriever import (
+    LatencyTracker,
+    PlanningSearch,
+    fuse_results,
+    get_retriever,
+    hedged_search,
+    search_all,
+)
+from gpt_researcher.document import DocumentLoader
+from gpt_researcher.retrievers import LocalBM25Search, PubMedCentralSearch, SearxSearch, TavilySearch
+from gpt_researcher.retrievers import cache as cache_module
+from gpt_researcher.retrievers.cache import SearchCache, get_search_cache
+from gpt_researcher.retrievers.utils import parse_retriever_values
+from gpt_researcher.scraper import failures as failures_module
+from gpt_researcher.scraper.failures import FailureTracker
+from gpt_researcher.skills import researcher as researcher_module
+from gpt_researcher.skills.researcher import ResearchConductor
+from gpt_researcher.utils.http_client import HTTPClient
+from gpt_researcher.utils.urls import VisitedURLs
+
+
+class SlowAsyncRetriever:
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    async def asearch(self, max_results=10, http_client=None):
+        await asyncio.sleep(0.2)
+        return [{"href": "https://async.example.com/", "body": self.query}]
+
+
+class SlowSyncRetriever:
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=10):
+        time.sleep(0.2)
+        return [{"href": f"https://sync.example.com/{i}", "body": self.query} for i in range(max_results)]
+
+
+class HangingRetriever(SlowAsyncRetriever):
+    async def asearch(self, max_results=10, http_client=None):
+        await asyncio.sleep(10)
+
+
+class BrokenRetriever(SlowSyncRetriever):
+    def search(self, max_results=10):
+        raise Exception("API key not found")
+
+
+@pytest.mark.asyncio
+async def test_retrievers_are_queried_concurrently():
+    started = time.monotonic()
+    results = await search_all(
+        [SlowAsyncRetriever, SlowSyncRetriever, HangingRetriever, BrokenRetriever],
+        "rural broadband",
+        max_results=2,
+        timeout=0.5,
+    )
+
+    assert time.monotonic() - started < 0.8
+    assert results == [
+        [{"href": "https://async.example.com/", "body": "rural broadband"}],
+        [{"href": f"https://sync.example.com/{i}", "body": "rural broadband"} for i in range(2)],
+        [],
+        [],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_native_retrievers_use_shared_client(monkeypatch):
+    monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+    monkeypatch.setenv("SEARX_URL", "http://searx.test")
+
+    def handler(request):
+        if request.url.host == "api.tavily.com":
+            body = json.loads(request.content)
+            assert body["query"] == "rural broadband" and body["max_results"] == 3
+            return httpx.Response(200, json={"results": [{"url": "https://a.example.com/", "content": "a"}]})
+        assert request.url.params["q"] == "rural broadband"
+        return httpx.Response(200, json={"results": [{"url": "https://b.example.com/", "content": "b"}]})
+
+    client = HTTPClient(transport=httpx.MockTransport(handler))
+    results = await search_all([TavilySearch, SearxSearch], "rural broadband", max_results=3, http_client=client)
+
+    assert results == [
+        [{"href": "https://a.example.com/", "body": "a"}],
+        [{"href": "https://b.example.com/", "body": "b"}],
+    ]
+
+
+class CountingRetriever(SlowSyncRetriever):
+    searches = 0
+
+    def search(self, max_results=10):
+        CountingRetriever.searches += 1
+        return [{"href": "https://example.com/", "body": self.query}]
+
+
+@pytest.mark.asyncio
+async def test_search_cache_serves_repeated_queries(tmp_path):
+    cache = SearchCache(str(tmp_path / "search.sqlite"))
+    CountingRetriever.searches = 0
+
+    first = await search_all([CountingRetriever], "Rural broadband?", max_results=5, search_cache=cache)
+    second = await search_all([CountingRetriever], "  rural   BROADBAND ", max_results=5, search_cache=cache)
+    await search_all([CountingRetriever], "rural broadband", max_results=5, query_domains=["example.com"], search_cache=cache)
+
+    assert second == first
+    assert CountingRetriever.searches == 2
+    assert cache.stats() == {"hits": 1, "misses": 2}
+
+
+def test_parse_retriever_values_skips_malformed_pairs():
+    assert parse_retriever_values("tavily:abc, bing, arxiv:2.5,") == {"arxiv": 2.5}
+
+
+def test_search_cache_expires_per_retriever_and_evicts_lru(tmp_path, monkeypatch):
+    clock = iter(range(1000, 2000, 10))
+    monkeypatch.setattr(cache_module.time, "time", lambda: next(clock))
+    cache = SearchCache(
+        str(tmp_path / "search.sqlite"), ttl=100, ttls=parse_retriever_values("tavily:15"), max_entries=2
+    )
+    results = [{"href": "https://example.com/", "body": "text"}]
+    cache.put("tavily", "first", results)
+    cache.put("bing", "first", results)
+
+    assert cache.get("tavily", "first") is None
+    assert cache.get("bing", "first") == results
+
+    cache.put("bing", "second", results)
+    cache.get("bing", "first")
+    cache.put("bing", "third", results)
+    assert cache.get("bing", "second") is None
+    assert cache.get("bing", "first") == results
+
+
+def test_search_cache_is_shared_per_file(tmp_path):
+    path = str(tmp_path / "search.sqlite")
+
+    assert get_search_cache(path) is get_search_cache(path)
+    # Other settings reuse the connection of the file
+    assert get_search_cache(path, ttls={"tavily": 15}) is get_search_cache(path)
+    assert get_search_cache(path, ttls={"tavily": 15}).ttls == {"tavily": 15}
+
+
+@pytest.mark.asyncio
+async def test_research_query_reuses_planning_search():
+    cfg = SimpleNamespace(
+        retriever_timeout=5,
+        hedged_search=False,
+        cache_dir=None,
+        max_search_results_per_query=1,
+        retriever_weights=None,
+        max_scrape_urls_per_query=2,
+    )
+    researcher = SimpleNamespace(
+        cfg=cfg,
+        retrievers=[CountingRetriever, SlowAsyncRetriever],
+        visited_urls=VisitedURLs(),
+        verbose=False,
+        websocket=None,
+        scraper_manager=SimpleNamespace(failure_tracker=None),
+    )
+    conductor = ResearchConductor(researcher)
+    CountingRetriever.searches = 0
+    conductor.planning_search = PlanningSearch(
+        CountingRetriever, "rural broadband", [], [
+            {"href": "https://planned.example.com/1"}, {"href": "https://planned.example.com/2"}
+        ],
+    )
+
+    urls = await conductor._search_relevant_source_urls("rural broadband")
+    assert CountingRetriever.searches == 0
+    assert sorted(urls) == ["https://async.example.com/", "https://planned.example.com/1"]
+
+    await conductor._search_relevant_source_urls("rural broadband in europe")
+    assert CountingRetriever.searches == 1
+
+
+def test_fusion_ranks_agreement_and_weights():
+    tavily = [{"href": "https://a.example.com/"}, {"href": "https://b.example.com/"}, {"href": "https://c.example.com/"}]
+    bing = [{"href": "https://www.c.example.com/?utm_source=bing"}, {"href": "https://d.example.com/"}]
+
+    assert fuse_results([tavily, bing]) == [
+        "https://c.example.com/", "https://a.example.com/", "https://b.example.com/", "https://d.example.com/"
+    ]
+    assert fuse_results([tavily, bing], weights=[1, 0])[:3] == [
+        "https://a.example.com/", "https://b.example.com/", "https://c.example.com/"
+    ]
+    assert fuse_results([[], [{"href": "https://d.example.com/"}, {"href": "https://d.example.com"}]]) == [
+        "https://d.example.com/"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_research_query_keeps_top_urls_within_scrape_budget():
+    class Ranked(SlowAsyncRetriever):
+        async def asearch(self, max_results=10, http_client=None):
+            return [{"href": f"https://example.com/{i}"} for i in range(max_results)]
+
+    class Other(SlowAsyncRetriever):
+        async def asearch(self, max_results=10, http_client=None):
+            return [{"href": "https://example.com/3"}, {"href": "https://example.com/0"}]
+
+    cfg = SimpleNamespace(
+        retriever_timeout=5,
+        hedged_search=False,
+        cache_dir=None,
+        max_search_results_per_query=5,
+        retriever_weights="Other:0",
+        max_scrape_urls_per_query=2,
+    )
+    researcher = SimpleNamespace(
+        cfg=cfg,
+        retrievers=[Ranked, Other],
+        visited_urls=VisitedURLs(["https://example.com/0"]),
+        verbose=False,
+        websocket=None,
+        scraper_manager=SimpleNamespace(failure_tracker=None),
+    )
+
+    urls = await ResearchConductor(researcher)._search_relevant_source_urls("rural broadband")
+    assert urls == ["https://example.com/1", "https://example.com/2"]
+
+
+@pytest.mark.asyncio
+async def test_scrape_budget_is_applied_before_failing_hosts_are_checked(monkeypatch):
+    class Ranked(SlowAsyncRetriever):
+        async def asearch(self, max_results=10, http_client=None):
+            return [{"href": f"https://host-{i}.example.com/"} for i in range(max_results)]
+
+    now = 1000.0
+    monkeypatch.setattr(failures_module.time, "monotonic", lambda: now)
+    tracker = FailureTracker(error_budget=1, cooldown=60)
+    tracker.record_failure("https://host-1.example.com/")
+    tracker.record_failure("https://host-4.example.com/old")
+    now += 61
+    cfg = SimpleNamespace(
+        retriever_timeout=5,
+        hedged_search=False,
+        cache_dir=None,
+        max_search_results_per_query=5,
+        retriever_weights=None,
+        max_scrape_urls_per_query=2,
+    )
+    researcher = SimpleNamespace(
+        cfg=cfg,
+        retrievers=[Ranked],
+        visited_urls=VisitedURLs(),
+        verbose=False,
+        websocket=None,
+        scraper_manager=SimpleNamespace(failure_tracker=tracker),
+    )
+
+    urls = await ResearchConductor(researcher)._search_relevant_source_urls("rural broadband")
+
+    assert urls == ["https://host-0.example.com/", "https://host-2.example.com/"]
+    # The recovering host was past the budget, so its trial is still available
+    assert tracker.allow("https://host-4.example.com/")
+
+
+def pmc_article(pmcid, body=True, with_id=True):
+    article_id = f'<article-id pub-id-type="pmc">PMC{pmcid}</article-id>' if with_id else ""
+    content = f"<body><p>Findings {pmcid}</p></body>" if body else ""
+    return (
+        f'<article xmlns:xlink="http://www.w3.org/1999/xlink"><front><article-meta>{article_id}'
+        f"<title-group><article-title>Article {pmcid}</article-title></title-group>"
+        f"<abstract><p>Abstract {pmcid}</p></abstract></article-meta></front>{content}</article>"
+    )
+
+
+@pytest.mark.asyncio
+async def test_pubmed_central_fetches_articles_in_batches(monkeypatch):
+    monkeypatch.setenv("NCBI_API_KEY", "test-key")
+    ids = [str(100 + i) for i in range(7)]
+    fetches = []
+
+    def handler(request):
+        params = request.url.params
+        if request.url.path.endswith("esearch.fcgi"):
+            return httpx.Response(200, json={
+                "esearchresult": {"idlist": ids, "webenv": "MCID_1", "querykey": "1"}
+            })
+        assert params["WebEnv"] == "MCID_1" and params["query_key"] == "1"
+        start = int(params["retstart"])
+        fetches.append(start)
+        batch = ids[start:start + int(params["retmax"])]
+        articles = "".join(
+            pmc_article(pmcid, body=pmcid != "101", with_id=pmcid != "105") for pmcid in batch
+        )
+        return httpx.Response(200, content=f"<pmc-articleset>{articles}</pmc-articleset>".encode())
+
+    client = HTTPClient(transport=httpx.MockTransport(handler))
+    results = await PubMedCentralSearch("rural broadband").asearch(max_results=7, http_client=client)
+
+    assert sorted(fetches) == [0, 5]
+    assert [result["href"] for result in results] == [
+        f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{pmcid}/" for pmcid in ids if pmcid != "101"
+    ]
+    assert results[0]["body"] == "Article 100\n\nAbstract 100\n\nFindings 100..."
+
+
+class FastRetriever(SlowAsyncRetriever):
+    instances = 0
+
+    def __init__(self, query, query_domains=None):
+        super().__init__(query, query_domains)
+        FastRetriever.instances += 1
+
+    async def asearch(self, max_results=10, http_client=None):
+        return [{"href": "https://fast.example.com/", "body": self.query}]
+
+
+@pytest.mark.asyncio
+async def test_hedged_search_falls_back_to_faster_retriever():
+    FastRetriever.instances = 0
+    started = time.monotonic()
+    results = await hedged_search(
+        [HangingRetriever, BrokenRetriever, FastRetriever], "rural broadband", hedge_delay=0.1
+    )
+
+    # The hanging search is hedged after 0.1s, the broken one fails at once and the third answers
+    assert time.monotonic() - started < 0.5
+    assert results == [[], [], [{"href": "https://fast.example.com/", "body": "rural broadband"}]]
+    assert FastRetriever.instances == 1
+
+    results = await hedged_search([FastRetriever, HangingRetriever], "rural broadband", hedge_delay=0.1)
+    assert results[0] and results[1] == []
+
+
+@pytest.mark.asyncio
+async def test_hedged_search_survives_early_wakeup_with_all_retrievers_started(monkeypatch):
+    wait = asyncio.wait
+    woken = []
+
+    async def early_wait(tasks, timeout=None, return_when=asyncio.ALL_COMPLETED):
+        if not woken:
+            # A timer firing just before the deadline, within clock resolution
+            woken.append(timeout)
+            return set(), set(tasks)
+        return await wait(tasks, timeout=timeout, return_when=return_when)
+
+    monkeypatch.setattr(asyncio, "wait", early_wait)
+    results = await hedged_search([HangingRetriever], "rural broadband", timeout=0.2)
+
+    assert woken and results == [[]]
+
+
+def test_hedge_delay_follows_latency_quantile():
+    tracker = LatencyTracker(min_samples=5, default_delay=2.0)
+    for seconds in [0.1, 0.1, 0.1, 0.1]:
+        tracker.record("tavily", seconds)
+    assert tracker.hedge_delay("tavily") == 2.0
+
+    for seconds in [0.1] * 5 + [3.0]:
+        tracker.record("tavily", seconds)
+    assert 0.1 <= tracker.hedge_delay("tavily", 0.5) < 0.15
+    assert tracker.hedge_delay("tavily", 1.0) >= 3.0
+
+
+def test_local_bm25_index_is_persisted_and_refreshed(tmp_path, monkeypatch):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "fibre.txt").write_text("Fibre optic rollout in rural areas. " * 60 + "Broadband subsidies end in 2030.")
+    (docs / "cattle.txt").write_text("Cattle grazing and pasture rotation across the valley.")
+    loads = []
+
+    async def load(self):
+        loads.append(self.path)
+        return [{"url": path.name, "raw_content": path.read_text()} for path in sorted(docs.iterdir())]
+
+    monkeypatch.setattr(DocumentLoader, "load", load)
+    monkeypatch.setattr(LocalBM25Search, "_indexes", {})
+
+    def search(query):
+        return LocalBM25Search(query, doc_path=str(docs), cache_dir=str(tmp_path / "cache")).search(max_results=2)
+
+    results = search("rural broadband subsidies")
+    assert get_retriever("local_bm25") is LocalBM25Search
+    assert results[0]["href"] == "fibre.txt" and "subsidies" in results[0]["body"]
+    assert all(len(result["body"].split()) <= 200 for result in results)
+    assert search("pasture")[0]["href"] == "cattle.txt"
+    assert len(loads) == 1
+
+    # A new process loads the saved index instead of reading the documents again
+    monkeypatch.setattr(LocalBM25Search, "_indexes", {})
+    assert search("pasture")[0]["href"] == "cattle.txt"
+    assert len(loads) == 1
+
+    (docs / "cattle.txt").write_text("Sheep grazing on the hills.")
+    assert search("pasture") == []
+    assert search("sheep")[0]["href"] == "cattle.txt"
+    assert len(loads) == 2
+
+
+@pytest.mark.asyncio
+async def test_planning_search_uses_configured_local_documents(tmp_path, monkeypatch):
+    searched = []
+
+    def search(self, max_results=10):
+        searched.append((self.doc_path, self.cache_dir))
+        return []
+
+    async def plan_research_outline(**kwargs):
+        return []
+
+    monkeypatch.setenv("DOC_PATH", "/elsewhere")
+    monkeypatch.setattr(LocalBM25Search, "search", search)
+    monkeypatch.setattr(researcher_module, "plan_research_outline", plan_research_outline)
+    cfg = SimpleNamespace(
+        retriever_timeout=5,
+        cache_dir=str(tmp_path / "cache"),
+        doc_path=str(tmp_path / "docs"),
+        search_cache_ttl=60,
+        search_cache_retriever_ttls=None,
+        search_cache_max_entries=10,
+    )
+    researcher = SimpleNamespace(
+        cfg=cfg, retrievers=[LocalBM25Search], websocket=None, role="", parent_query="",
+        report_type="research_report", add_costs=None,
+    )
+
+    await ResearchConductor(researcher).plan_research("rural broadband")
+
+    assert searched == [(cfg.doc_path, cfg.cache_dir)]
@@ -0,0 +1,951 @@
+import asyncio
+import json
+import os
+import threading
+import time
+
+import httpx
+import pymupdf
+import pytest
+
+from gpt_researcher.scraper import BeautifulSoupScraper, LxmlScraper, PyMuPDFScraper, Scraper
+from gpt_researcher.scraper import failures as failures_module, scraper as scraper_module
+from gpt_researcher.scraper.browser.browser import BrowserScraper
+from gpt_researcher.scraper.browser.driver_pool import DriverPool, get_driver_pool
+from gpt_researcher.scraper.browser.nodriver_scraper import DOM_IDLE_JS, NoDriverScraper
+from gpt_researcher.scraper.cache import PageCache, get_page_cache
+from gpt_researcher.scraper.download import (
+    BINARY, HTML, PDF, TEXT, DownloadAborted, download, sniff_mime,
+)
+from gpt_researcher.scraper.failures import FailureTracker
+from gpt_researcher.scraper.scheduler import DomainScheduler
+from gpt_researcher.utils.http_client import HTTPClient
+from gpt_researcher.utils.workers import AdaptiveLimiter, WorkerPool
+
+CORPUS = os.path.join(os.path.dirname(__file__), "docs", "html")
+
+PAGE = """
+<html>
+  <head><title>Rural revitalization</title></head>
+  <body>
+    <nav>Home | About</nav>
+    <p>{body}</p>
+    <img src="/hero.jpg" class="hero">
+  </body>
+</html>
+"""
+
+
+def make_client(handler, **kwargs):
+    return HTTPClient(transport=httpx.MockTransport(handler), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_bs_scraper_uses_async_client():
+    def handler(request):
+        body = f"Content for {request.url.path} " * 20
+        return httpx.Response(
+            200, text=PAGE.format(body=body), headers={"Content-Type": "text/html"}
+        )
+
+    urls = [f"https://example.com/page-{i}" for i in range(3)]
+    scraper = Scraper(urls, "test-agent", "bs", WorkerPool(2), http_client=make_client(handler))
+
+    results = await scraper.run()
+
+    assert len(results) == 3
+    first = next(r for r in results if r["url"] == urls[0])
+    assert first["title"] == "Rural revitalization"
+    assert "Content for /page-0" in first["raw_content"]
+    assert "Home | About" not in first["raw_content"]
+    assert first["image_urls"][0]["url"] == "https://example.com/hero.jpg"
+
+
+@pytest.mark.asyncio
+async def test_fetches_are_not_capped_by_worker_threads():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return httpx.Response(200, text=PAGE.format(body="text " * 50))
+
+    urls = [f"https://host-{i}.example.com/" for i in range(20)]
+    client = make_client(handler, max_connections=50, max_connections_per_host=1)
+    scraper = Scraper(urls, "test-agent", "bs", WorkerPool(2), http_client=client)
+
+    results = await scraper.run()
+
+    assert len(results) == 20
+    assert peak > 2
+
+
+@pytest.mark.asyncio
+async def test_per_host_connection_limit():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return httpx.Response(200, text="ok")
+
+    client = make_client(handler, max_connections_per_host=2)
+    await asyncio.gather(*(client.get(f"https://example.com/{i}") for i in range(8)))
+    await client.aclose()
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_page_cache_hit_skips_fetch(tmp_path):
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(
+            200, text=PAGE.format(body="cached text " * 20), headers={"ETag": '"v1"'}
+        )
+
+    cache = PageCache(str(tmp_path / "pages.sqlite"))
+    url = "https://example.com/article#section"
+    for _ in range(2):
+        scraper = Scraper(
+            [url], "test-agent", "bs", WorkerPool(2),
+            http_client=make_client(handler), page_cache=cache,
+        )
+        results = await scraper.run()
+        assert "cached text" in results[0]["raw_content"]
+
+    assert len(requests_seen) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "revalidations": 0}
+
+
+@pytest.mark.asyncio
+async def test_stale_page_is_revalidated(tmp_path):
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, text=PAGE.format(body="fresh text " * 20), headers={"ETag": '"v1"'}
+        )
+
+    cache = PageCache(str(tmp_path / "pages.sqlite"), ttl=0)
+    url = "https://example.com/article"
+    for _ in range(2):
+        scraper = Scraper(
+            [url], "test-agent", "bs", WorkerPool(2),
+            http_client=make_client(handler), page_cache=cache,
+        )
+        results = await scraper.run()
+        assert "fresh text" in results[0]["raw_content"]
+
+    assert len(requests_seen) == 2
+    assert requests_seen[1].headers["If-None-Match"] == '"v1"'
+    assert cache.stats() == {"hits": 0, "misses": 1, "revalidations": 1}
+
+
+def test_page_cache_evicts_least_recently_used(tmp_path):
+    cache = PageCache(str(tmp_path / "pages.sqlite"), max_size=400)
+    text = "".join(chr(0x4E00 + i) for i in range(100))  # poorly compressible
+    cache.put("https://a.example.com/", text, [], "a")
+    cache.put("https://b.example.com/", text, [], "b")
+    cache.get("https://a.example.com/")
+    cache.put("https://c.example.com/", text, [], "c")
+
+    assert cache.get("https://a.example.com/") is not None
+    assert cache.get("https://b.example.com/") is None
+    assert cache.get("https://c.example.com/") is not None
+
+    # Refreshing a page replaces its size, and the size is read back when the cache is reopened
+    size = cache._size
+    cache.put("https://c.example.com/", text, [], "c")
+    assert cache._size == size <= 400
+    assert PageCache(str(tmp_path / "pages.sqlite"), max_size=400)._size == size
+
+
+def test_interleave_urls_by_domain():
+    urls = [
+        "https://a.com/1", "https://a.com/2", "https://www.a.com/3",
+        "https://b.com/1", "https://c.com/1", "https://b.com/2",
+    ]
+    assert DomainScheduler.interleave(urls) == [
+        "https://a.com/1", "https://b.com/1", "https://c.com/1",
+        "https://a.com/2", "https://b.com/2", "https://www.a.com/3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_caps_requests_per_domain():
+    in_flight = {}
+    peak = {}
+
+    async def handler(request):
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.02)
+        in_flight[host] -= 1
+        return httpx.Response(200, text=PAGE.format(body="text " * 50))
+
+    urls = [f"https://busy.example.com/{i}" for i in range(8)]
+    urls += [f"https://quiet-{i}.example.com/" for i in range(4)]
+    scraper = Scraper(
+        urls, "test-agent", "bs", WorkerPool(2),
+        http_client=make_client(handler),
+        scheduler=DomainScheduler(max_per_domain=2, rate=0),
+    )
+
+    results = await scraper.run()
+
+    assert [r["url"] for r in results] == urls
+    assert peak["busy.example.com"] == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, text=PAGE.format(body="text " * 50))
+
+    scraper = Scraper(
+        ["https://example.com/"], "test-agent", "bs", WorkerPool(2),
+        http_client=make_client(handler), scheduler=DomainScheduler(rate=0),
+    )
+
+    results = await scraper.run()
+
+    assert len(attempts) == 2
+    assert len(results) == 1
+
+
+def test_long_retry_after_abandons_request():
+    scheduler = DomainScheduler(max_retry_after=5)
+    assert scheduler.backoff("https://example.com/", "3") == 3
+    assert scheduler.backoff("https://example.com/", "3600") is None
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_pages_as_they_complete():
+    async def handler(request):
+        if request.url.host == "slow.example.com":
+            await asyncio.sleep(5)
+        return httpx.Response(200, text=PAGE.format(body=f"{request.url.host} " * 20))
+
+    urls = ["https://slow.example.com/", "https://fast.example.com/"]
+    scraper = Scraper(urls, "test-agent", "bs", WorkerPool(2), http_client=make_client(handler))
+
+    pages = scraper.stream()
+    first = await asyncio.wait_for(pages.__anext__(), timeout=1)
+    await pages.aclose()
+
+    assert first["url"] == "https://fast.example.com/"
+
+
+@pytest.mark.asyncio
+async def test_parse_in_process_pool():
+    def handler(request):
+        return httpx.Response(200, text=PAGE.format(body="parsed in a process " * 10))
+
+    scraper = Scraper(
+        ["https://example.com/"], "test-agent", "bs", WorkerPool(2, parse_processes=1),
+        http_client=make_client(handler),
+    )
+
+    results = await scraper.run()
+
+    assert results[0]["title"] == "Rural revitalization"
+    assert "parsed in a process" in results[0]["raw_content"]
+
+
+@pytest.mark.parametrize("page", ["news-article.html", "blog-post.html"])
+def test_lxml_scraper_matches_bs(page):
+    with open(os.path.join(CORPUS, page), "rb") as f:
+        html = f.read()
+    url = "https://example.com/articles/page.html"
+
+    assert LxmlScraper.parse(html, url) == BeautifulSoupScraper.parse(html, url)
+
+
+def test_lxml_scraper_selects_main_content():
+    with open(os.path.join(CORPUS, "docs-page.html"), "rb") as f:
+        content, image_urls, title = LxmlScraper.parse(f.read(), "https://example.com/docs/pooling")
+
+    assert title == "Connection pooling \u2014 Client Guide"
+    assert content.startswith("Connection pooling\nEvery client keeps a pool")
+    assert "Quickstart" not in content
+    assert "Advanced usage" not in content
+    assert image_urls == [{"url": "https://example.com/docs/diagrams/pool.png", "score": 4}]
+
+
+def test_lxml_scraper_ignores_unknown_charset():
+    page = PAGE.format(body="Caf\u00e9 text").replace("<head>", '<head><meta charset="utf-8">')
+    html = page.encode("utf-8")
+
+    content, _, title = LxmlScraper.parse(html, "https://example.com/", "no-such-charset")
+
+    assert title == "Rural revitalization"
+    assert "Caf\u00e9 text" in content
+
+
+@pytest.mark.asyncio
+async def test_lxml_scraper_uses_async_client():
+    def handler(request):
+        return httpx.Response(200, text=PAGE.format(body="lxml text " * 20))
+
+    scraper = Scraper(
+        ["https://example.com/"], "test-agent", "lxml", WorkerPool(2),
+        http_client=make_client(handler),
+    )
+
+    results = await scraper.run()
+
+    assert results[0]["title"] == "Rural revitalization"
+    assert "lxml text" in results[0]["raw_content"]
+    assert "Home | About" not in results[0]["raw_content"]
+
+
+@pytest.mark.asyncio
+async def test_web_base_loader_fetches_once():
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, text=PAGE.format(body="loader text " * 20))
+
+    scraper = Scraper(
+        ["https://example.com/"], "test-agent", "web_base_loader", WorkerPool(2),
+        http_client=make_client(handler),
+    )
+
+    results = await scraper.run()
+
+    assert len(requests_seen) == 1
+    assert results[0]["title"] == "Rural revitalization"
+    assert "loader text" in results[0]["raw_content"]
+    assert results[0]["image_urls"][0]["url"] == "https://example.com/hero.jpg"
+
+
+def test_sniff_mime():
+    assert sniff_mime(b"%PDF-1.7\n...", "text/html") == PDF
+    assert sniff_mime(b"\x89PNG\r\n\x1a\n", "text/html") == BINARY
+    assert sniff_mime(b"\n  <!DOCTYPE html><html>", "application/octet-stream") == HTML
+    assert sniff_mime(b"plain words", "text/plain; charset=utf-8") == TEXT
+    assert sniff_mime(b"plain words", "application/zip") == BINARY
+
+
+@pytest.mark.asyncio
+async def test_download_aborts_oversized_and_binary_bodies():
+    chunks_sent = 0
+
+    async def body(chunk):
+        nonlocal chunks_sent
+        for _ in range(100):
+            chunks_sent += 1
+            yield chunk
+
+    def handler(request):
+        if request.url.path == "/huge":
+            return httpx.Response(200, content=body(b"<p>text</p>" * 100))
+        return httpx.Response(200, content=body(b"\x89PNG\r\n\x1a\n" + b"\x00" * 2000))
+
+    client = make_client(handler)
+
+    with pytest.raises(DownloadAborted):
+        await download(client, "https://example.com/huge", max_bytes=10_000)
+    assert chunks_sent < 100
+
+    chunks_sent = 0
+    with pytest.raises(DownloadAborted):
+        await download(client, "https://example.com/image")
+    assert chunks_sent == 1
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pdf_is_routed_by_content():
+    document = pymupdf.open()
+    document.new_page().insert_text((72, 72), "Crop rotation report " * 3)
+    document.new_page().insert_text((72, 72), "Second page")
+    pdf = document.tobytes()
+
+    def handler(request):
+        return httpx.Response(200, content=pdf, headers={"Content-Type": "text/html"})
+
+    scraper = Scraper(
+        ["https://example.com/download?id=1"], "test-agent", "bs", WorkerPool(2),
+        http_client=make_client(handler),
+    )
+
+    content, _, _, _ = await scraper.fetch_and_parse(
+        "https://example.com/download?id=1", BeautifulSoupScraper
+    )
+
+    assert content.startswith("Crop rotation report")
+
+
+def test_pdf_extraction_stops_at_budget():
+    document = pymupdf.open()
+    for number in range(1, 6):
+        document.new_page().insert_text((72, 72), f"Page {number} " + "words " * 20)
+    document.set_metadata({"title": "Crop rotation"})
+    pdf = document.tobytes()
+
+    content, _, title = PyMuPDFScraper.parse(pdf, "https://example.com/a.pdf", max_pages=3)
+    assert title == "Crop rotation"
+    assert "Page 3" in content and "Page 4" not in content
+
+    content, _, _ = PyMuPDFScraper.parse(pdf, "https://example.com/a.pdf", max_chars=150)
+    assert len(content) == 150
+    assert "Page 2" in content and "Page 3" not in content
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("driver crashed")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.mark.asyncio
+async def test_driver_pool_reuses_and_recycles_drivers():
+    pool = DriverPool(size=2, max_pages=2)
+    started = []
+
+    def create_driver():
+        started.append(FakeDriver())
+        return started[-1]
+
+    for _ in range(3):
+        async with pool.driver(create_driver):
+            pass
+    # Two pages on the first driver, then it was recycled
+    assert len(started) == 2
+    assert started[0].quit_called and not started[1].quit_called
+
+    started[1].alive = False
+    async with pool.driver(create_driver) as driver:
+        assert driver is started[2]
+    assert started[1].quit_called
+
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_driver_pool_caps_concurrent_drivers():
+    pool = DriverPool(size=2)
+    in_use = 0
+    peak = 0
+
+    async def scrape():
+        nonlocal in_use, peak
+        async with pool.driver(FakeDriver):
+            in_use += 1
+            peak = max(peak, in_use)
+            await asyncio.sleep(0.01)
+            in_use -= 1
+
+    await asyncio.gather(*(scrape() for _ in range(6)))
+
+    assert peak == 2
+    assert len(pool._idle) == 2
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_driver_pool_keeps_driver_of_cancelled_scrape_until_thread_ends():
+    pool = DriverPool(size=1)
+    started = threading.Event()
+    finish = threading.Event()
+
+    def scrape(driver):
+        started.set()
+        finish.wait(5)
+        return driver
+
+    task = asyncio.create_task(pool.run(FakeDriver, scrape))
+    await asyncio.to_thread(started.wait, 5)
+    task.cancel()
+    await asyncio.sleep(0.05)
+    # The thread still uses the driver, so it is neither quit nor handed out again
+    assert not task.done()
+    assert len(pool._busy) == 1 and pool._semaphore.locked()
+
+    finish.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    (driver,) = pool._idle
+    assert not driver.driver.quit_called
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_browser_scrape_errors_are_not_returned_as_content():
+    # Bypasses __init__, which imports Selenium
+    scraper = BrowserScraper.__new__(BrowserScraper)
+    scraper.url = "https://a.example.com/"
+    scraper.driver = None
+    scraper.driver_pool = DriverPool(size=1)
+    scraper._create_pooled_driver = FakeDriver
+
+    def crash(driver):
+        raise RuntimeError("tab crashed")
+
+    scraper._scrape_with_pooled_driver = crash
+
+    with pytest.raises(RuntimeError):
+        await scraper.scrape_async()
+    scraper.driver_pool.close()
+
+
+def test_driver_pool_is_per_event_loop():
+    async def scrape():
+        pool = get_driver_pool(size=2, max_pages=10)
+        async with pool.driver(FakeDriver):
+            pass
+        return pool
+
+    first = asyncio.run(scrape())
+    second = asyncio.run(scrape())
+
+    assert second is not first
+    # The drivers of a closed loop's pool are quit when the next loop takes a pool
+    assert first._idle == [] and len(second._idle) == 1
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_scraper_passes_browser_settings_per_instance():
+    scraper = Scraper([], "test-agent", "nodriver", WorkerPool(1), nodriver_adaptive_scroll=False)
+    other = Scraper([], "test-agent", "nodriver", WorkerPool(1))
+
+    assert scraper._new_scraper(NoDriverScraper, "https://a.example.com/", None).adaptive_scroll is False
+    assert other._new_scraper(NoDriverScraper, "https://a.example.com/", None).adaptive_scroll is True
+
+
+class FakeTab:
+    def __init__(self, heights):
+        self.heights = heights
+        self.scrolls = 0
+        self.urls = []
+        self.closed = False
+        self.fail_on = None
+
+    async def get(self, url):
+        self.urls.append(url)
+        if url == self.fail_on:
+            raise RuntimeError("navigation failed")
+
+    async def evaluate(self, expression):
+        if expression == DOM_IDLE_JS:
+            return 1000
+        if expression.startswith("window.scrollTo"):
+            self.scrolls += 1
+            return None
+        return self.heights[min(self.scrolls, len(self.heights) - 1)]
+
+    async def bring_to_front(self):
+        pass
+
+    async def sleep(self, seconds):
+        await asyncio.sleep(seconds)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeZendriver:
+    def __init__(self):
+        self.opened = []
+
+    async def get(self, url, new_tab=False, new_window=False):
+        tab = FakeTab([1000])
+        await tab.get(url)
+        self.opened.append(tab)
+        return tab
+
+
+@pytest.mark.asyncio
+async def test_nodriver_scrolls_until_page_stops_growing():
+    browser = NoDriverScraper.Browser(FakeZendriver())
+    tab = FakeTab([1000, 2000, 3000, 3000])
+
+    await asyncio.wait_for(browser.scroll_page_to_bottom(tab), timeout=1)
+
+    assert tab.scrolls == 3
+
+
+@pytest.mark.asyncio
+async def test_nodriver_reuses_tabs():
+    driver = FakeZendriver()
+    browser = NoDriverScraper.Browser(driver)
+
+    first = await browser.get("https://a.example.com/")
+    await browser.close_page(first)
+    second = await browser.get("https://b.example.com/")
+
+    assert second is first
+    assert len(driver.opened) == 1
+    assert first.urls == ["https://a.example.com/", "about:blank", "https://b.example.com/"]
+
+
+@pytest.mark.asyncio
+async def test_nodriver_closes_reused_tab_when_navigation_fails():
+    browser = NoDriverScraper.Browser(FakeZendriver())
+    tab = await browser.get("https://a.example.com/")
+    await browser.close_page(tab)
+    tab.fail_on = "https://b.example.com/"
+
+    with pytest.raises(RuntimeError):
+        await browser.get("https://b.example.com/")
+
+    assert tab.closed
+    assert browser.idle_tabs == []
+    assert browser.processing_count == 0
+
+
+class FakeBrowserScraper:
+    scraped = []
+
+    def __init__(self, link, session=None):
+        self.link = link
+
+    async def scrape_async(self):
+        FakeBrowserScraper.scraped.append(self.link)
+        return f"Rendered {self.link} " * 20, [], "Rendered"
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    FakeBrowserScraper.scraped = []
+    monkeypatch.setitem(scraper_module.SCRAPER_CLASSES, "fake_browser", FakeBrowserScraper)
+    return FakeBrowserScraper
+
+
+@pytest.mark.asyncio
+async def test_tiered_scraping_escalates_and_remembers_domain(fake_browser):
+    fetched = []
+
+    def handler(request):
+        fetched.append(str(request.url))
+        if request.url.host == "spa.example.com":
+            return httpx.Response(200, text=PAGE.format(body="Loading..."))
+        return httpx.Response(200, text=PAGE.format(body="static text " * 20))
+
+    scheduler = DomainScheduler(rate=0)
+    client = make_client(handler)
+    for urls in (["https://spa.example.com/1", "https://static.example.com/"], ["https://spa.example.com/2"]):
+        scraper = Scraper(
+            urls, "test-agent", "bs", WorkerPool(2), http_client=client,
+            scheduler=scheduler, fallback_scraper="fake_browser",
+        )
+        results = await scraper.run()
+        assert all(r["raw_content"] for r in results)
+
+    assert fake_browser.scraped == ["https://spa.example.com/1", "https://spa.example.com/2"]
+    assert "https://spa.example.com/2" not in fetched
+
+
+@pytest.mark.asyncio
+async def test_tiered_scraping_hedges_slow_pages(fake_browser):
+    async def handler(request):
+        await asyncio.sleep(5)
+        return httpx.Response(200, text=PAGE.format(body="late text " * 20))
+
+    scraper = Scraper(
+        ["https://slow.example.com/"], "test-agent", "bs", WorkerPool(2),
+        http_client=make_client(handler, timeout=10),
+        fallback_scraper="fake_browser", hedge_delay=0.05,
+    )
+
+    results = await asyncio.wait_for(scraper.run(), timeout=2)
+
+    assert results[0]["title"] == "Rendered"
+
+
+@pytest.mark.asyncio
+async def test_tiered_scraping_does_not_escalate_aborted_downloads(fake_browser):
+    def handler(request):
+        if request.url.path == "/missing":
+            return httpx.Response(404, text=PAGE.format(body="Not found"))
+        return httpx.Response(200, content=b"\x00\x01" * 1024)
+
+    scraper = Scraper(
+        ["https://a.example.com/missing", "https://a.example.com/archive"], "test-agent", "bs",
+        WorkerPool(2), http_client=make_client(handler), fallback_scraper="fake_browser",
+    )
+
+    assert await scraper.run() == []
+    assert fake_browser.scraped == []
+
+
+def test_failure_tracker_opens_and_half_opens_circuit(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(failures_module.time, "monotonic", lambda: now)
+    tracker = FailureTracker(error_budget=2, cooldown=60, failed_url_ttl=600)
+
+    tracker.record_failure("https://dead.example.com/1")
+    assert not tracker.allow("https://dead.example.com/1")  # negative cache
+    assert tracker.allow("https://dead.example.com/2")
+
+    tracker.record_failure("https://www.dead.example.com/2")
+    assert tracker.filter(["https://dead.example.com/3", "https://ok.example.com/"]) == [
+        "https://ok.example.com/"
+    ]
+
+    now += 61
+    # Half-open: a single trial is let through
+    assert tracker.filter(["https://dead.example.com/3", "https://dead.example.com/4"]) == [
+        "https://dead.example.com/3"
+    ]
+    tracker.record_success("https://dead.example.com/3")
+    assert tracker.allow("https://dead.example.com/4")
+
+    now += 600
+    assert tracker.allow("https://dead.example.com/1")
+
+
+def test_failure_tracker_is_bounded(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(failures_module.time, "monotonic", lambda: now)
+    tracker = FailureTracker(error_budget=5, failed_url_ttl=60, max_entries=3)
+
+    for i in range(5):
+        tracker.record_failure(f"https://host-{i}.example.com/")
+    assert list(tracker._circuits) == ["host-2.example.com", "host-3.example.com", "host-4.example.com"]
+    assert len(tracker._failed_urls) == 3
+
+    tracker.record_success("https://host-3.example.com/")
+    assert "host-3.example.com" not in tracker._circuits
+
+    now += 61
+    tracker.record_failure("https://other.example.com/", host_failure=False)
+    assert list(tracker._failed_urls) == ["https://other.example.com/"]
+
+
+@pytest.mark.asyncio
+async def test_scraper_reports_failures():
+    def handler(request):
+        if request.url.host == "broken.example.com":
+            return httpx.Response(500)
+        return httpx.Response(200, text=PAGE.format(body="text " * 50))
+
+    tracker = FailureTracker(error_budget=2)
+    urls = ["https://broken.example.com/1", "https://broken.example.com/2", "https://ok.example.com/"]
+    scraper = Scraper(
+        urls, "test-agent", "bs", WorkerPool(2), http_client=make_client(handler),
+        failure_tracker=tracker,
+    )
+
+    results = await scraper.run()
+
+    assert [r["url"] for r in results] == ["https://ok.example.com/"]
+    assert tracker.filter(["https://broken.example.com/3", "https://ok.example.com/2"]) == [
+        "https://ok.example.com/2"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_missing_pages_do_not_open_circuit():
+    def handler(request):
+        if request.url.path.startswith("/gone"):
+            return httpx.Response(404)
+        return httpx.Response(200, text=PAGE.format(body="short"))
+
+    tracker = FailureTracker(error_budget=2)
+    urls = [
+        "https://site.example.com/gone/1",
+        "https://site.example.com/gone/2",
+        "https://site.example.com/thin",
+    ]
+    scraper = Scraper(
+        urls, "test-agent", "bs", WorkerPool(2), http_client=make_client(handler),
+        failure_tracker=tracker,
+    )
+
+    assert await scraper.run() == []
+    # The failed URLs are negative-cached, but the host answered so it is not skipped
+    assert tracker.filter(urls + ["https://site.example.com/other"]) == ["https://site.example.com/other"]
+
+
+def test_adaptive_limiter_grows_and_backs_off():
+    limiter = AdaptiveLimiter(2, max_limit=16, window=4)
+
+    for _ in range(8):
+        limiter.record(0.1, False)
+    assert limiter.stats()["limit"] == 8  # slow start doubles per healthy window
+
+    for _ in range(4):
+        limiter.record(0.1, True)
+    assert limiter.stats()["limit"] == 4
+
+    for _ in range(4):
+        limiter.record(0.1, False)
+    assert limiter.stats()["limit"] == 5  # additive increase after the first backoff
+
+    for _ in range(4):
+        limiter.record(1.0, False)  # p95 ten times the best seen
+    assert limiter.stats()["limit"] == 2
+
+
+@pytest.mark.asyncio
+async def test_adaptive_pool_limits_downloads():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, text=PAGE.format(body="text " * 50))
+
+    pool = WorkerPool(2, adaptive=True, max_concurrency=4)
+    # Latency backoff is covered above; timing noise of the test must not trigger it
+    pool.limiter.latency_tolerance = 100
+    urls = [f"https://host-{i}.example.com/" for i in range(40)]
+    scraper = Scraper(urls, "test-agent", "bs", pool, http_client=make_client(handler))
+
+    results = await scraper.run()
+
+    assert len(results) == 40
+    assert 2 < peak <= 4
+    assert pool.stats()["limit"] == 4
+    assert pool.stats()["in_flight"] == 0 and pool.stats()["queued"] == 0
+
+
+class SleepyScraper:
+    """Blocking scraper without a parse step, run in the worker pool's threads."""
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def __init__(self, link, session=None):
+        self.link = link
+
+    def scrape(self):
+        with SleepyScraper.lock:
+            SleepyScraper.in_flight += 1
+            SleepyScraper.peak = max(SleepyScraper.peak, SleepyScraper.in_flight)
+        time.sleep(0.01)
+        with SleepyScraper.lock:
+            SleepyScraper.in_flight -= 1
+        return "text " * 50, [], "Sleepy"
+
+
+@pytest.mark.asyncio
+async def test_adaptive_pool_runs_sync_scrapers_above_max_workers(monkeypatch):
+    monkeypatch.setitem(scraper_module.SCRAPER_CLASSES, "sleepy", SleepyScraper)
+    SleepyScraper.peak = 0
+    pool = WorkerPool(2, adaptive=True, max_concurrency=8)
+    pool.limiter.latency_tolerance = 100
+    urls = [f"https://host-{i}.example.com/" for i in range(80)]
+    scraper = Scraper(urls, "test-agent", "sleepy", pool, scheduler=DomainScheduler(rate=0))
+
+    results = await scraper.run()
+
+    assert len(results) == 80
+    assert pool.stats()["limit"] == 8
+    assert SleepyScraper.peak > 2
+
+
+@pytest.mark.asyncio
+async def test_tavily_extract_batches_links(monkeypatch):
+    monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+    monkeypatch.setattr(scraper_module.TavilyExtract, "max_batch_size", 3)
+    batches = []
+
+    def handler(request):
+        assert request.url.host == "api.tavily.com", "pages must not be fetched again"
+        assert request.headers["Authorization"] == "Bearer test-key"
+        urls = json.loads(request.content)["urls"]
+        batches.append(urls)
+        results = [
+            {"url": url, "raw_content": f"# Page {url}\n" + "text " * 50, "images": [url + ".png"]}
+            for url in urls if "missing" not in url
+        ]
+        return httpx.Response(200, json={"results": results, "failed_results": []})
+
+    urls = [f"https://example.com/{i}" for i in range(4)] + ["https://example.com/missing"]
+    scraper = Scraper(urls, "test-agent", "tavily_extract", WorkerPool(4), http_client=make_client(handler))
+
+    results = await scraper.run()
+
+    assert sorted(len(batch) for batch in batches) == [2, 3]
+    assert [r["url"] for r in results] == urls[:4]
+    assert results[0]["title"] == "Page https://example.com/0"
+    assert results[0]["image_urls"] == [{"url": "https://example.com/0.png", "score": 0}]
+
+
+@pytest.mark.asyncio
+async def test_firecrawl_batch_scrape_job(monkeypatch):
+    monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+    monkeypatch.setenv("FIRECRAWL_SERVER_URL", "http://firecrawl.test")
+    monkeypatch.setattr(scraper_module.FireCrawl, "poll_interval", 0)
+    calls = []
+
+    def document(url):
+        return {
+            "markdown": "text " * 50,
+            "html": PAGE.format(body="text"),
+            "metadata": {"sourceURL": url, "title": f"Title {url}", "statusCode": 200},
+        }
+
+    def handler(request):
+        assert request.url.host == "firecrawl.test", "pages must not be fetched again"
+        calls.append(f"{request.method} {request.url.path}")
+        if request.method == "POST":
+            assert json.loads(request.content)["urls"] == urls
+            return httpx.Response(200, json={"success": True, "id": "job-1"})
+        if request.url.path == "/v1/batch/scrape/job-1" and len(calls) == 2:
+            return httpx.Response(200, json={"status": "scraping"})
+        if request.url.path == "/v1/batch/scrape/job-1":
+            return httpx.Response(200, json={
+                "status": "completed",
+                "data": [document(urls[0])],
+                "next": "http://firecrawl.test/v1/batch/scrape/job-1/page-2",
+            })
+        return httpx.Response(200, json={"status": "completed", "data": [document(urls[1])]})
+
+    urls = ["https://example.com/a", "https://example.org/b"]
+    scraper = Scraper(urls, "test-agent", "firecrawl", WorkerPool(4), http_client=make_client(handler))
+
+    results = await scraper.run()
+
+    assert calls[0] == "POST /v1/batch/scrape"
+    assert len(calls) == 4
+    assert [r["title"] for r in results] == ["Title https://example.com/a", "Title https://example.org/b"]
+    assert results[1]["image_urls"][0]["url"] == "https://example.org/hero.jpg"
+
+
+def test_page_cache_is_shared_per_file(tmp_path):
+    path = str(tmp_path / "pages.sqlite")
+
+    assert get_page_cache(path) is get_page_cache(path)
+    # Other settings reuse the connection of the file
+    assert get_page_cache(path, ttl=0) is get_page_cache(path)
+    assert get_page_cache(path, ttl=0).ttl == 0
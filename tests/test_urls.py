@@ -0,0 +1,59 @@
+from gpt_researcher.utils.urls import BloomFilter, VisitedURLs, canonicalize_url
+
+
+def test_variants_share_a_canonical_form():
+    canonical = "https://example.com/news/story?id=7&page=2"
+    variants = [
+        "http://www.Example.com/news/story/?page=2&id=7#comments",
+        "https://example.com/news/story?id=7&page=2&utm_source=feed&utm_medium=rss&fbclid=abc",
+        "https://m.example.com/news/story?page=2&id=7",
+        "https://example.com:443/news/story/amp/?id=7&page=2",
+        "https://example.com/news/story?id=7&page=2&amp=1",
+        "https://www-example-com.cdn.ampproject.org/c/s/example.com/news/story?id=7&page=2",
+        "https://www.google.com/amp/s/www.example.com/news/story?id=7&page=2",
+    ]
+
+    assert canonicalize_url(canonical) == canonical
+    assert {canonicalize_url(url) for url in variants} == {canonical}
+
+
+def test_distinct_pages_keep_distinct_forms():
+    assert canonicalize_url("https://example.com/a?id=1") != canonicalize_url("https://example.com/a?id=2")
+    assert canonicalize_url("https://example.com/A") != canonicalize_url("https://example.com/a")
+    assert canonicalize_url("https://example.com:8443/a") != canonicalize_url("https://example.com/a")
+    assert canonicalize_url("https://m.com/a") == "https://m.com/a"
+    assert canonicalize_url("mailto:someone@example.com") == "mailto:someone@example.com"
+
+
+def test_visited_urls_match_variants_and_keep_first_seen_url():
+    visited = VisitedURLs(["http://www.example.com/a/?utm_campaign=x"])
+    visited.add("https://example.com/a")
+    visited.update(["https://example.com/b"], visited)
+
+    assert "https://m.example.com/a#top" in visited
+    assert "https://example.com/c" not in visited
+    assert sorted(visited) == ["http://www.example.com/a/?utm_campaign=x", "https://example.com/b"]
+
+    visited.discard("https://example.com/a")
+    assert "http://www.example.com/a/" not in visited
+    assert len(visited) == 1
+
+
+def test_visited_urls_grow_past_bloom_capacity():
+    visited = VisitedURLs(capacity=16)
+    urls = [f"https://example.com/page/{i}" for i in range(100)]
+    visited.update(urls)
+
+    assert len(visited) == 100
+    assert all(url + "/" in visited for url in urls)
+    assert "https://example.com/page/100" not in visited
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"key-{i}")
+
+    assert all(f"key-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300